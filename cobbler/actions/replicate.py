@@ -14,10 +14,13 @@ import xmlrpc.client
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from cobbler import utils
+from cobbler.items.abstract.inheritable_item import InheritableItem
 from cobbler.utils import filesystem_helpers
 
 if TYPE_CHECKING:
     from cobbler.api import CobblerAPI
+    from cobbler.items.abstract.base_item import BaseItem
+    from cobbler.remote import TransactionTuple
 
 
 OBJ_TYPES = [
@@ -28,12 +31,18 @@ OBJ_TYPES = [
     "image",
 ]
 
+INCLUDE_MAP_FIELDS = ["uid", "name", "profile", "parent", "distro", "repos", "image"]
+"""The fields of the remote objects that are needed to decide which objects are replicated."""
+
 
 class Replicate:
     """
     This class contains the magic to replicate a Cobbler instance to another Cobbler instance.
     """
 
+    fetch_batch_size = 500
+    """The number of objects that are fetched from the master with a single call."""
+
     def __init__(self, api: "CobblerAPI") -> None:
         """
         Constructor
@@ -48,6 +57,9 @@ class Replicate:
         self.master = ""
         self.local_data: Dict[Any, Any] = {}
         self.remote_data: Dict[Any, Any] = {}
+        self.local_hashes: Dict[str, Dict[str, str]] = {}
+        self.remote_hashes: Dict[str, Optional[Dict[str, str]]] = {}
+        self.remote_objects: Dict[str, Dict[str, Dict[str, Any]]] = {}
         self.remote_settings: Dict[str, Any] = {}
         self.remote_names: Dict[Any, Any] = {}
         self.remote_dict: Dict[str, Dict[str, Any]] = {}
@@ -97,84 +109,177 @@ class Replicate:
 
     # -------------------------------------------------------
 
-    def remove_objects_not_on_master(self, obj_type: str) -> None:
+    def fetch_item_hashes(self, obj_type: str) -> None:
         """
-        Remove objects on this slave which are not on the master.
+        Compare the content of a collection on this slave with the master. Only if the digests of the whole collection
+        differ the hashes of the single items are transferred.
 
         :param obj_type: The type of object which should be synchronized.
         """
-        local_objects = utils.lod_to_dod(self.local_data[obj_type], "uid")
-        remote_objects = utils.lod_to_dod(self.remote_data[obj_type], "uid")
+        if self.remote is None:
+            raise ValueError("Remote server unavailable!")
+        local_digest, self.local_hashes[obj_type] = self.api.get_item_hashes(obj_type)
+        remote_summary = self.remote.get_item_hashes(obj_type, local_digest)
+        if not isinstance(remote_summary, dict):
+            raise TypeError("Remote server passed unexpected data for item hashes")
+        if remote_summary["digest"] == local_digest:
+            self.logger.info("%s collection is identical on master", obj_type)
+            self.remote_hashes[obj_type] = None
+        else:
+            self.remote_hashes[obj_type] = remote_summary["hashes"]
+
+    def fetch_all_items(self, obj_type: str) -> None:
+        """
+        Fallback for masters which can't compare the content of the collections. All objects are transferred and
+        compared by their mtime, as older versions of Cobbler did.
 
-        for luid, ldata in local_objects.items():
-            if luid not in remote_objects:
-                try:
-                    self.logger.info("removing %s %s", obj_type, ldata["name"])
-                    self.api.remove_item(obj_type, ldata["name"], recursive=True)
-                except Exception:
-                    utils.log_exc()
+        :param obj_type: The type of object which should be synchronized.
+        """
+        if self.remote is None:
+            raise ValueError("Remote server unavailable!")
+        remote_data = self.remote.get_items(obj_type)
+        if not isinstance(remote_data, list):
+            raise TypeError("Remote server passed unexpected data for items")
+        self.remote_data[obj_type] = remote_data
+        self.remote_objects[obj_type] = utils.lod_to_dod(remote_data, "uid")
+        self.local_hashes[obj_type] = {
+            uid: str(obj.mtime)
+            for uid, obj in self.api.get_items(obj_type).listing.items()
+        }
+        self.remote_hashes[obj_type] = {
+            uid: str(rdata["mtime"])
+            for uid, rdata in self.remote_objects[obj_type].items()
+        }
+
+    def fetch_items(self, obj_type: str) -> None:
+        """
+        Fetch what is needed to compare a collection on this slave with the master.
+
+        :param obj_type: The type of object which should be synchronized.
+        """
+        if self.remote is None:
+            raise ValueError("Remote server unavailable!")
+        try:
+            # The empty page arguments request all objects, only their references are transferred
+            self.remote_data[obj_type] = self.remote.get_items(
+                obj_type, "", "", INCLUDE_MAP_FIELDS
+            )
+            self.fetch_item_hashes(obj_type)
+        except xmlrpc.client.Fault as error:
+            self.logger.warning(
+                "Master can't compare %s objects by content (%s), transferring all of them",
+                obj_type,
+                error.faultString,
+            )
+            self.fetch_all_items(obj_type)
 
     # -------------------------------------------------------
 
-    def add_objects_not_on_local(self, obj_type: str) -> None:
+    def remove_objects_not_on_master(self, obj_type: str) -> List["TransactionTuple"]:
         """
-        Add objects locally which are not present on the slave but on the master.
+        Collect the objects on this slave which are not on the master. Objects that depend on them are removed as
+        well.
 
-        :param obj_type:
+        :param obj_type: The type of object which should be synchronized.
+        :return: The removals for the replication transaction.
         """
-        local_objects = utils.lod_to_dod(self.local_data[obj_type], "uid")
-        remote_objects = utils.lod_sort_by_key(self.remote_data[obj_type], "depth")
+        # cobbler.remote imports cobbler.api, which imports this module
+        from cobbler.remote import TransactionTuple
 
-        for rdata in remote_objects:
+        remote_hashes = self.remote_hashes[obj_type]
+        if remote_hashes is None:
+            return []
 
-            # do not add the system if it is not on the transfer list
-            if not rdata["name"] in self.must_include[obj_type]:
+        removals: List["TransactionTuple"] = []
+        for luid in self.local_hashes[obj_type]:
+            if luid in remote_hashes:
                 continue
-
-            if not rdata["uid"] in local_objects:
-                creator = getattr(self.api, f"new_{obj_type}")
-                newobj = creator(utils.revert_strip_none(rdata))
-                try:
-                    self.logger.info("adding %s %s", obj_type, rdata["name"])
-                    if not self.api.add_item(obj_type, newobj):
-                        self.logger.error(
-                            "failed to add %s %s", obj_type, rdata["name"]
-                        )
-                except Exception:
-                    utils.log_exc()
+            lobj = self.api.get_items(obj_type).listing.get(luid)
+            if lobj is None:
+                continue
+            self.logger.info("removing %s %s", obj_type, lobj.name)
+            dependants: List["BaseItem"] = [lobj]
+            if isinstance(lobj, InheritableItem):
+                dependants.extend(lobj.descendants)
+            for obj in dependants:
+                removals.append(
+                    TransactionTuple(
+                        obj.COLLECTION_TYPE, obj, True, obj.mtime, obj.uid, []  # type: ignore
+                    )
+                )
+        return removals
 
     # -------------------------------------------------------
 
-    def replace_objects_newer_on_remote(self, obj_type: str) -> None:
+    def update_objects_differing_on_remote(
+        self, obj_type: str
+    ) -> List["TransactionTuple"]:
         """
-        Replace objects which are newer on the local slave then on the remote slave
+        Fetch the objects which are missing on this slave or whose content differs from the master. Only these objects
+        are transferred.
 
         :param obj_type: The type of object to synchronize.
+        :return: The additions and replacements for the replication transaction.
         """
-        local_objects = utils.lod_to_dod(self.local_data[obj_type], "uid")
-        remote_objects = utils.lod_to_dod(self.remote_data[obj_type], "uid")
-
-        for ruid, rdata in remote_objects.items():
-            # do not add the system if it is not on the transfer list
-            if rdata["name"] not in self.must_include[obj_type]:
-                continue
+        # cobbler.remote imports cobbler.api, which imports this module
+        from cobbler.remote import TransactionItemModifications, TransactionTuple
 
-            if ruid in local_objects:
-                ldata = local_objects[ruid]
-                if ldata["mtime"] < rdata["mtime"]:
-                    if ldata["name"] != rdata["name"]:
-                        self.logger.info("removing %s %s", obj_type, ldata["name"])
-                        self.api.remove_item(obj_type, ldata["name"], recursive=True)
-                    creator = getattr(self.api, f"new_{obj_type}")
-                    newobj = creator(utils.revert_strip_none(rdata))
-                    try:
-                        self.logger.info("updating %s %s", obj_type, rdata["name"])
-                        if not self.api.add_item(obj_type, newobj):
-                            self.logger.error(
-                                "failed to update %s %s", obj_type, rdata["name"]
-                            )
-                    except Exception:
-                        utils.log_exc()
+        remote_hashes = self.remote_hashes[obj_type]
+        if remote_hashes is None:
+            return []
+        if self.remote is None:
+            raise ValueError("Remote server unavailable!")
+
+        local_hashes = self.local_hashes[obj_type]
+        remote_names = {x["uid"]: x["name"] for x in self.remote_data[obj_type]}
+        uids = [
+            ruid
+            for ruid, content_hash in remote_hashes.items()
+            # do not add the object if it is not on the transfer list
+            if remote_names.get(ruid) in self.must_include[obj_type]
+            and local_hashes.get(ruid) != content_hash
+        ]
+
+        collection = self.api.get_items(obj_type)
+        creator = getattr(self.api, f"new_{obj_type}")
+        updates: List["TransactionTuple"] = []
+        for offset in range(0, len(uids), self.fetch_batch_size):
+            if obj_type in self.remote_objects:
+                remote_objects = [
+                    self.remote_objects[obj_type][ruid]
+                    for ruid in uids[offset : offset + self.fetch_batch_size]
+                ]
+            else:
+                remote_objects = self.remote.get_items_by_uid(
+                    obj_type, uids[offset : offset + self.fetch_batch_size]
+                )
+            if not isinstance(remote_objects, list):
+                raise TypeError("Remote server passed unexpected data for items")
+            for rdata in remote_objects:
+                newobj = creator(**utils.revert_strip_none(rdata))
+                lobj = collection.listing.get(newobj.uid)
+                if lobj is None:
+                    self.logger.info("adding %s %s", obj_type, newobj.name)
+                    updates.append(
+                        TransactionTuple(obj_type, newobj, False, 0.0, "", [])
+                    )
+                    continue
+                self.logger.info("updating %s %s", obj_type, newobj.name)
+                # The replaced object is still referenced by the indexes of the collection
+                modifications: List[TransactionItemModifications] = []
+                for indx in collection.indexes:
+                    old_value = collection._get_index_property(lobj, indx)  # type: ignore  # pylint: disable=protected-access
+                    new_value = collection._get_index_property(newobj, indx)  # type: ignore  # pylint: disable=protected-access
+                    if old_value != new_value:
+                        modifications.append(
+                            TransactionItemModifications([indx], old_value, new_value)
+                        )
+                updates.append(
+                    TransactionTuple(
+                        obj_type, newobj, False, lobj.mtime, lobj.uid, modifications
+                    )
+                )
+        return updates
 
     # -------------------------------------------------------
 
@@ -196,8 +301,7 @@ class Replicate:
         self.remote_settings = remote_settings
         self.logger.info("Querying Both Servers")
         for what in OBJ_TYPES:
-            self.remote_data[what] = self.remote.get_items(what)
-            self.local_data[what] = self.local.get_items(what)
+            self.fetch_items(what)
 
         self.generate_include_map()
 
@@ -206,8 +310,15 @@ class Replicate:
             obj_types = OBJ_TYPES[:]
             if len(self.system_patterns) == 0 and "system" in obj_types:
                 obj_types.remove("system")
+            removals: List["TransactionTuple"] = []
             for what in obj_types:
-                self.remove_objects_not_on_master(what)
+                removals.extend(self.remove_objects_not_on_master(what))
+            # The removals are applied before the updates, otherwise removing an object would also remove the index
+            # entries and files of an object which was recreated under the same name on the master.
+            self.apply_changes(removals)
+            for removal in removals:
+                # Descendants which are still on the master are added again
+                self.local_hashes[removal.what].pop(removal.uid, None)
         else:
             self.logger.info("*NOT* Removing Objects Not Stored On Master")
 
@@ -269,13 +380,23 @@ class Replicate:
         else:
             self.logger.info("*NOT* Rsyncing Data")
 
-        self.logger.info("Adding Objects Not Stored On Local")
+        self.logger.info("Updating Objects Differing On Remote")
+        updates: List["TransactionTuple"] = []
         for what in OBJ_TYPES:
-            self.add_objects_not_on_local(what)
+            updates.extend(self.update_objects_differing_on_remote(what))
+        self.apply_changes(updates)
 
-        self.logger.info("Updating Objects Newer On Remote")
-        for what in OBJ_TYPES:
-            self.replace_objects_newer_on_remote(what)
+    def apply_changes(self, changes: List["TransactionTuple"]) -> None:
+        """
+        Apply the changes of the replication in a single transaction.
+
+        :param changes: The changes to apply.
+        """
+        # An object may depend on several removed objects
+        unique_changes = list({x.uid or x.ref.uid: x for x in changes}.values())
+        self.logger.info("Applying %d changes", len(unique_changes))
+        if unique_changes:
+            self.api.add_remove_items(unique_changes)
 
     def link_distros(self) -> None:
         """
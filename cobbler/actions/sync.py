@@ -8,10 +8,12 @@ This is the code behind 'cobbler sync'.
 # SPDX-FileCopyrightText: Michael DeHaan <michael.dehaan AT gmail>
 
 import glob
+import hashlib
+import json
 import logging
 import os
 import time
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
 
 from cobbler import enums, utils
 from cobbler.cexceptions import CX
@@ -31,11 +33,100 @@ if TYPE_CHECKING:
     )
 
 
+SYNC_COLLECTION_TYPES = (
+    "template",
+    "menu",
+    "distro",
+    "repo",
+    "profile",
+    "image",
+    "system",
+    "network_interface",
+    "distro_group",
+    "profile_group",
+    "system_group",
+)
+"""The collections whose items are tracked by the manifest of the incremental sync."""
+
+
+class SyncManifest:
+    """
+    Persistent record of the files an incremental sync generated. For every file its content hash and the uids of the
+    items it was generated from are kept. Files which belong to no single item (menus, bootloaders, distro files) have
+    no sources. For every item its type, name and mtime are kept to find the items that changed since the last sync.
+    """
+
+    version = 1
+
+    def __init__(self, path: str) -> None:
+        """
+        Constructor
+
+        :param path: The JSON file the manifest is stored in.
+        """
+        self.path = path
+        self.settings = ""
+        self.items: Dict[str, Dict[str, Any]] = {}
+        self.files: Dict[str, Dict[str, Any]] = {}
+
+    def load(self) -> bool:
+        """
+        Read the manifest from disk.
+
+        :return: False if there is no usable manifest. The manifest is empty in this case.
+        """
+        try:
+            with open(self.path, encoding="UTF-8") as manifest_fd:
+                data = json.load(manifest_fd)
+        except (OSError, ValueError):
+            return False
+        if not isinstance(data, dict) or data.get("version") != self.version:  # type: ignore
+            return False
+        self.settings = data["settings"]
+        self.items = data["items"]
+        self.files = data["files"]
+        return True
+
+    def save(self) -> None:
+        """
+        Atomically write the manifest to disk.
+        """
+        data = {
+            "version": self.version,
+            "settings": self.settings,
+            "items": self.items,
+            "files": self.files,
+        }
+        filesystem_helpers.mkdir(os.path.dirname(self.path))
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="UTF-8") as manifest_fd:
+            json.dump(data, manifest_fd)
+        os.replace(tmp_path, self.path)
+
+    @staticmethod
+    def hash_file(path: str) -> str:
+        """
+        Hash the content of a generated file. Symbolic links are hashed by their target.
+
+        :param path: The file to hash.
+        :return: The hash or an empty string if the file doesn't exist.
+        """
+        if os.path.islink(path):
+            return "link:" + os.readlink(path)
+        try:
+            return filesystem_helpers.sha1_file(path)
+        except OSError:
+            return ""
+
+
 class CobblerSync:
     """
     Handles conversion of internal state to the tftpboot tree layout
     """
 
+    manifest_path = "/var/lib/cobbler/sync_manifest.json"
+    """The file in which the incremental sync keeps its manifest."""
+
     def __init__(
         self,
         api: "CobblerAPI",
@@ -105,82 +196,307 @@ class CobblerSync:
         self.settings = self.api.settings()
         self.repos = self.api.repos()
 
+    def __log_blend_statistics(self, blend_statistics: Dict[str, Any]) -> None:
+        """
+        Report how much work was spent on blending items during a sync.
+
+        :param blend_statistics: The statistics collected by ``utils.blend_cache()``.
+        """
+        self.logger.info(
+            "blended %d objects in %.3f seconds (%d tree nodes served from cache)",
+            blend_statistics["blends"],
+            blend_statistics["time"],
+            blend_statistics["cached_nodes"],
+        )
+
     def run_sync_systems(self, systems: List[str]):
         """
         Syncs the specific systems with the config tree.
         """
-        self.__common_run()
+        with utils.blend_cache() as blend_statistics:
+            self.__common_run()
 
-        # Have the tftpd module handle copying bootloaders, distros, images, and all_system_files
-        self.tftpd.sync_systems(systems)
+            # Have the tftpd module handle copying bootloaders, distros, images, and all_system_files
+            self.tftpd.sync_systems(systems)
 
-        if self.settings.manage_dhcp:
-            self.write_dhcp()
-        if self.settings.manage_dns:
-            self.logger.info("rendering DNS files")
-            self.dns.regen_hosts()
-            self.dns.write_configs()
+            if self.settings.manage_dhcp:
+                self.write_dhcp()
+            if self.settings.manage_dns:
+                self.logger.info("rendering DNS files")
+                self.dns.regen_hosts()
+                self.dns.write_configs()
+
+            self.logger.info("cleaning link caches")
+            self.clean_link_cache()
 
-        self.logger.info("cleaning link caches")
-        self.clean_link_cache()
+            if self.settings.manage_rsync:
+                self.logger.info("rendering rsync files")
+                self.rsync_gen()
 
-        if self.settings.manage_rsync:
-            self.logger.info("rendering rsync files")
-            self.rsync_gen()
+            # run post-triggers
+            self.logger.info("running post-sync triggers")
+            utils.run_triggers(self.api, None, "/var/lib/cobbler/triggers/sync/post/*")
+            utils.run_triggers(self.api, None, "/var/lib/cobbler/triggers/change/*")
+        self.__log_blend_statistics(blend_statistics)
 
-        # run post-triggers
-        self.logger.info("running post-sync triggers")
-        utils.run_triggers(self.api, None, "/var/lib/cobbler/triggers/sync/post/*")
-        utils.run_triggers(self.api, None, "/var/lib/cobbler/triggers/change/*")
+    def __log_hash_statistics(self, hash_statistics: Dict[str, int]) -> None:
+        """
+        Report how many files had to be hashed for the link caches during a sync.
+
+        :param hash_statistics: The statistics collected by ``HashIndex.batch()``.
+        """
+        self.logger.info(
+            "hashed %d files for the link caches (%d served from the hash index)",
+            hash_statistics["misses"],
+            hash_statistics["hits"],
+        )
 
     def run(self) -> None:
         """
         Syncs the current configuration file with the config tree.
         Using the ``Check().run_`` functions previously is recommended
         """
-        self.__common_run()
-
-        # execute the core of the sync operation
-        self.logger.info("cleaning trees")
-        self.clean_trees()
-
-        # Have the tftpd module handle copying bootloaders, distros, images, and all_system_files
-        self.tftpd.sync()
-        # Copy distros to the webdir
-        # Adding in the exception handling to not blow up if files have been moved (or the path references an NFS
-        # directory that's no longer mounted)
-        for distro in self.distros:
-            try:
-                self.logger.info("copying files for distro: %s", distro.name)
-                self.api.tftpgen.copy_single_distro_files(
-                    distro, self.settings.webdir, True
+        hash_index = filesystem_helpers.get_hash_index()
+        with utils.blend_cache() as blend_statistics, hash_index.batch() as hash_stats:
+            self.__common_run()
+
+            # execute the core of the sync operation
+            self.logger.info("cleaning trees")
+            self.clean_trees()
+
+            # Have the tftpd module handle copying bootloaders, distros, images, and all_system_files
+            self.tftpd.sync()
+            # Copy distros to the webdir
+            # Adding in the exception handling to not blow up if files have been moved (or the path references an NFS
+            # directory that's no longer mounted)
+            for distro in self.distros:
+                try:
+                    self.logger.info("copying files for distro: %s", distro.name)
+                    self.api.tftpgen.copy_single_distro_files(
+                        distro, self.settings.webdir, True
+                    )
+                    self.api.tftpgen.write_templates(distro, write_file=True)
+                except CX as cobbler_exception:
+                    self.logger.error(cobbler_exception.value)
+
+            if self.settings.manage_dhcp:
+                self.write_dhcp()
+            if self.settings.manage_dns:
+                self.logger.info("rendering DNS files")
+                self.dns.regen_hosts()
+                self.dns.write_configs()
+
+            if self.settings.manage_tftpd:
+                # copy in boot_files
+                self.tftpd.write_boot_files()
+
+            self.logger.info("cleaning link caches")
+            self.clean_link_cache()
+
+            if self.settings.manage_rsync:
+                self.logger.info("rendering Rsync files")
+                self.rsync_gen()
+
+            # run post-triggers
+            self.logger.info("running post-sync triggers")
+            utils.run_triggers(self.api, None, "/var/lib/cobbler/triggers/sync/post/*")
+            utils.run_triggers(self.api, None, "/var/lib/cobbler/triggers/change/*")
+        self.__log_blend_statistics(blend_statistics)
+        self.__log_hash_statistics(hash_stats)
+
+    def run_incremental(self) -> Dict[str, int]:
+        """
+        Syncs only the items which changed since the last incremental sync, according to the manifest of generated
+        files. Only changed files are rewritten and only files which are not generated anymore are removed. Without a
+        manifest, after changes to the settings or to items other than systems and their network interfaces all files
+        are regenerated, though unchanged files are still not rewritten. Otherwise only the files of the changed systems
+        are regenerated.
+
+        :return: The number of files that were "written", left "unchanged" and "removed".
+        """
+        hash_index = filesystem_helpers.get_hash_index()
+        with utils.blend_cache() as blend_statistics, hash_index.batch() as hash_stats:
+            self.__common_run()
+            manifest = SyncManifest(self.manifest_path)
+            complete = not manifest.load()
+            if complete:
+                self.logger.info("no sync manifest found, cleaning trees")
+                self.clean_trees()
+
+            items = self.__manifest_items()
+            settings_hash = hashlib.sha1(
+                json.dumps(self.settings.to_dict(), sort_keys=True, default=str).encode(
+                    "UTF-8"
                 )
-                self.api.tftpgen.write_templates(distro, write_file=True)
-            except CX as cobbler_exception:
-                self.logger.error(cobbler_exception.value)
-
-        if self.settings.manage_dhcp:
-            self.write_dhcp()
-        if self.settings.manage_dns:
-            self.logger.info("rendering DNS files")
-            self.dns.regen_hosts()
-            self.dns.write_configs()
-
-        if self.settings.manage_tftpd:
-            # copy in boot_files
-            self.tftpd.write_boot_files()
-
-        self.logger.info("cleaning link caches")
-        self.clean_link_cache()
+            ).hexdigest()
+            complete = complete or settings_hash != manifest.settings
+            dirty: Set[str] = set()
+            for uid in set(items) | set(manifest.items):
+                item = items.get(uid)
+                if item is None:
+                    item = manifest.items[uid]
+                elif item == manifest.items.get(uid):
+                    continue
+                if item["type"] == "network_interface":
+                    dirty.add(item["system"])
+                elif item["type"] == "system" and item["name"] != "default":
+                    dirty.add(uid)
+                else:
+                    complete = True
+            for path, entry in manifest.files.items():
+                # Someone removed a generated file behind our back.
+                if not os.path.lexists(path):
+                    if entry["sources"]:
+                        dirty.update(entry["sources"])
+                    else:
+                        complete = True
+
+            statistics = {"written": 0, "unchanged": 0, "removed": 0}
+            if complete or dirty:
+                generated = self.__generate_incremental(complete, dirty)
+                statistics = self.__update_manifest(
+                    manifest, generated, complete, dirty
+                )
+                if self.settings.manage_dhcp:
+                    self.write_dhcp()
+                if self.settings.manage_dns:
+                    self.logger.info("rendering DNS files")
+                    self.dns.regen_hosts()
+                    self.dns.write_configs()
+            else:
+                statistics["unchanged"] = len(manifest.files)
+            manifest.settings = settings_hash
+            manifest.items = items
+            manifest.save()
+            self.logger.info(
+                "incremental sync: %d files written, %d unchanged, %d removed",
+                statistics["written"],
+                statistics["unchanged"],
+                statistics["removed"],
+            )
 
-        if self.settings.manage_rsync:
-            self.logger.info("rendering Rsync files")
-            self.rsync_gen()
+            self.logger.info("cleaning link caches")
+            self.clean_link_cache()
+
+            if self.settings.manage_rsync:
+                self.logger.info("rendering Rsync files")
+                self.rsync_gen()
+
+            # run post-triggers
+            self.logger.info("running post-sync triggers")
+            utils.run_triggers(self.api, None, "/var/lib/cobbler/triggers/sync/post/*")
+            utils.run_triggers(self.api, None, "/var/lib/cobbler/triggers/change/*")
+        self.__log_blend_statistics(blend_statistics)
+        self.__log_hash_statistics(hash_stats)
+        return statistics
+
+    def __manifest_items(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Collect the state of all items as it is stored in the manifest.
+
+        :return: The type, name and mtime of every item by uid. Network interfaces also refer to their system.
+        """
+        items: Dict[str, Dict[str, Any]] = {}
+        for collection_type in SYNC_COLLECTION_TYPES:
+            for item in self.api.get_items(collection_type):
+                entry: Dict[str, Any] = {
+                    "type": collection_type,
+                    "name": item.name,
+                    "mtime": item.mtime,
+                }
+                if collection_type == "network_interface":
+                    entry["system"] = item.system_uid  # type: ignore
+                items[item.uid] = entry
+        return items
+
+    def __generate_incremental(
+        self, complete: bool, dirty: Set[str]
+    ) -> Dict[str, Set[str]]:
+        """
+        Generate the files of the incremental sync.
+
+        :param complete: Whether all files or only the files of the dirty systems are generated.
+        :param dirty: The uids of the systems whose files are generated.
+        :return: The generated paths by the uid of the item they belong to. Files which belong to no single item are
+                 stored under an empty string.
+        """
+        generated: Dict[str, Set[str]] = {}
+        if complete:
+            with filesystem_helpers.record_generated_files() as paths:
+                self.logger.info("copying bootloaders")
+                self.api.tftpgen.copy_bootloaders(self.bootloc)
+                self.api.tftpgen.hash_distro_files(self.distros, self.bootloc, False)
+                for distro in self.distros:
+                    try:
+                        self.logger.info("copying files for distro: %s", distro.name)
+                        self.tftpd.add_single_distro(distro)
+                        self.api.tftpgen.copy_single_distro_files(
+                            distro, self.settings.webdir, True
+                        )
+                        self.api.tftpgen.write_templates(distro, write_file=True)
+                    except CX as cobbler_exception:
+                        self.logger.error(cobbler_exception.value)
+                self.logger.info("copying images")
+                self.api.tftpgen.copy_images()
+                self.logger.info("generating PXE menu structure")
+                self.api.tftpgen.make_pxe_menu()
+            generated[""] = paths
+
+        self.logger.info("generating PXE configuration files")
+        menu_items = self.api.tftpgen.get_menu_items()
+        systems = [system for system in self.systems if complete or system.uid in dirty]
+        generated.update(
+            self.tftpd.write_system_files(  # type: ignore
+                systems, menu_items, with_templates=True
+            )
+        )
+        return generated
 
-        # run post-triggers
-        self.logger.info("running post-sync triggers")
-        utils.run_triggers(self.api, None, "/var/lib/cobbler/triggers/sync/post/*")
-        utils.run_triggers(self.api, None, "/var/lib/cobbler/triggers/change/*")
+    def __update_manifest(
+        self,
+        manifest: SyncManifest,
+        generated: Dict[str, Set[str]],
+        complete: bool,
+        dirty: Set[str],
+    ) -> Dict[str, int]:
+        """
+        Record the generated files in the manifest and delete the files which are not generated anymore.
+
+        :param manifest: The manifest of the previous sync.
+        :param generated: The generated paths by the uid of the item they belong to.
+        :param complete: Whether all files were generated.
+        :param dirty: The uids of the systems whose files were generated.
+        :return: The number of files that were "written", left "unchanged" and "removed".
+        """
+        files: Dict[str, Dict[str, Any]] = {}
+        for path, entry in manifest.files.items():
+            if not complete and dirty.isdisjoint(entry["sources"]):
+                files[path] = entry
+        statistics = {"written": 0, "unchanged": 0, "removed": 0}
+        for uid, paths in generated.items():
+            for path in paths:
+                if path in files:
+                    if uid and uid not in files[path]["sources"]:
+                        files[path]["sources"].append(uid)
+                    continue
+                file_hash = SyncManifest.hash_file(path)
+                if not file_hash:
+                    continue
+                old_entry = manifest.files.get(path)
+                if old_entry is None or old_entry["hash"] != file_hash:
+                    statistics["written"] += 1
+                files[path] = {"hash": file_hash, "sources": [uid] if uid else []}
+        statistics["unchanged"] = len(files) - statistics["written"]
+        for path in manifest.files:
+            if path not in files:
+                self.logger.info("removing stale file: %s", path)
+                if os.path.isdir(path) and not os.path.islink(path):
+                    filesystem_helpers.rmtree(path)
+                else:
+                    filesystem_helpers.rmfile(path)
+                statistics["removed"] += 1
+        manifest.files = files
+        return statistics
 
     def clean_trees(self):
         """
@@ -115,6 +115,7 @@ V2.8.5
 # SPDX-FileCopyrightText: Copyright 2006-2009, Red Hat, Inc and Others
 # SPDX-FileCopyrightText: Michael DeHaan <michael.dehaan AT gmail>
 
+import hashlib
 import inspect
 import logging
 import os
@@ -122,10 +123,22 @@ import pathlib
 import random
 import tempfile
 import threading
+from collections import OrderedDict
 from configparser import ConfigParser
 from pathlib import Path
 from types import ModuleType
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from schema import SchemaError  # type: ignore
 
@@ -169,9 +182,10 @@ from cobbler.items import system as system_module
 from cobbler.items import system_group, template
 from cobbler.items.abstract import bootable_item as item_base
 from cobbler.items.abstract.inheritable_item import InheritableItem
-from cobbler.utils import filesystem_helpers, input_converters, signatures
+from cobbler.utils import filesystem_helpers, input_converters, signatures, thread
 
 if TYPE_CHECKING:
+    from cobbler.cobbler_collections.change_feed import Change
     from cobbler.cobbler_collections.collection import FIND_KWARGS, ITEM, Collection
     from cobbler.cobbler_collections.distro_group import DistroGroups
     from cobbler.cobbler_collections.distros import Distros
@@ -195,6 +209,18 @@ if TYPE_CHECKING:
 #   request basis.
 
 
+class RenderedFile(NamedTuple):
+    """
+    A generated file together with the validators that HTTP clients can use to revalidate their copy of it.
+    """
+
+    etag: str
+    """Quoted hash of the content or an empty str if the content must not be cached."""
+    last_modified: float
+    """The newest mtime of the items the content was generated from."""
+    content: str
+
+
 class CobblerAPI:
     """
     Python API module for Cobbler.
@@ -204,6 +230,10 @@ class CobblerAPI:
 
     __shared_state: Dict[str, Any] = {}
     __has_loaded = False
+    # Bumped to invalidate the resolved dict caches of all items at once.
+    resolved_cache_generation = 0
+    rendered_file_cache_size = 512
+    """Maximum number of generated autoinstall, iPXE, boot.cfg and script files that are kept in memory."""
 
     def __init__(
         self,
@@ -273,6 +303,9 @@ class CobblerAPI:
             self.autoinstall_mgr = AutoInstallationManager(self)
             self.yumgen = yumgen.YumGen(self)
             self.tftpgen = tftpgen.TFTPGen(self)
+            self.__rendered_files: "OrderedDict[Tuple[str, str, str, str], Tuple[Tuple[Any, ...], RenderedFile]]" = (OrderedDict())
+            self.__rendered_files_lock = threading.Lock()
+            thread.register_fork_locks(self, self.__rendered_files_lock)
             self.__directory_startup_preparations()
             self._collection_mgr.templates().refresh_content()
             self.logger.debug("API handle initialized")
@@ -473,19 +506,14 @@ class CobblerAPI:
         """
         Items cache invalidation in case of settings or singatures changes.
         Cobbler internal use only.
+
+        Every item may inherit from the settings, thus a settings change invalidates all resolved dicts at once by
+        bumping ``resolved_cache_generation``. Signatures are only used by distros and the items that inherit from them.
         """
         if obj is None or isinstance(obj, settings.Settings):  # type: ignore
-            item_types = [
-                "repo",
-                "distro",
-                "menu",
-                "image",
-                "profile",
-                "system",
-                "network_interface",
-                "template",
-            ]
-        elif obj == self.get_signatures():
+            self.resolved_cache_generation += 1
+            return
+        if obj == self.get_signatures():
             item_types = ["distro", "image", "profile", "system"]
         else:
             raise CX(f"Wrong object type {type(obj)} for cache invalidation!")
@@ -1486,7 +1514,12 @@ class CobblerAPI:
         return system_group.SystemGroup(self, is_subobject, **kwargs)
 
     # ==========================================================================
-    def add_remove_items(self, items: List["TransactionTuple"]) -> None:
+    def add_remove_items(
+        self,
+        items: List["TransactionTuple"],
+        with_triggers: bool = True,
+        with_sync: bool = True,
+    ) -> None:
         """
         Add or remove multiple items.
         1. Checks for external modifications using mtime
@@ -1494,7 +1527,12 @@ class CobblerAPI:
         3. Processes additions and modifications
         4. Rebuilds the PXE configuration
 
+        If an item fails, the items which were already persisted stay persisted and their PXE configuration is still
+        rebuilt before the error is raised.
+
         :param items: The list of items.
+        :param with_triggers: If triggers should be run for the items.
+        :param with_sync: If the PXE configuration should be rebuilt for the items.
         """
         for what, ref, _, mtime, base_id, _ in items:
             if base_id:
@@ -1515,41 +1553,53 @@ class CobblerAPI:
         to_remove.sort(key=lambda x: -x[1].depth)
         to_add.sort(key=lambda x: x[1].depth)
 
-        for what, ref, _, _, _, _ in to_add:
-            self.log(f"add_item({what})", [ref.uid])
-            self.get_items(what).add(
-                ref,  # type: ignore
-                check_for_duplicate_names=False,
-                save=True,
-                with_sync=False,
-                with_triggers=True,
-                rebuild_menu=False,
-            )
-
-        for what, ref, _, _, _, item_changelog in to_add:
-            ref.in_transaction = False
-            for item in item_changelog:
-                self.get_items(what).update_index_value(
-                    ref, ".".join(item.attribute), item.old_value, item.new_value
-                )
-
-        for what, ref, _, _, _, _ in to_remove:
-            self.get_items(what).remove(
-                ref,
-                recursive=False,
-                with_delete=True,
-                with_sync=False,
-                with_triggers=True,
-                rebuild_menu=False,
-            )
-
-        # Now update all on-disk configuration because the caches are valid again
-        self.log("Executing Cobbler sync for transaction commit")
-        for what, ref, _, _, _, _ in to_add:
-            self.get_items(what).add_quick_pxe_sync(ref, rebuild_menu=False)
-        for what, ref, _, _, _, _ in to_remove:
-            self.get_items(what).remove_quick_pxe_sync(ref, rebuild_menu=False)
-        self.tftpgen.make_pxe_menu()
+        added: List["TransactionTuple"] = []
+        removed: List["TransactionTuple"] = []
+        try:
+            # All items of the transaction are written under a single serializer lock
+            with self._collection_mgr.serialize_batch():
+                try:
+                    for item in to_add:
+                        self.log(f"add_item({item.what})", [item.ref.uid])
+                        self.get_items(item.what).add(
+                            item.ref,  # type: ignore
+                            check_for_duplicate_names=False,
+                            save=True,
+                            with_sync=False,
+                            with_triggers=with_triggers,
+                            rebuild_menu=False,
+                        )
+                        added.append(item)
+                finally:
+                    for what, ref, _, _, _, item_changelog in added:
+                        ref.in_transaction = False
+                        for modification in item_changelog:
+                            self.get_items(what).update_index_value(
+                                ref,
+                                ".".join(modification.attribute),
+                                modification.old_value,
+                                modification.new_value,
+                            )
+
+                for item in to_remove:
+                    self.get_items(item.what).remove(
+                        item.ref,
+                        recursive=False,
+                        with_delete=True,
+                        with_sync=False,
+                        with_triggers=with_triggers,
+                        rebuild_menu=False,
+                    )
+                    removed.append(item)
+        finally:
+            if with_sync and (added or removed):
+                # Now update all on-disk configuration because the caches are valid again
+                self.log("Executing Cobbler sync for transaction commit")
+                for what, ref, _, _, _, _ in added:
+                    self.get_items(what).add_quick_pxe_sync(ref, rebuild_menu=False)
+                for what, ref, _, _, _, _ in removed:
+                    self.get_items(what).remove_quick_pxe_sync(ref, rebuild_menu=False)
+                self.tftpgen.make_pxe_menu()
 
     def add_item(
         self,
@@ -1934,22 +1984,17 @@ class CobblerAPI:
 
     def __find_by_uid(self, uid: str) -> Optional["BootableItem"]:
         """
-        This is a magic method which just searches all collections for the specified name directly,
+        This is a magic method which finds the item with the specified uid in any collection with a single lookup.
 
-        :param name: The name of the item(s).
+        :param uid: The uid of the item.
         :return: The found item or None.
         """
         if not isinstance(uid, str):  # type: ignore
             raise TypeError("name of an object must be of type str!")
-        for collection_name in enums.ItemTypes:
-            match = self.find_items(
-                collection_name.value, return_list=False, criteria={"uid": uid}
-            )
-            if isinstance(match, list):
-                raise ValueError("Ambiguous match during search!")
-            if match is not None:
-                return match
-        return None
+        match = self._collection_mgr.lookup_uid(uid)
+        if match is None:
+            return None
+        return match[1]  # type: ignore
 
     def find_distro(
         self,
@@ -2159,8 +2204,8 @@ class CobblerAPI:
 
     # ==========================================================================
 
-    @staticmethod
     def __since(
+        self,
         mtime: float,
         collector: Callable[[], "Collection[ITEM]"],
         collapse: bool = False,
@@ -2176,7 +2221,17 @@ class CobblerAPI:
         """
         results2: List["ITEM"] = []
         item: "ITEM"
-        for item in collector():
+        collection = collector()
+        items: Iterable["ITEM"] = collection
+        if not collection.inmemory:
+            # Let the serializer preselect the items, so only those are loaded from disk.
+            uids = self._collection_mgr.find_uids_since(collection, mtime)
+            if uids is not None:
+                collection.deserialize_many(uids)
+                items = [
+                    collection.listing[uid] for uid in uids if uid in collection.listing
+                ]
+        for item in items:
             if item.mtime == 0 or item.mtime >= mtime:
                 if not collapse:
                     results2.append(item)
@@ -2326,6 +2381,36 @@ class CobblerAPI:
         """
         return self.__since(mtime, self.system_groups, collapse=collapse)
 
+    def get_changes(
+        self, since_revision: int, collection_types: Optional[List[str]] = None
+    ) -> Tuple[str, int, Optional[List["Change"]]]:
+        """
+        Return the changes to items since a revision of the change feed. In contrast to the ``get_*_since`` methods
+        this includes deletions and doesn't need to look at every item.
+
+        :param since_revision: The last revision the caller has seen.
+        :param collection_types: If given, only changes to these collection types are returned.
+        :return: The epoch of the change feed, the current revision and the changes. The changes are None if they can't
+                 be answered from the change feed anymore and the caller needs to do a full resync.
+        """
+        change_feed = self._collection_mgr.change_feed
+        revision, changes = change_feed.since(since_revision, collection_types)
+        return change_feed.epoch, revision, changes
+
+    def get_item_hashes(self, collection_type: str) -> Tuple[str, Dict[str, str]]:
+        """
+        Summarize the content of a collection for the replication. Two servers with the same digest hold the same items,
+        otherwise the hashes of the single items tell which of them differ.
+
+        :param collection_type: The collection type to summarize, e.g. "system".
+        :return: The digest of the whole collection and the content hash of every item keyed by its uid.
+        """
+        hashes = self.get_items(collection_type).content_hashes()
+        digest = hashlib.sha256()
+        for uid in sorted(hashes):
+            digest.update(f"{uid}:{hashes[uid]}\n".encode("UTF-8"))
+        return digest.hexdigest(), hashes
+
     # ==========================================================================
 
     @staticmethod
@@ -2617,20 +2702,111 @@ class CobblerAPI:
         :param autoinstaller_subfile: TODO
         :return: The str representation of the file.
         """
-        # pylint: disable=broad-exception-caught
         self.logger.info("generate_autoinstall")
-        try:
-            return self.autoinstall_mgr.generate_autoinstall(
-                obj,
-                autoinstall_template=autoinstall_template,
-                autoinstaller_subfile=autoinstaller_subfile,
-            )
-        except Exception:
-            utils.log_exc()
-            return (
-                "# This automatic OS installation file had errors that prevented it from being rendered correctly.\n"
-                "# The cobbler.log should have information relating to this failure."
+        return self.render_cached(
+            "autoinstall", obj, autoinstaller_subfile, autoinstall_template
+        ).content
+
+    def __rendered_file_stamp(
+        self, obj: "BootableItem"
+    ) -> Tuple[Tuple[Any, ...], float]:
+        """
+        Collect the modification state of everything a generated file depends on: The object with its parents and
+        network interfaces, the settings, the templates including snippets and the repositories.
+
+        :param obj: The object the file is generated for.
+        :return: The stamp and the newest mtime of all items in it.
+        """
+        stamp: List[Tuple[Any, ...]] = []
+        last_modified = 0.0
+        for node in obj.grab_tree():
+            if isinstance(node, settings.Settings):
+                stamp.append(("settings", self.resolved_cache_generation))
+                continue
+            stamp.append((node.uid, node.mtime))
+            last_modified = max(last_modified, node.mtime)
+        if isinstance(obj, system_module.System):
+            for interface in obj.interfaces.values():
+                stamp.append((interface.uid, interface.mtime))
+                last_modified = max(last_modified, interface.mtime)
+        for collection in (self.templates(), self.repos()):
+            newest = max((item.mtime for item in collection), default=0.0)
+            stamp.append((collection.collection_type(), len(collection), newest))
+            last_modified = max(last_modified, newest)
+        stamp.append(("templar", self.templar.template_generation))
+        return tuple(stamp), last_modified
+
+    def render_cached(
+        self,
+        generator: str,
+        obj: "BootableItem",
+        subfile: str = "",
+        autoinstall_template: Optional[template.Template] = None,
+    ) -> RenderedFile:
+        """
+        Generate a file for an object and keep the result in memory. Installers fetch the same file several times, thus
+        repeated requests are answered without rendering as long as the object, its parents and network interfaces, the
+        settings, the templates and the repositories didn't change.
+
+        :param generator: One of "autoinstall", "ipxe", "bootcfg" or "script".
+        :param obj: The profile or system to generate the file for. Images are only valid for iPXE.
+        :param subfile: The autoinstaller subfile or the name of the script.
+        :param autoinstall_template: The template to render. Only required for the "autoinstall" generator.
+        :return: The generated file. Files that failed to render are not cached and don't have an ETag.
+        :raises ValueError: In case the generator is unknown.
+        """
+        # pylint: disable=broad-exception-caught
+        if generator not in ("autoinstall", "ipxe", "bootcfg", "script"):
+            raise ValueError(f'Unknown generator "{generator}"!')
+        if generator == "autoinstall" and autoinstall_template is None:
+            raise ValueError("The autoinstall generator requires a template!")
+        stamp, last_modified = self.__rendered_file_stamp(obj)
+        key = (
+            generator,
+            obj.uid,
+            subfile,
+            "" if autoinstall_template is None else autoinstall_template.uid,
+        )
+        with self.__rendered_files_lock:
+            cached_file = self.__rendered_files.get(key)
+            if cached_file is not None and cached_file[0] == stamp:
+                self.__rendered_files.move_to_end(key)
+                return cached_file[1]
+
+        if generator == "autoinstall":
+            try:
+                content = self.autoinstall_mgr.generate_autoinstall(
+                    obj,
+                    autoinstall_template=autoinstall_template,  # type: ignore
+                    autoinstaller_subfile=subfile,
+                )
+            except Exception:
+                utils.log_exc()
+                return RenderedFile(
+                    "",
+                    last_modified,
+                    "# This automatic OS installation file had errors that prevented it from being rendered correctly.\n"
+                    "# The cobbler.log should have information relating to this failure.",
+                )
+        elif generator == "ipxe":
+            content = self.tftpgen.generate_ipxe(obj.COLLECTION_TYPE, obj.name)
+        elif generator == "bootcfg":
+            content = self.tftpgen.generate_bootcfg(obj.COLLECTION_TYPE, obj.name)
+        else:
+            content = self.tftpgen.generate_script(
+                obj.COLLECTION_TYPE, obj.name, subfile
             )
+        if utils.CHEETAH_ERROR_DISCLAIMER in content:
+            return RenderedFile("", last_modified, content)
+
+        digest = hashlib.sha256(content.encode("UTF-8")).hexdigest()
+        rendered_file = RenderedFile(f'"{digest[:32]}"', last_modified, content)
+        with self.__rendered_files_lock:
+            self.__rendered_files[key] = (stamp, rendered_file)
+            self.__rendered_files.move_to_end(key)
+            while len(self.__rendered_files) > self.rendered_file_cache_size:
+                self.__rendered_files.popitem(last=False)
+        return rendered_file
 
     # ==========================================================================
 
@@ -2664,7 +2840,12 @@ class CobblerAPI:
 
     # ==========================================================================
 
-    def sync(self, verbose: bool = False, what: Optional[List[str]] = None) -> None:
+    def sync(
+        self,
+        verbose: bool = False,
+        what: Optional[List[str]] = None,
+        incremental: bool = False,
+    ) -> None:
         """
         Take the values currently written to the configuration files in /etc, and /var, and build out the information
         tree found in /tftpboot. Any operations done in the API that have not been saved with serialize() will NOT be
@@ -2672,6 +2853,8 @@ class CobblerAPI:
 
         :param verbose: If the action should be just logged as needed or (if True) as much verbose as possible.
         :param what:   List of strings what services to sync (e.g. dhcp and/or dns). Empty list for full sync.
+        :param incremental: Instead of rebuilding the trees from scratch, only regenerate what changed since the last
+                            incremental sync. Ignored if ``what`` is given.
         """
         # Empty what: Full sync
         if not what:
@@ -2681,7 +2864,10 @@ class CobblerAPI:
             )
             with utils.filelock("/var/lib/cobbler/lock"):
                 sync_obj = self.get_sync(verbose=verbose)
-                sync_obj.run()
+                if incremental:
+                    sync_obj.run_incremental()
+                else:
+                    sync_obj.run()
             return
         # Non empty what: Specific sync
         if not isinstance(what, list):  # type: ignore
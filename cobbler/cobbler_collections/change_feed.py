@@ -0,0 +1,101 @@
+"""
+Cobbler module that records the changes made to the items of all collections. Clients can ask for everything that
+changed after the last revision they have seen instead of polling the collections by mtime.
+"""
+
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+import threading
+import uuid
+from collections import deque
+from typing import TYPE_CHECKING, Deque, Iterable, List, NamedTuple, Optional, Tuple
+
+if TYPE_CHECKING:
+    from cobbler.items.abstract.base_item import BaseItem
+
+
+class Change(NamedTuple):  # pylint: disable=missing-class-docstring
+    revision: int
+    collection_type: str
+    operation: str
+    """One of "add", "modify", "rename" or "delete"."""
+    uid: str
+    name: str
+    old_name: str
+    """The name before a rename. Empty for all other operations."""
+    mtime: float
+
+
+class ChangeFeed:
+    """
+    In-memory log of item changes with a monotonically increasing revision that is shared by all collections. The log
+    is bounded, thus clients which fall too far behind are told to do a full resync.
+    """
+
+    max_changes = 100000
+    """Maximum number of changes that are kept in memory."""
+
+    def __init__(self, max_changes: Optional[int] = None) -> None:
+        """
+        Constructor
+
+        :param max_changes: Overrides the maximum number of changes that are kept in memory.
+        """
+        if max_changes is not None:
+            self.max_changes = max_changes
+        # Revisions start at zero with every daemon start, the epoch tells clients that their revision is meaningless.
+        self.epoch = uuid.uuid4().hex
+        self.revision = 0
+        self.__changes: Deque[Change] = deque(maxlen=self.max_changes)
+        self.__lock = threading.Lock()
+
+    def record(self, operation: str, item: "BaseItem", old_name: str = "") -> int:
+        """
+        Append a change to the log.
+
+        :param operation: One of "add", "modify", "rename" or "delete".
+        :param item: The item that was changed.
+        :param old_name: The name of the item before it was renamed.
+        :return: The revision of the change.
+        """
+        with self.__lock:
+            self.revision += 1
+            self.__changes.append(
+                Change(
+                    self.revision,
+                    item.COLLECTION_TYPE,
+                    operation,
+                    item.uid,
+                    item.name,
+                    old_name,
+                    item.mtime,
+                )
+            )
+            return self.revision
+
+    def since(
+        self, revision: int, collection_types: Optional[Iterable[str]] = None
+    ) -> Tuple[int, Optional[List[Change]]]:
+        """
+        Collect the changes after a revision. The log is walked backwards from the newest change, so this is
+        proportional to the number of returned changes and not to the size of the log.
+
+        :param revision: The last revision the client has seen.
+        :param collection_types: If given, only changes of these collection types are returned.
+        :return: The current revision and the changes in the order they happened. The changes are None if the log
+                 doesn't reach back to the given revision anymore or the revision is unknown.
+        """
+        wanted = None if collection_types is None else set(collection_types)
+        changes: List[Change] = []
+        with self.__lock:
+            oldest = self.__changes[0].revision if self.__changes else self.revision + 1
+            if revision > self.revision or revision < oldest - 1:
+                return self.revision, None
+            for change in reversed(self.__changes):
+                if change.revision <= revision:
+                    break
+                if wanted is None or change.collection_type in wanted:
+                    changes.append(change)
+            current_revision = self.revision
+        changes.reverse()
+        return current_revision, changes
@@ -6,6 +6,10 @@ This module contains the code for the abstract base collection that powers all t
 # SPDX-FileCopyrightText: Copyright 2006-2009, Red Hat, Inc and Others
 # SPDX-FileCopyrightText: Michael DeHaan <michael.dehaan AT gmail>
 
+import bisect
+import fnmatch
+import hashlib
+import json
 import logging
 import os
 import time
@@ -17,10 +21,12 @@ from typing import (
     Callable,
     Dict,
     Generic,
+    Iterable,
     Iterator,
     List,
     Optional,
     Set,
+    Tuple,
     TypeVar,
     Union,
 )
@@ -39,6 +45,7 @@ from cobbler.items import (
 )
 from cobbler.items.abstract.base_item import BaseItem
 from cobbler.items.abstract.inheritable_item import InheritableItem
+from cobbler.utils import thread
 
 if TYPE_CHECKING:
     from cobbler.actions.sync import CobblerSync
@@ -57,6 +64,11 @@ class Collection(Generic[ITEM]):
     Base class for any serializable list of things.
     """
 
+    # Number of items after which the loading progress of a collection is logged.
+    deserialize_progress_interval = 10000
+    # Number of items of a lazy started collection that are loaded from disk at once.
+    deserialize_batch_size = 500
+
     def __init__(self, collection_mgr: "CollectionManager"):
         """
         Constructor.
@@ -68,10 +80,15 @@ class Collection(Generic[ITEM]):
         self.api = self.collection_mgr.api
         self.__lite_sync: Optional["CobblerSync"] = None
         self.lock: Lock = Lock()
+        thread.register_fork_locks(self, self.lock)
         self._inmemory: bool = not self.api.settings().lazy_start
         self._deserialize_running: bool = False
         # Secondary indexes for the collection.
         self.indexes: Dict[str, Dict[Union[str, int], Union[str, Set[str]]]] = {}
+        # Sorted keys of the indexes, used to answer wildcard queries. Rebuilt lazily once the keys changed.
+        self._sorted_index_keys: Dict[str, List[str]] = {}
+        # Number of uid entries and of distinct uids of the indexes, used for sorted slices. Dropped on every change.
+        self._index_coverage: Dict[str, Tuple[int, int]] = {}
         self.init_indexes()
         self.logger = logging.getLogger()
 
@@ -216,7 +233,9 @@ class Collection(Generic[ITEM]):
         with self.lock:
             self.remove_from_indexes(ref)
             del self.listing[ref.uid]
+            self.collection_mgr.unregister_item(ref.uid)
         self.collection_mgr.serialize_delete(self, ref)
+        self.collection_mgr.change_feed.record("delete", ref)
 
         if with_delete:
             if with_triggers:
@@ -360,24 +379,62 @@ class Collection(Generic[ITEM]):
         """
         return [item_obj.to_dict() for item_obj in list(self.listing.values())]
 
-    def from_list(self, _list: List[Dict[str, Any]]) -> None:
+    def from_list(self, _list: Iterable[Dict[str, Any]]) -> None:
         """
         Create all collection object items from ``_list``.
 
+        The items are added to the collection and its indexes in bulk. A bulk is flushed whenever the depth of the
+        items changes, so items of a topologically sorted list can always resolve their parents.
+
         :param _list: The list with all item dictionaries.
         """
         if _list is None:  # type: ignore
             return
+        pending: List[ITEM] = []
+        pending_depth: Any = None
+        loaded = 0
         for item_dict in _list:
+            depth = item_dict.get("depth")
+            if pending and depth != pending_depth:
+                loaded += self.__add_loaded_items(pending)
+                pending = []
+            pending_depth = depth
             try:
                 item = self.factory_produce(self.api, item_dict)
-                self.add(item)
+                item.check_if_valid()
+                if item.COLLECTION_TYPE != self.collection_type():
+                    raise TypeError("API error: storing wrong data type in collection")
+                pending.append(item)
             except Exception as exc:
                 self.logger.error(
                     "Error while loading a collection: %s. Skipping collection %s!",
                     exc,
                     self.collection_type(),
                 )
+            if len(pending) >= self.deserialize_progress_interval:
+                loaded += self.__add_loaded_items(pending)
+                pending = []
+                self.logger.info(
+                    "Loaded %d items of collection %s so far",
+                    loaded,
+                    self.collection_type(),
+                )
+        self.__add_loaded_items(pending)
+
+    def __add_loaded_items(self, items: List[ITEM]) -> int:
+        """
+        Add freshly deserialized items to the listing and build their index entries under a single lock.
+
+        :param items: The validated items to add.
+        :return: The number of items added.
+        """
+        with self.lock:
+            for item in items:
+                self.listing[item.uid] = item
+                self.collection_mgr.register_item(self, item)
+            for item in items:
+                self.add_to_indexes(item)
+        return len(items)
 
     def copy(
         self,
@@ -444,6 +501,7 @@ class Collection(Generic[ITEM]):
         else:
             # Skip serialization if this is a built-in template
             self.collection_mgr.serialize_one_item(ref)
+        self.collection_mgr.change_feed.record("rename", ref, old_name=oldname)
 
         # for a repo, rename the mirror directory
         if isinstance(ref, repo.Repo):
@@ -477,6 +535,7 @@ class Collection(Generic[ITEM]):
                         distro_obj.kernel = distro_obj.kernel.replace(path, newpath)
                         distro_obj.initrd = distro_obj.initrd.replace(path, newpath)
                         self.collection_mgr.serialize_one_item(distro_obj)
+                        self.collection_mgr.change_feed.record("modify", distro_obj)
 
     def check_for_duplicate_names(self, ref: ITEM) -> None:
         """
@@ -557,7 +616,9 @@ class Collection(Generic[ITEM]):
             )
 
         with self.lock:
+            is_new = ref.uid not in self.listing
             self.listing[ref.uid] = ref
+            self.collection_mgr.register_item(self, ref)
             self.add_to_indexes(ref)
 
         # perform filesystem operations
@@ -572,6 +633,7 @@ class Collection(Generic[ITEM]):
             else:
                 # Skip serialization if this is a built-in template
                 self.collection_mgr.serialize_one_item(ref)
+            self.collection_mgr.change_feed.record("add" if is_new else "modify", ref)
 
             if with_sync:
                 self.add_quick_pxe_sync(ref, rebuild_menu=rebuild_menu)
@@ -650,12 +712,32 @@ class Collection(Generic[ITEM]):
             return
 
         self.deserialize_running = True
-        for obj in self.listing.values():
-            if not obj.inmemory:
-                obj.deserialize()
+        uids = [obj.uid for obj in self.listing.values() if not obj.inmemory]
+        for start in range(0, len(uids), self.deserialize_batch_size):
+            self.deserialize_many(uids[start : start + self.deserialize_batch_size])
         self.inmemory = True
         self.deserialize_running = False
 
+    def deserialize_many(self, uids: List[str]) -> None:
+        """
+        Load the given items of a lazy started collection from disk with a single call to the serializer.
+
+        :param uids: The uids of the items to load. Items which are already in memory are skipped.
+        """
+        uids = [
+            uid
+            for uid in uids
+            if uid in self.listing and not self.listing[uid].inmemory
+        ]
+        if len(uids) == 0:
+            return
+        item_dicts = self.collection_mgr.deserialize_many(self, uids)
+        for uid in uids:
+            obj = self.listing.get(uid)
+            # Loading an item may already have loaded others of this collection, e.g. the parent of a subprofile.
+            if obj is not None and not obj.inmemory:
+                obj.deserialize(item_dicts.get(uid))
+
     def init_indexes(self) -> None:
         """
         Initializing Indexes.
@@ -667,6 +749,8 @@ class Collection(Generic[ITEM]):
         ):
             if not indx_prop["disabled"]:
                 self.indexes[indx] = {}
+                self._sorted_index_keys.pop(indx, None)
+                self._index_coverage.pop(indx, None)
 
     def index_helper(
         self,
@@ -695,6 +779,7 @@ class Collection(Generic[ITEM]):
             "nonunique"
         ]
         indx_dict = self.indexes[index_name]
+        indx_len = len(indx_dict)
         item_uid = ref.uid
         if isinstance(key, (str, int)):
             index_operation(key, item_uid, indx_dict, indx_uniq)
@@ -716,6 +801,9 @@ class Collection(Generic[ITEM]):
             raise CX(
                 f'Attribute type {type(key)} for "{item_uid}" cannot be used to create an index!'
             )
+        if len(indx_dict) != indx_len:
+            self._sorted_index_keys.pop(index_name, None)
+        self._index_coverage.pop(index_name, None)
 
     def _get_index_property(self, ref: ITEM, index_name: str) -> str:
         """
@@ -866,65 +954,228 @@ class Collection(Generic[ITEM]):
         """
         Searching for items in the collection by indexes.
 
-        :param kwargs: The dict to match for the items.
-        """
+        Exact values are looked up directly, wildcard patterns are matched against the sorted keys of the index
+        (narrowed down by their literal prefix) and values starting with "~" are answered as the difference to all
+        items of the collection. The uid sets of all criteria are intersected before any item is materialized. Values
+        which match an empty string are left to the full scan for unique indexes, as these don't store empty values.
 
-        def add_result(key: str, value: str, results: List[ITEM]) -> None:
-            if value in self.listing:
-                results.append(self.listing[value])
-            else:
-                self.logger.error(
-                    'Internal error. The "%s" index for "%s" is corrupted.', key, value
-                )
-
-        result: Optional[List[ITEM]] = None
+        :param kwargs: The dict to match for the items. All keys which were answered by an index are removed.
+        :return: The matching items or None in case nothing matched.
+        """
+        result: Optional[Set[str]] = None
         found_keys: List[str] = []
-        found: bool = True
+        plan: List[str] = []
 
         for key, value in kwargs.items():
-            # fnmatch and "~" are not supported
+            if key not in self.indexes or not isinstance(value, (str, int)):
+                continue
+            negate = isinstance(value, str) and value.startswith("~")
+            search = value[1:] if negate else value  # type: ignore
             if (
-                key not in self.indexes
-                or value[:1] == "~"
-                or "?" in value
-                or "*" in value
-                or "[" in value
+                isinstance(search, str)
+                and fnmatch.fnmatch("", search)
+                and not self.__is_index_nonunique(key)
             ):
+                # Unique indexes don't store empty values, thus only a full scan finds the items with an empty value.
                 continue
-
-            indx_dict = self.indexes[key]
-            if value in indx_dict and found:
-                if result is None:
-                    result = []
-                indx_val = indx_dict[value]
-                result_len = len(result)
-                if isinstance(indx_val, str):
-                    if result_len > 0:
-                        if self.listing[indx_val] not in result:
-                            found = False
-                    elif found:
-                        add_result(key, indx_val, result)
-                else:
-                    if result_len > 0:
-                        indx_set: Set[ITEM] = {self.listing[x] for x in indx_val}
-                        result_set = set(result) & indx_set
-                        if len(result_set) == 0:
-                            found = False
-                        else:
-                            result = list(result_set)
-                    elif found:
-                        for obj_name in indx_val:
-                            add_result(key, obj_name, result)
-            else:
-                found = False
             found_keys.append(key)
+            if result is not None and len(result) == 0:
+                # Nothing can match anymore, the remaining criteria don't need to be looked up.
+                continue
+            uids, method = self.__index_lookup(key, search)
+            if negate:
+                uids = set(self.listing.keys()) - uids
+                method = f"negated {method}"
+            plan.append(f"{key}={value!r} via {method} ({len(uids)} uids)")
+            result = uids if result is None else result & uids
 
         for key in found_keys:
             kwargs.pop(key)
-        if result is None or len(result) == 0 or not found:
+        if plan:
+            self.logger.debug(
+                'Query plan for collection "%s": %s; not indexed: %s',
+                self.collection_type(),
+                ", ".join(plan),
+                ", ".join(kwargs.keys()) or "-",
+            )
+        if not result:
+            return None
+
+        items: List[ITEM] = []
+        for uid in result:
+            if uid in self.listing:
+                items.append(self.listing[uid])
+            else:
+                self.logger.error(
+                    'Internal error. An index for "%s" is corrupted.', uid
+                )
+        if len(items) == 0:
+            return None
+        return items
+
+    def __is_index_nonunique(self, key: str) -> bool:
+        """
+        Check if an index may hold several items per key. Only these indexes store items with empty values.
+
+        :param key: The name of the index.
+        :return: True if the index is nonunique.
+        """
+        return self.api.settings().memory_indexes[self.collection_type()][key][  # type: ignore
+            "nonunique"
+        ]
+
+    def __index_lookup(self, key: str, value: Union[str, int]) -> Tuple[Set[str], str]:
+        """
+        Collect the uids of all items whose index key matches the given value.
+
+        :param key: The name of the index.
+        :param value: The exact value or a shell-style wildcard pattern.
+        :return: The matching uids and a short description of how the index was used.
+        """
+        indx_dict = self.indexes[key]
+        if not isinstance(value, str) or not any(char in value for char in "*?["):
+            return self.__index_uids(indx_dict, value), "exact lookup"
+
+        prefix = value
+        for char in "*?[":
+            prefix = prefix.split(char, 1)[0]
+        sorted_keys = self.__sorted_keys(key)
+        if prefix:
+            first = bisect.bisect_left(sorted_keys, prefix)
+            last = bisect.bisect_left(sorted_keys, prefix + "\U0010ffff", first)
+            candidates = sorted_keys[first:last]
+            method = f'prefix scan "{prefix}"'
+        else:
+            candidates = sorted_keys
+            method = "key scan"
+        uids: Set[str] = set()
+        for indx_key in fnmatch.filter(candidates, value):
+            uids |= self.__index_uids(indx_dict, indx_key)
+        return uids, f"{method} over {len(candidates)} keys"
+
+    @staticmethod
+    def __index_uids(
+        indx_dict: Dict[Union[str, int], Union[str, Set[str]]], key: Union[str, int]
+    ) -> Set[str]:
+        """
+        Normalize the value of an index entry to a set of uids.
+
+        :param indx_dict: The index to look up the key in.
+        :param key: The index key.
+        :return: The uids stored for the key. Empty if the key is unknown.
+        """
+        indx_val = indx_dict.get(key)
+        if indx_val is None:
+            return set()
+        if isinstance(indx_val, str):
+            return {indx_val}
+        return set(indx_val)
+
+    def __sorted_keys(self, key: str) -> List[str]:
+        """
+        Return the string keys of an index in sorted order. The list is cached until the keys of the index change.
+
+        :param key: The name of the index.
+        :return: The sorted keys.
+        """
+        sorted_keys = self._sorted_index_keys.get(key)
+        if sorted_keys is None:
+            sorted_keys = sorted(k for k in self.indexes[key] if isinstance(k, str))
+            self._sorted_index_keys[key] = sorted_keys
+        return sorted_keys
+
+    def __index_coverage(self, index_name: str) -> Tuple[int, int]:
+        """
+        Count the uid entries and the distinct uids of an index. The counts are cached until the index changes.
+
+        :param index_name: The name of the index.
+        :return: The number of uid entries and the number of distinct uids.
+        """
+        coverage = self._index_coverage.get(index_name)
+        if coverage is None:
+            entries = 0
+            covered: Set[str] = set()
+            for indx_val in self.indexes[index_name].values():
+                if isinstance(indx_val, str):
+                    entries += 1
+                    covered.add(indx_val)
+                else:
+                    entries += len(indx_val)
+                    covered.update(indx_val)
+            coverage = (entries, len(covered))
+            self._index_coverage[index_name] = coverage
+        return coverage
+
+    def sorted_slice(
+        self,
+        index_name: str,
+        start: int,
+        stop: int,
+        reverse: bool = False,
+        uids: Optional[Set[str]] = None,
+    ) -> Optional[List[ITEM]]:
+        """
+        Return a slice of the items ordered by the keys of an index. Items with the same key are ordered by their name.
+        Only the keys up to the end of the slice are visited, thus no item outside of the slice needs to be touched. Only
+        the first slice after a change of the index counts the entries of the whole index.
+
+        :param index_name: The name of the index to order by.
+        :param start: The position of the first item of the slice.
+        :param stop: The position after the last item of the slice.
+        :param reverse: If the order should be descending.
+        :param uids: If given, only these items are considered.
+        :return: The items of the slice or None in case the index can't provide a total order of the collection. This
+                 is the case if the index doesn't exist, has non-str keys, contains an item more than once (list
+                 attributes) or misses items (e.g. unique indexes skip empty values, lazy items aren't indexed yet).
+        """
+        indx_dict = self.indexes.get(index_name)
+        if indx_dict is None:
             return None
+        sorted_keys = self.__sorted_keys(index_name)
+        if len(sorted_keys) != len(indx_dict):
+            return None
+        entries, covered = self.__index_coverage(index_name)
+        if entries != covered or covered != len(self.listing):
+            return None
+
+        result: List[ITEM] = []
+        position = 0
+        for indx_key in reversed(sorted_keys) if reverse else sorted_keys:
+            if position >= stop:
+                break
+            bucket = self.__index_uids(indx_dict, indx_key)
+            if uids is not None:
+                bucket &= uids
+            if position + len(bucket) <= start:
+                position += len(bucket)
+                continue
+            for uid in sorted(
+                bucket, key=lambda uid: self.listing[uid].name, reverse=reverse
+            ):
+                if start <= position < stop:
+                    result.append(self.listing[uid])
+                position += 1
         return result
 
+    def content_hashes(self) -> Dict[str, str]:
+        """
+        Hash the persisted content of every item of the collection. The timestamps are left out, thus two servers which
+        hold the same item produce the same hash, no matter when the item was saved on each of them.
+
+        :return: The hash of every item keyed by its uid.
+        """
+        hashes: Dict[str, str] = {}
+        for uid, obj in list(self.listing.items()):
+            item_dict = {
+                key: value
+                for key, value in obj.serialize().items()
+                if key not in ("ctime", "mtime")
+            }
+            hashes[uid] = hashlib.sha256(
+                json.dumps(item_dict, sort_keys=True, default=str).encode("UTF-8")
+            ).hexdigest()
+        return hashes
+
     @staticmethod
     @abstractmethod
     def collection_type() -> str:
@@ -6,11 +6,23 @@ Repository of the Cobbler object model
 # SPDX-FileCopyrightText: Copyright 2006-2009, Red Hat, Inc and Others
 # SPDX-FileCopyrightText: Michael DeHaan <michael.dehaan AT gmail>
 
+import logging
+import time
 import weakref
-from typing import TYPE_CHECKING, Any, Dict, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ContextManager,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    cast,
+)
 
 from cobbler import serializer, validate
 from cobbler.cexceptions import CX
+from cobbler.cobbler_collections.change_feed import ChangeFeed
 from cobbler.cobbler_collections.collection import Collection
 from cobbler.cobbler_collections.distro_group import DistroGroups
 from cobbler.cobbler_collections.distros import Distros
@@ -58,6 +70,9 @@ class CollectionManager:
 
         self.api = api
         self.__serializer = serializer.Serializer(api)
+        self.change_feed = ChangeFeed()
+        # uid -> (collection, item) of all collections, maintained by the collections under their lock
+        self.__items_by_uid: Dict[str, Tuple["Collection[Any]", "BaseItem"]] = {}
         self._distros = Distros(weakref.proxy(self))
         self._repos = Repos(weakref.proxy(self))
         self._profiles = Profiles(weakref.proxy(self))
@@ -70,6 +85,36 @@ class CollectionManager:
         self._profile_groups = ProfileGroups(weakref.proxy(self))
         self._system_groups = SystemGroups(weakref.proxy(self))
 
+    def register_item(self, collection: "Collection[Any]", item: "BaseItem") -> None:
+        """
+        Make an item that was added to a collection known to :meth:`lookup_uid`.
+
+        .. note:: This method is for internal Cobbler use only.
+
+        :param collection: The collection that holds the item.
+        :param item: The item.
+        """
+        self.__items_by_uid[item.uid] = (collection, item)
+
+    def unregister_item(self, uid: str) -> None:
+        """
+        Forget an item that was removed from its collection.
+
+        .. note:: This method is for internal Cobbler use only.
+
+        :param uid: The uid of the item.
+        """
+        self.__items_by_uid.pop(uid, None)
+
+    def lookup_uid(self, uid: str) -> Optional[Tuple["Collection[Any]", "BaseItem"]]:
+        """
+        Find an item of any collection by its uid.
+
+        :param uid: The uid of the item.
+        :return: The collection and the item or None in case no collection holds an item with this uid.
+        """
+        return self.__items_by_uid.get(uid)
+
     def distros(self) -> Distros:
         """
         Return the definitive copy of the Distros collection
@@ -142,22 +187,32 @@ class CollectionManager:
         """
         return self._system_groups
 
+    def serialize_batch(self) -> ContextManager[None]:
+        """
+        Context manager to save many items at once. All writes inside the context share a single lock and update the
+        global modification time only once.
+
+        :return: The batch context of the serializer.
+        """
+        return self.__serializer.batch()
+
     def serialize(self) -> None:
         """
         Save all cobbler_collections to disk
         """
 
-        self.__serializer.serialize(self._distros)
-        self.__serializer.serialize(self._repos)
-        self.__serializer.serialize(self._profiles)
-        self.__serializer.serialize(self._images)
-        self.__serializer.serialize(self._systems)
-        self.__serializer.serialize(self._menus)
-        self.__serializer.serialize(self._network_interfaces)
-        self.__serializer.serialize(self._templates)
-        self.__serializer.serialize(self._distro_groups)
-        self.__serializer.serialize(self._profile_groups)
-        self.__serializer.serialize(self._system_groups)
+        with self.__serializer.batch():
+            self.__serializer.serialize(self._distros)
+            self.__serializer.serialize(self._repos)
+            self.__serializer.serialize(self._profiles)
+            self.__serializer.serialize(self._images)
+            self.__serializer.serialize(self._systems)
+            self.__serializer.serialize(self._menus)
+            self.__serializer.serialize(self._network_interfaces)
+            self.__serializer.serialize(self._templates)
+            self.__serializer.serialize(self._distro_groups)
+            self.__serializer.serialize(self._profile_groups)
+            self.__serializer.serialize(self._system_groups)
 
     def serialize_one_item(self, item: "BaseItem") -> None:
         """
@@ -202,8 +257,14 @@ class CollectionManager:
         """
         Load all cobbler_collections from disk
 
+        The collections are loaded in the order of their dependencies, so every item can resolve the items it refers
+        to while it is being created.
+
         :raises CX: if there is an error in deserialization
         """
+        logger = logging.getLogger()
+        start_time = time.monotonic()
+        total = 0
         for args in (
             (self._templates, False),
             (self._menus, True),
@@ -217,6 +278,7 @@ class CollectionManager:
             (self._profile_groups, True),
             (self._system_groups, True),
         ):
+            collection_start_time = time.monotonic()
             try:
                 cast_collection = cast(Collection["BaseItem"], args[0])
                 self.__serializer.deserialize(
@@ -227,6 +289,16 @@ class CollectionManager:
                     f"serializer: error loading collection {args[0].collection_type()}: {error}."
                     f"Check your settings!"
                 ) from error
+            total += len(args[0])
+            logger.info(
+                "Loaded %d %s in %.3f seconds",
+                len(args[0]),
+                args[0].collection_types(),
+                time.monotonic() - collection_start_time,
+            )
+        logger.info(
+            "Loaded %d items in %.3f seconds", total, time.monotonic() - start_time
+        )
 
     def deserialize_one_item(self, obj: "BaseItem") -> Dict[str, Any]:
         """
@@ -237,6 +309,30 @@ class CollectionManager:
         collection_type = self.get_items(obj.COLLECTION_TYPE).collection_types()
         return self.__serializer.deserialize_item(collection_type, obj.uid)
 
+    def deserialize_many(
+        self, collection: "Collection[ITEM]", uids: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Load multiple collection items from disk in a single call to the serializer.
+
+        :param collection: The collection the items belong to.
+        :param uids: The uids of the collection items.
+        :return: The dictionaries of the collection items, keyed by their uid.
+        """
+        return self.__serializer.deserialize_many(collection.collection_types(), uids)
+
+    def find_uids_since(
+        self, collection: "Collection[ITEM]", mtime: float
+    ) -> Optional[List[str]]:
+        """
+        Ask the serializer for the items of a collection which were modified since the given time.
+
+        :param collection: The collection to search.
+        :param mtime: The timestamp which marks the gate if an item is included or not.
+        :return: The uids of the matching items or ``None`` if the serializer can't answer this without loading them.
+        """
+        return self.__serializer.find_uids_since(collection.collection_types(), mtime)
+
     def get_items(self, collection_type: str) -> "Collection[BaseItem]":
         """
         Get a full collection of a single type.
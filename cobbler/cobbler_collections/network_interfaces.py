@@ -2,7 +2,7 @@
 Cobbler module that at runtime holds all network interfaces in Cobbler.
 """
 
-from typing import TYPE_CHECKING, Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, List
 
 from cobbler.cexceptions import CX
 from cobbler.cobbler_collections import collection
@@ -52,3 +52,31 @@ class NetworkInterfaces(collection.Collection[network_interface.NetworkInterface
             raise CX(
                 f'An object with that name "{ref.name}" exists already on system {ref.system_uid}. Try "edit"?'
             )
+
+    def find_by_system(
+        self, system_uid: str
+    ) -> List[network_interface.NetworkInterface]:
+        """
+        Return all network interfaces that are attached to a given system.
+
+        If the ``system_uid`` index is enabled the interfaces are looked up directly in it, otherwise this falls back
+        to a regular search over the collection.
+
+        :param system_uid: The UID of the system whose interfaces should be returned.
+        :returns: The interfaces of the system sorted by their name. May be empty.
+        """
+        if "system_uid" not in self.indexes:
+            search_result = self.find(return_list=True, system_uid=system_uid)
+            if not isinstance(search_result, list):
+                raise TypeError("Search result must be of type list!")
+            return sorted(search_result, key=lambda x: x.name)
+
+        if self.api.settings().lazy_start:
+            self._deserialize()
+
+        with self.lock:
+            indx_val = self.indexes["system_uid"].get(system_uid, set())
+            if isinstance(indx_val, str):
+                indx_val = {indx_val}
+            result = [self.listing[uid] for uid in indx_val if uid in self.listing]
+        return sorted(result, key=lambda x: x.name)
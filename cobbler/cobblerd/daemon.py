@@ -8,6 +8,7 @@ import os
 import pwd
 import sys
 import time
+from typing import Union
 
 import systemd.daemon  # type: ignore
 
@@ -66,11 +67,31 @@ def do_xmlrpc_rw(cobbler_api: CobblerAPI, port: int) -> None:
     xinterface = remote.ProxiedXMLRPCInterface(
         cobbler_api, remote.CobblerXMLRPCInterface
     )
-    server = remote.CobblerXMLRPCServer(("127.0.0.1", port))
+    server_settings = cobbler_api.settings().xmlrpc_server
+    gzip_threshold = server_settings.get("gzip_threshold", 1400)
+    if gzip_threshold <= 0:
+        gzip_threshold = None
+    server: Union[remote.CobblerXMLRPCServer, remote.PooledCobblerXMLRPCServer]
+    if server_settings.get("workers", 0) > 0:
+        server = remote.PooledCobblerXMLRPCServer(
+            ("127.0.0.1", port),
+            workers=server_settings["workers"],
+            queue_size=server_settings.get("queue_size", 256),
+            keepalive_timeout=server_settings.get("keepalive_timeout", 15),
+            gzip_threshold=gzip_threshold,
+        )
+    else:
+        server = remote.CobblerXMLRPCServer(
+            ("127.0.0.1", port), gzip_threshold=gzip_threshold
+        )
+    xinterface.proxied.xmlrpc_server = server
+    xinterface.proxied.start_expiry_sweeper()
     # don't log requests; ignore mypy due to multiple inheritance & protocols being 3.8+
     server.logRequests = False  # type: ignore[attr-defined]
     logger.debug("XMLRPC running on %s", port)
     server.register_instance(xinterface)
+    # Allow clients to batch many calls into a single request with "system.multicall"
+    server.register_multicall_functions()
     start_time = ""
     if psutil is not None:
         ps_util = psutil.Process(os.getpid())
@@ -48,11 +48,16 @@ class ConvertableEnum(enum.Enum):
 
 class EventStatus(ConvertableEnum):
     """
-    This enums describes the status an event can have. The cycle is the following:
+    This enums describes the status an event can have. The cycle of a task is the following:
 
-        "Running" --> "Complete" or "Failed"
+        "Queued" --> "Running" --> "Complete" or "Failed"
+        "Queued" --> "Cancelled"
     """
 
+    QUEUED = "queued"
+    """
+    Shows that a task waits for the limits of the background tasks to allow it to run
+    """
     RUNNING = "running"
     """
     Shows that an event is currently being processed by the server
@@ -65,6 +70,10 @@ class EventStatus(ConvertableEnum):
     """
     Shows that an event did not complete as expected
     """
+    CANCELLED = "cancelled"
+    """
+    Shows that a task was cancelled before it was started
+    """
     INFO = "notification"
     """
     Default Event status
@@ -519,13 +519,16 @@ class BaseItem(ABC):
                 result["autoinstall"] = search_result.name
         return result
 
-    def deserialize(self) -> None:
+    def deserialize(self, item_dict: Optional[Dict[str, Any]] = None) -> None:
         """
         Deserializes the object itself and, if necessary, recursively all the objects it depends on.
+
+        :param item_dict: The dictionary of the item if it was already loaded from disk as part of a batch.
         """
         if not self._has_initialized:
             return
-        item_dict = self.api.deserialize_item(self)
+        if item_dict is None:
+            item_dict = self.api.deserialize_item(self)
         self.from_dict(item_dict)
 
     def from_dict(self, dictionary: Dict[Any, Any]) -> None:
@@ -572,9 +572,11 @@ class BootableItem(InheritableItem, ABC):
             return pprint.pformat(raw)
         return raw
 
-    def deserialize(self) -> None:
+    def deserialize(self, item_dict: Optional[Dict[str, Any]] = None) -> None:
         """
         Deserializes the object itself and, if necessary, recursively all the objects it depends on.
+
+        :param item_dict: The dictionary of the item if it was already loaded from disk as part of a batch.
         """
 
         def deserialize_ancestor(ancestor_item_type: str, ancestor_uid: str):
@@ -588,7 +590,8 @@ class BootableItem(InheritableItem, ABC):
         if not self._has_initialized:
             return
 
-        item_dict = self.api.deserialize_item(self)
+        if item_dict is None:
+            item_dict = self.api.deserialize_item(self)
         if item_dict["inmemory"]:
             for (
                 ancestor_item_type,
@@ -617,17 +620,25 @@ class BootableItem(InheritableItem, ABC):
         if not self.api.settings().cache_enabled:
             return
 
-        if name is not None and self._inmemory:
-            attr = getattr(type(self), name[1:])
-            if (
-                isinstance(attr, (InheritableProperty, InheritableDictProperty))
-                and self.api.get_items(self.COLLECTION_TYPE).listing.get(self.uid)
-                is not None
-            ):
-                # Invalidating "resolved" caches
-                for dep_item in self.tree_walk(name):
-                    self.logger.info(dep_item.cache.get_dict_cache(True))
-                    dep_item.cache.set_dict_cache(None, True)
+        if (
+            self._inmemory
+            and name not in ("_ctime", "_mtime")
+            and self.api.get_items(self.COLLECTION_TYPE).listing.get(self.uid)
+            is not None
+        ):
+            # Only plain inheritable values stop at descendants that override them. Dicts are merged with the
+            # values of the parent and all other attributes (e.g. the parent or the arch) may change any resolved
+            # value further down the tree.
+            attribute_name = None
+            if name is not None:
+                attr = getattr(type(self), name[1:], None)
+                if isinstance(attr, InheritableProperty) and not isinstance(
+                    attr, InheritableDictProperty
+                ):
+                    attribute_name = name
+            # Invalidating "resolved" caches
+            for dep_item in self.resolved_dependants(attribute_name):
+                dep_item.cache.set_dict_cache(None, True)
 
         # Invalidating the cache of the object itself.
         self.cache.clean_dict_cache()
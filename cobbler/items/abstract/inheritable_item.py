@@ -376,6 +376,45 @@ class InheritableItem(BaseItem, ABC):
 
         return results
 
+    def resolved_dependants(
+        self, attribute_name: Optional[str] = None
+    ) -> List["InheritableItem"]:
+        """
+        Get all items whose resolved values may be derived from this item. This follows the children of the same type
+        and the "down" direction of ``LOGICAL_INHERITANCE`` (e.g. distro -> profile -> system).
+
+        :param attribute_name: If given, only items inheriting this attribute (and the items below them) are returned.
+                               Items which don't have the attribute at all are always returned.
+        :return: The list of dependant objects.
+        """
+        results: List["InheritableItem"] = []
+        visited = {self.uid}
+        pending: List["InheritableItem"] = [self]
+        while pending:
+            current = pending.pop()
+            dependants: List["InheritableItem"] = list(current.children)
+            hierarchy = self.LOGICAL_INHERITANCE.get(current.COLLECTION_TYPE)
+            if hierarchy is not None:
+                for next_level in hierarchy.down:
+                    dep_type_items = self.api.find_items(
+                        next_level.dependant_item_type,
+                        {next_level.dependant_type_attribute: current.uid},
+                        return_list=True,
+                    )
+                    if isinstance(dep_type_items, list):
+                        dependants.extend(dep_type_items)  # type: ignore
+            for dependant in dependants:
+                if dependant.uid in visited:
+                    continue
+                visited.add(dependant.uid)
+                if attribute_name is not None and hasattr(dependant, attribute_name):
+                    value = getattr(dependant, attribute_name)
+                    if value not in (enums.VALUE_INHERITED, [enums.VALUE_INHERITED]):
+                        continue
+                results.append(dependant)
+                pending.append(dependant)
+        return results
+
     @property
     def descendants(self) -> List["InheritableItem"]:
         """
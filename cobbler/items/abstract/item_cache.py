@@ -30,11 +30,15 @@ class ItemCache:
         In the to_dict case, there is only one cache parameter and only two key values:
          {True:  cache_value or None,
           False: cache_value or None}
+
+        The resolved value is additionally tagged with ``CobblerAPI.resolved_cache_generation``. Bumping the generation
+        invalidates the resolved dicts of all items at once, e.g. after the settings have changed.
         """
         self._cached_dict: Dict[bool, Optional[Dict[str, Any]]] = {
             True: None,
             False: None,
         }
+        self._resolved_generation = 0
 
         self.api = api
         self.settings = api.settings()
@@ -47,6 +51,11 @@ class ItemCache:
         :return: The cache value for the object, or None if not set.
         """
         if self.settings.cache_enabled:
+            if (
+                resolved
+                and self._resolved_generation != self.api.resolved_cache_generation
+            ):
+                return None
             return self._cached_dict[resolved]
         return None
 
@@ -59,6 +68,8 @@ class ItemCache:
         """
         if self.settings.cache_enabled:
             self._cached_dict[resolved] = value
+            if resolved:
+                self._resolved_generation = self.api.resolved_cache_generation
 
     def clean_dict_cache(self):
         """
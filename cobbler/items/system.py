@@ -339,15 +339,8 @@ class System(BootableItem):
         :setter: Accepts not only the correct type but also a dict with dicts which will then be converted by the
                  setter.
         """
-        search_result = self.api.find_network_interface(
-            return_list=True, system_uid=self.uid
-        )
         result: Dict[str, NetworkInterface] = {}
-        if search_result is None:
-            return result
-        if not isinstance(search_result, list):
-            raise TypeError("Result must be of type list!")
-        for item in search_result:
+        for item in self.api.network_interfaces().find_by_system(self.uid):
             result[item.name] = item
         return result
 
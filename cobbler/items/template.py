@@ -144,16 +144,29 @@ class Template(BaseItem):
             # Built-In templates never change. If users edit them, this is undefined behavior.
             return True
         elif self._uri.schema == enums.TemplateSchema.ENVIRONMENT.value:
-            self.__content = os.environ[self._uri.path]
+            self.__set_cached_content(os.environ[self._uri.path])
             return True
         elif self._uri.schema == enums.TemplateSchema.FILE.value:
-            self.__content = (
-                pathlib.Path(self.api.settings().autoinstall_templates_dir)
-                / self._uri.path
-            ).read_text(encoding="UTF-8")
+            self.__set_cached_content(
+                (
+                    pathlib.Path(self.api.settings().autoinstall_templates_dir)
+                    / self._uri.path
+                ).read_text(encoding="UTF-8")
+            )
             return True
         return False
 
+    def __set_cached_content(self, val: str) -> None:
+        """
+        Update the in-memory content of the template. In case the content changed, the compiled templates of the
+        template providers are dropped.
+
+        :param val: The new content of the template.
+        """
+        if val != self.__content:
+            self.api.templar.clear_template_cache()
+        self.__content = val
+
     @property
     def content(self) -> str:
         """
@@ -182,7 +195,7 @@ class Template(BaseItem):
             pathlib.Path(self._uri.path).write_text(val, encoding="UTF-8")
         else:
             raise ValueError("Unspported template type!")
-        self.__content = val
+        self.__set_cached_content(val)
 
     @property
     def uri(self) -> URIOption:
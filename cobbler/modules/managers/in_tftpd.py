@@ -5,14 +5,16 @@ This is some of the code behind 'cobbler sync'.
 # SPDX-License-Identifier: GPL-2.0-or-later
 
 import glob
+import math
+import multiprocessing
 import os.path
 import shutil
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union
 
 from cobbler import utils
 from cobbler.cexceptions import CX
 from cobbler.modules.managers import TftpManagerModule
-from cobbler.utils import filesystem_helpers
+from cobbler.utils import filesystem_helpers, thread
 
 if TYPE_CHECKING:
     from cobbler.api import CobblerAPI
@@ -21,6 +23,15 @@ if TYPE_CHECKING:
 
 
 MANAGER = None
+_FORKED_STATE: Optional[
+    Tuple[
+        "_InTftpdManager",
+        List["System"],
+        Dict[str, Union[str, Dict[str, str]]],
+        bool,
+    ]
+] = None
+"""The arguments of ``_InTftpdManager.write_system_files`` which are inherited by its worker processes."""
 
 
 def register() -> str:
@@ -89,6 +100,7 @@ class _InTftpdManager(TftpManagerModule):
                             filesystem_helpers.mkdir(rnd_path)
                     if not os.path.isfile(filedst):
                         shutil.copyfile(file, filedst)
+                    filesystem_helpers.record_generated_file(filedst)
                     self.logger.info(
                         "copied file %s to %s for %s", file, filedst, distro.name
                     )
@@ -128,6 +140,121 @@ class _InTftpdManager(TftpManagerModule):
         self.api.tftpgen.write_templates(system)
         return 0
 
+    def write_system_files(
+        self,
+        systems: List["System"],
+        menu_items: Dict[str, Union[str, Dict[str, str]]],
+        with_templates: bool = False,
+    ) -> Dict[str, Set[str]]:
+        """
+        Write the boot configuration files of many systems. Depending on the setting ``sync_workers`` the systems are
+        split between forked worker processes. A failing system doesn't stop the generation of the others.
+
+        :param systems: The systems to write the files for.
+        :param menu_items: The menu items as returned by ``tftpgen.get_menu_items()``.
+        :param with_templates: Whether the templates of the systems are written as well.
+        :return: The generated paths by the uid of the system they belong to.
+        :raises CX: Raised after all systems were processed if the files of any system could not be generated.
+        """
+        workers = self.api.settings().sync_workers
+        if workers <= 0:
+            workers = os.cpu_count() or 1
+        workers = min(workers, len(systems))
+        if workers > 1:
+            results = self.__write_system_files_parallel(
+                systems, menu_items, with_templates, workers
+            )
+        else:
+            results = [
+                self._write_single_system_files(system, menu_items, with_templates)
+                for system in systems
+            ]
+
+        generated: Dict[str, Set[str]] = {}
+        failed: List[str] = []
+        for uid, name, paths, error in results:
+            for path in paths:
+                filesystem_helpers.record_generated_file(path)
+            generated[uid] = set(paths)
+            if error:
+                self.logger.error(
+                    'generating boot files for system "%s" failed: %s', name, error
+                )
+                failed.append(name)
+        if failed:
+            raise CX(
+                f"generating boot files failed for the systems: {', '.join(failed)}"
+            )
+        return generated
+
+    def _write_single_system_files(
+        self,
+        system: "System",
+        menu_items: Dict[str, Union[str, Dict[str, str]]],
+        with_templates: bool,
+    ) -> Tuple[str, str, List[str], str]:
+        """
+        Write the boot configuration files of a single system without raising errors.
+
+        :param system: The system to write the files for.
+        :param menu_items: The menu items as returned by ``tftpgen.get_menu_items()``.
+        :param with_templates: Whether the templates of the system are written as well.
+        :return: The uid and name of the system, the generated paths and the error message if the generation failed.
+        """
+        error = ""
+        with filesystem_helpers.record_generated_files() as paths:
+            try:
+                if with_templates:
+                    self.sync_single_system(system, menu_items)
+                else:
+                    self.api.tftpgen.write_all_system_files(system, menu_items)
+            except Exception as exception:  # pylint: disable=broad-except
+                error = f"{type(exception).__name__}: {exception}"
+        return system.uid, system.name, sorted(paths), error
+
+    def __write_system_files_parallel(
+        self,
+        systems: List["System"],
+        menu_items: Dict[str, Union[str, Dict[str, str]]],
+        with_templates: bool,
+        workers: int,
+    ) -> List[Tuple[str, str, List[str], str]]:
+        """
+        Split the systems into chunks and let a pool of forked processes write their files. The workers render from
+        the items as they were when the pool was started. The pool is started while holding the locks of the state the
+        workers use, so no other thread of cobblerd is in the middle of changing it. Every worker writes its files
+        atomically and reports the paths back. The results are in the order of the systems, regardless of which worker
+        finished first.
+
+        :param systems: The systems to write the files for.
+        :param menu_items: The menu items as returned by ``tftpgen.get_menu_items()``.
+        :param with_templates: Whether the templates of the systems are written as well.
+        :param workers: The number of worker processes.
+        :return: The results of ``_write_single_system_files`` for all systems.
+        """
+        global _FORKED_STATE  # pylint: disable=global-statement
+
+        # Several chunks per worker balance systems which are more expensive to render than others.
+        chunk_size = math.ceil(len(systems) / (workers * 4))
+        chunks = [
+            (start, min(start + chunk_size, len(systems)))
+            for start in range(0, len(systems), chunk_size)
+        ]
+        self.logger.info(
+            "generating boot files of %d systems with %d processes",
+            len(systems),
+            workers,
+        )
+        _FORKED_STATE = (self, systems, menu_items, with_templates)
+        try:
+            with thread.fork_locks_held():
+                pool = multiprocessing.get_context("fork").Pool(workers)
+            with pool:
+                chunk_results = pool.map(_write_system_files_worker, chunks, 1)
+        finally:
+            _FORKED_STATE = None
+        return [result for chunk_result in chunk_results for result in chunk_result]
+
     def add_single_distro(self, distro: "Distro") -> None:
         """
         Add a single distribution to the TFTP configuration.
@@ -165,8 +292,7 @@ class _InTftpdManager(TftpManagerModule):
             system_objs.append(system_obj)
 
         menu_items = self.api.tftpgen.get_menu_items()
-        for system in system_objs:
-            self.sync_single_system(system, menu_items)
+        self.write_system_files(system_objs, menu_items, with_templates=True)
 
         self.logger.info("generating PXE menu structure")
         self.api.tftpgen.make_pxe_menu()
@@ -179,6 +305,7 @@ class _InTftpdManager(TftpManagerModule):
         self.api.tftpgen.copy_bootloaders(self.bootloc)
 
         self.logger.info("copying distros to tftpboot")
+        self.api.tftpgen.hash_distro_files(self.distros, self.bootloc, False)
 
         # Adding in the exception handling to not blow up if files have been moved (or the path references an NFS
         # directory that's no longer mounted)
@@ -195,8 +322,7 @@ class _InTftpdManager(TftpManagerModule):
         # the actual pxelinux.cfg files, for each interface
         self.logger.info("generating PXE configuration files")
         menu_items = self.api.tftpgen.get_menu_items()
-        for system in self.systems:
-            self.api.tftpgen.write_all_system_files(system, menu_items)
+        self.write_system_files(list(self.systems), menu_items)
 
         self.logger.info("generating PXE menu structure")
         self.api.tftpgen.make_pxe_menu()
@@ -204,6 +330,27 @@ class _InTftpdManager(TftpManagerModule):
         return 0
 
 
+def _write_system_files_worker(
+    chunk: Tuple[int, int],
+) -> List[Tuple[str, str, List[str], str]]:
+    """
+    Entry point of the worker processes of ``_InTftpdManager.write_system_files``.
+
+    :param chunk: The start and end index of the systems this worker writes the files for.
+    :return: The results of ``_write_single_system_files`` for the systems of the chunk.
+    """
+    if _FORKED_STATE is None:
+        raise RuntimeError("worker process was not forked by write_system_files")
+    manager, systems, menu_items, with_templates = _FORKED_STATE
+    # pylint: disable-next=protected-access
+    return [
+        manager._write_single_system_files(  # type: ignore[reportPrivateUsage]
+            system, menu_items, with_templates
+        )
+        for system in systems[chunk[0] : chunk[1]]
+    ]
+
+
 def get_manager(api: "CobblerAPI") -> _InTftpdManager:
     """
     Creates a manager object to manage an in_tftp server.
@@ -3,7 +3,7 @@ This module contains code to persist the in memory state of Cobbler on a target.
 name of the Python file. Cobbler is currently only tested against the file serializer.
 """
 
-from typing import TYPE_CHECKING, Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
 
 if TYPE_CHECKING:
     from cobbler.api import CobblerAPI
@@ -30,6 +30,23 @@ class StorageBase:
             "The implementation for the configured serializer is missing!"
         )
 
+    def serialize_items(
+        self, collection: "Collection[ITEM]", items: Iterable["ITEM"]
+    ) -> int:
+        """
+        Save multiple items of a single collection to disk. Storage modules should override this to write the items
+        with fewer round trips than calling ``serialize_item()`` for every item.
+
+        :param collection: The Cobbler collection to know the type of the items.
+        :param items: The collection items to serialize.
+        :return: The number of items which were written.
+        """
+        count = 0
+        for item in items:
+            self.serialize_item(collection, item)
+            count += 1
+        return count
+
     def serialize_delete(self, collection: "Collection[ITEM]", item: "ITEM") -> None:
         """
         Delete a collection item from disk.
@@ -89,6 +106,32 @@ class StorageBase:
             "The implementation for the configured serializer is missing!"
         )
 
+    def deserialize_many(
+        self, collection_type: str, uids: Iterable[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get multiple collection items from disk. Storage modules should override this to load the items with fewer
+        round trips than calling ``deserialize_item()`` for every item.
+
+        :param collection_type: The collection type to deserialize.
+        :param uids: The collection item uids to deserialize.
+        :return: The dictionaries of the collection items, keyed by their uid.
+        """
+        return {uid: self.deserialize_item(collection_type, uid) for uid in uids}
+
+    def find_uids_since(
+        self, collection_type: str, mtime: float
+    ) -> Optional[List[str]]:
+        """
+        Find the items which were modified since the given time without loading them.
+
+        :param collection_type: The collection type to search.
+        :param mtime: The timestamp which marks the gate if an item is included or not.
+        :return: The uids of all items which were modified since ``mtime`` or that have no mtime. ``None`` if the
+                 storage module can't answer this without loading the items.
+        """
+        return None
+
 
 def register() -> str:
     """
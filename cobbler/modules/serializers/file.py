@@ -12,9 +12,9 @@ import glob
 import json
 import logging
 import os
-from typing import TYPE_CHECKING, Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
 
-import cobbler.api as capi
 from cobbler.cexceptions import CX
 from cobbler.modules.serializers import StorageBase
 
@@ -48,61 +48,124 @@ class FileSerializer(StorageBase):
         super().__init__(api)
         self.libpath = "/var/lib/cobbler/collections"
 
-    def serialize_item(self, collection: "Collection[ITEM]", item: "ITEM") -> None:
-        if hasattr(item, "built_in") and getattr(item, "built_in") is True:
-            # Don't attempt to serialize templates which are built-in
-            return
+    def __json_options(self) -> Dict[str, Any]:
+        """
+        Read the options for ``json.dumps()`` from the settings.
+
+        :return: The keyword arguments for ``json.dumps()``.
+        """
+        if self.api.settings().serializer_pretty_json:
+            return {"sort_keys": True, "indent": 4}
+        return {"sort_keys": False, "indent": None}
 
-        collection_types = collection.collection_types()
-        filename = os.path.join(self.libpath, collection_types, item.uid + ".json")
+    def __fsync_directory(self, path: str) -> None:
+        """
+        Flush the directory entries of the given directory to the disk, so renames and deletes survive a crash.
 
-        if capi.CobblerAPI().settings().serializer_pretty_json:
-            sort_keys = True
-            indent = 4
-        else:
-            sort_keys = False
-            indent = None
+        :param path: The directory to flush.
+        """
+        directory_fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(directory_fd)
+        finally:
+            os.close(directory_fd)
 
-        _dict = item.serialize()
-        with open(filename, "w", encoding="UTF-8") as file_descriptor:
-            data = json.dumps(_dict, sort_keys=sort_keys, indent=indent)
+    def __write_item(
+        self, path: str, item: "ITEM", json_options: Dict[str, Any], fsync: bool
+    ) -> None:
+        """
+        Atomically write a single item. The JSON is written to a hidden temporary file next to the target which is
+        then renamed over the target, so readers either see the old or the new item but never a truncated file.
+
+        :param path: The directory of the collection.
+        :param item: The item to write.
+        :param json_options: The keyword arguments for ``json.dumps()``.
+        :param fsync: Whether the data is flushed to the disk before the rename.
+        """
+        filename = os.path.join(path, item.uid + ".json")
+        tmp_filename = os.path.join(path, f".{item.uid}.json.tmp")
+        data = json.dumps(item.serialize(), **json_options)
+        with open(tmp_filename, "w", encoding="UTF-8") as file_descriptor:
             file_descriptor.write(data)
+            if fsync:
+                file_descriptor.flush()
+                os.fsync(file_descriptor.fileno())
+        os.replace(tmp_filename, filename)
+
+    def serialize_item(self, collection: "Collection[ITEM]", item: "ITEM") -> None:
+        self.serialize_items(collection, [item])
+
+    def serialize_items(
+        self, collection: "Collection[ITEM]", items: Iterable["ITEM"]
+    ) -> int:
+        path = os.path.join(self.libpath, collection.collection_types())
+        json_options = self.__json_options()
+        fsync = self.api.settings().serializer_fsync
+        count = 0
+        for item in items:
+            if hasattr(item, "built_in") and getattr(item, "built_in") is True:
+                # Don't attempt to serialize templates which are built-in
+                continue
+            self.__write_item(path, item, json_options, fsync)
+            count += 1
+        if fsync and count > 0:
+            # One flush of the directory covers all renames of this batch
+            self.__fsync_directory(path)
+        return count
 
     def serialize_delete(self, collection: "Collection[ITEM]", item: "ITEM") -> None:
-        collection_types = collection.collection_types()
-        filename = os.path.join(self.libpath, collection_types, item.uid + ".json")
+        path = os.path.join(self.libpath, collection.collection_types())
+        filename = os.path.join(path, item.uid + ".json")
 
         if os.path.exists(filename):
             os.remove(filename)
+            if self.api.settings().serializer_fsync:
+                self.__fsync_directory(path)
 
     def serialize(self, collection: "Collection[ITEM]") -> None:
         if collection.collection_type() == "setting":
             # do not serialize settings
             return
-        for item in collection:
-            self.serialize_item(collection, item)
+        self.serialize_items(collection, collection)
 
-    def deserialize_raw(self, collection_type: str) -> List[Dict[str, Any]]:
-        results: List[Dict[str, Any]] = []
+    def __read_file(self, collection_type: str, file: str) -> Dict[str, Any]:
+        """
+        Read and parse a single item file.
+
+        :param collection_type: The collection type the file belongs to.
+        :param file: The path to the JSON file of the item.
+        :return: The dictionary of the item.
+        :raises CX: In case the uid inside the file doesn't match the file name.
+        """
+        uid = os.path.splitext(os.path.basename(file))[0]
+        with open(file, encoding="UTF-8") as file_descriptor:
+            _dict = json.loads(file_descriptor.read())
+        if _dict["uid"] != uid:
+            raise CX(
+                f"The file name {uid}.json does not match the {_dict['uid']} {collection_type}!"
+            )
+        return _dict
 
+    def deserialize_raw(self, collection_type: str) -> List[Dict[str, Any]]:
         path = os.path.join(self.libpath, collection_type)
         all_files = glob.glob(f"{path}/*.json")
-        lazy_start = self.api.settings().lazy_start
-
-        for file in all_files:
-            (uid, _) = os.path.splitext(os.path.basename(file))
-            if lazy_start:
-                _dict = {"uid": uid, "inmemory": False}
-            else:
-                with open(file, encoding="UTF-8") as file_descriptor:
-                    json_data = file_descriptor.read()
-                    _dict = json.loads(json_data)
-                    if _dict["uid"] != uid:
-                        raise CX(
-                            f"The file name {uid}.json does not match the {_dict['uid']} {collection_type}!"
-                        )
-            results.append(_dict)
-        return results  # type: ignore
+
+        if self.api.settings().lazy_start:
+            return [
+                {"uid": os.path.splitext(os.path.basename(file))[0], "inmemory": False}
+                for file in all_files
+            ]
+        if len(all_files) < 2:
+            return [self.__read_file(collection_type, file) for file in all_files]
+
+        # Reading the files is I/O bound, so a pool of threads keeps the disk busy while the results are collected in
+        # the order of the file list.
+        with ThreadPoolExecutor(thread_name_prefix="deserialize") as executor:
+            return list(
+                executor.map(
+                    lambda file: self.__read_file(collection_type, file), all_files
+                )
+            )
 
     def deserialize(
         self, collection: "Collection[ITEM]", topological: bool = True
@@ -142,6 +205,33 @@ class FileSerializer(StorageBase):
         _dict["inmemory"] = True
         return _dict
 
+    def deserialize_many(
+        self, collection_type: str, uids: Iterable[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get multiple collection items from disk. The files are read and parsed in a pool of threads.
+
+        :param collection_type: The collection type to fetch.
+        :param uids: The uids of the collection items.
+        :return: The dictionaries of the items that were found, keyed by their uid.
+        """
+
+        def read(uid: str) -> Optional[Dict[str, Any]]:
+            path = os.path.join(self.libpath, collection_type, f"{uid}.json")
+            if not os.path.exists(path):
+                return None
+            return self.__read_file(collection_type, path)
+
+        uid_list = list(uids)
+        with ThreadPoolExecutor(thread_name_prefix="deserialize") as executor:
+            item_dicts = list(executor.map(read, uid_list))
+        results: Dict[str, Dict[str, Any]] = {}
+        for uid, item_dict in zip(uid_list, item_dicts):
+            if item_dict is not None:
+                item_dict["inmemory"] = True
+                results[uid] = item_dict
+        return results
+
 
 def storage_factory(api: "CobblerAPI") -> FileSerializer:
     """
@@ -8,7 +8,7 @@ Cobbler's Mongo database based object serializer.
 # SPDX-FileCopyrightText: James Cammarata <jimi@sngx.net>
 
 import logging
-from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, Optional
 
 from cobbler.cexceptions import CX
 from cobbler.modules.serializers import StorageBase
@@ -62,6 +62,8 @@ class MongoDBSerializer(StorageBase):
         self.mongodb: Optional["MongoClient[Mapping[str, Any]]"] = None
         self.mongodb_database: Optional["Database[Mapping[str, Any]]"] = None
         self.database_name = "cobbler"
+        # Upper bound for the number of uids of a single "$in" query.
+        self.max_query_uids = 500
         self.__connect()
 
     def __connect(self) -> None:
@@ -192,6 +194,30 @@ class MongoDBSerializer(StorageBase):
         result["inmemory"] = True  # type: ignore
         return result  # type: ignore
 
+    def deserialize_many(
+        self, collection_type: str, uids: Iterable[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get multiple collection items from the database with a single query per chunk.
+
+        :param collection_type: The collection type to fetch.
+        :param uids: The uids of the collection items.
+        :return: The dictionaries of the items that were found, keyed by their uid.
+        """
+        if self.mongodb_database is None:
+            raise ValueError("Database not available!")
+
+        mongodb_collection = self.mongodb_database[collection_type]
+        uid_list = list(uids)
+        results: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(uid_list), self.max_query_uids):
+            chunk = uid_list[start : start + self.max_query_uids]
+            for result in mongodb_collection.find({"uid": {"$in": chunk}}):
+                self._remove_id(result)
+                result["inmemory"] = True  # type: ignore
+                results[result["uid"]] = result  # type: ignore
+        return results
+
     @staticmethod
     def _remove_id(_dict: Mapping[str, Any]):
         if "_id" in _dict:
@@ -9,7 +9,7 @@ import json
 import logging
 import os
 import sqlite3
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set
 
 from cobbler.cexceptions import CX
 from cobbler.modules.serializers import StorageBase
@@ -48,14 +48,28 @@ class SQLiteSerializer(StorageBase):
            uid  TEXT PRIMARY KEY,    // uid from item.uid
            item TEXT                 // JSON representation of an object
        )
+
+    The database is used in WAL mode. Frequently queried fields of the JSON representation are covered by expression
+    indexes (see ``indexed_fields``), so queries like :meth:`find_uids_since` are answered without loading the items.
     """
 
+    # Fields of the JSON representation that get an expression index. The fields for "*" are indexed in every table.
+    indexed_fields: Dict[str, List[str]] = {
+        "*": ["name", "mtime"],
+        "systems": ["profile"],
+        "network_interfaces": ["mac_address", "ipv4.address"],
+    }
+    synchronous_levels = ("OFF", "NORMAL", "FULL", "EXTRA")
+
     def __init__(self, api: "CobblerAPI"):
         super().__init__(api)
         self.logger = logging.getLogger()
         self.connection: Optional[sqlite3.Connection] = None
         self.arraysize = 1000
+        # Upper bound for the number of bind variables of a single "IN (...)" query.
+        self.max_bind_vars = 500
         self.database_file = "/var/lib/cobbler/collections/collections.db"
+        self.__indexed_tables: Set[str] = set()
 
     def __connect(self) -> None:
         """
@@ -96,6 +110,37 @@ class SQLiteSerializer(StorageBase):
                 'Database with name "{%s}" was not found and will be created.',
                 self.database_file,
             )
+        self.__indexed_tables = set()
+        self.__configure_journal()
+
+    def __configure_journal(self) -> None:
+        """
+        Switch the database to WAL mode and apply the configured synchronous level. In WAL mode readers don't block the
+        writer, and with ``synchronous=NORMAL`` a commit doesn't wait for the disk anymore.
+
+        :raises CX: In case the configured synchronous level is unknown.
+        """
+        synchronous = str(
+            self.api.settings().sqlite.get("synchronous", "NORMAL")
+        ).upper()
+        if synchronous not in self.synchronous_levels:
+            raise CX(
+                f'Unknown SQLite synchronous level "{synchronous}"! Valid levels are: '
+                f"{', '.join(self.synchronous_levels)}"
+            )
+        try:
+            journal_mode = self.connection.execute("PRAGMA journal_mode=WAL").fetchone()[0]  # type: ignore
+            self.connection.execute(f"PRAGMA synchronous={synchronous}")  # type: ignore # nosec
+        except sqlite3.DatabaseError as error:
+            raise CX(
+                f'Unable to configure SQLite database "{self.database_file}": {error}'
+            ) from error
+        if journal_mode != "wal":
+            self.logger.warning(
+                'SQLite database "%s" could not be switched to WAL mode, using "%s".',
+                self.database_file,
+                journal_mode,
+            )
 
     def __create_table(self, table_name: str) -> None:
         """
@@ -107,6 +152,31 @@ class SQLiteSerializer(StorageBase):
             self.connection.execute(f"CREATE TABLE {table_name}(uid text primary key, item text)")  # type: ignore
         except sqlite3.DatabaseError as error:
             raise CX(f'Unable to create table "{table_name}": {error}') from error
+        self.__indexed_tables.discard(table_name)
+
+    def __create_indexes(self, table_name: str) -> None:
+        """
+        Create the expression indexes for the table if they don't exist yet. This also covers tables created by older
+        versions of Cobbler.
+
+        :param table_name: The table name.
+        """
+        if table_name in self.__indexed_tables:
+            return
+        fields = self.indexed_fields["*"] + self.indexed_fields.get(table_name, [])
+        try:
+            for field in fields:
+                index_name = f"{table_name}_{field.replace('.', '_')}"
+                self.connection.execute(  # type: ignore
+                    f"CREATE INDEX IF NOT EXISTS {index_name} "  # nosec
+                    f"ON {table_name}(json_extract(item, '$.{field}'))"
+                )
+            self.connection.commit()  # type: ignore
+        except sqlite3.DatabaseError as error:
+            raise CX(
+                f'Unable to create indexes for table "{table_name}": {error}'
+            ) from error
+        self.__indexed_tables.add(table_name)
 
     def __is_table_exists(self, table_name: str) -> bool:
         """
@@ -137,6 +207,7 @@ class SQLiteSerializer(StorageBase):
         self.__connect()
         if not self.__is_table_exists(table_name):
             self.__create_table(table_name)
+        self.__create_indexes(table_name)
         try:
             self.connection.executemany(  # type: ignore
                 f"INSERT INTO {table_name}(uid, item) "  # nosec
@@ -148,22 +219,18 @@ class SQLiteSerializer(StorageBase):
         except sqlite3.DatabaseError as error:
             raise CX(f'Unable to upsert into table "{table_name}": {error}') from error
 
-    def __build_bind_vars(self, item: "BaseItem") -> Dict[str, str]:
+    def __build_bind_vars(
+        self, item: "BaseItem", json_options: Dict[str, Any]
+    ) -> Dict[str, str]:
         """
         Build the bind variables for Insert/Update.
 
         :param item: The object for Insert/Update.
+        :param json_options: The keyword arguments for ``json.dumps()``.
         :return: The bind variables dict.
         """
-        if self.api.settings().serializer_pretty_json:
-            sort_keys = True
-            indent = 4
-        else:
-            sort_keys = False
-            indent = None
-
         _dict = item.serialize()
-        data = json.dumps(_dict, sort_keys=sort_keys, indent=indent)
+        data = json.dumps(_dict, **json_options)
         return {"uid": item.uid, "item": data}
 
     def serialize_item(self, collection: "Collection[ITEM]", item: "ITEM") -> None:
@@ -173,17 +240,33 @@ class SQLiteSerializer(StorageBase):
         :param collection: The Cobbler collection to know the type of the item.
         :param item: The collection item to serialize.
         """
-        if not item.name:
-            raise CX("name unset for item!")
+        self.serialize_items(collection, [item])
 
-        if hasattr(item, "built_in") and getattr(item, "built_in") is True:
-            # Don't attempt to serialize templates which are built-in
-            return
+    def serialize_items(
+        self, collection: "Collection[ITEM]", items: Iterable["ITEM"]
+    ) -> int:
+        """
+        Save multiple items of a collection with a single prepared statement and a single commit.
 
-        self.__connect()
-        self.__upsert_items(
-            collection.collection_types(), [self.__build_bind_vars(item)]
-        )
+        :param collection: The Cobbler collection to know the type of the items.
+        :param items: The collection items to serialize.
+        :return: The number of items which were written.
+        """
+        if self.api.settings().serializer_pretty_json:
+            json_options: Dict[str, Any] = {"sort_keys": True, "indent": 4}
+        else:
+            json_options = {"sort_keys": False, "indent": None}
+
+        bind_vars: List[Optional[Dict[str, str]]] = []
+        for item in items:
+            if not item.name:
+                raise CX("name unset for item!")
+            if hasattr(item, "built_in") and getattr(item, "built_in") is True:
+                # Don't attempt to serialize templates which are built-in
+                continue
+            bind_vars.append(self.__build_bind_vars(item, json_options))
+        self.__upsert_items(collection.collection_types(), bind_vars)
+        return len(bind_vars)
 
     def serialize(self, collection: "Collection[ITEM]") -> None:
         """
@@ -191,12 +274,7 @@ class SQLiteSerializer(StorageBase):
 
         :param collection: The collection to serialize.
         """
-        self.__connect()
-        ctype = collection.collection_types()
-        bind_vars: List[Optional[Dict[str, str]]] = []
-        for item in collection:
-            bind_vars.append(self.__build_bind_vars(item))
-        self.__upsert_items(ctype, bind_vars)
+        self.serialize_items(collection, collection)
 
     def serialize_delete(self, collection: "Collection[ITEM]", item: "ITEM") -> None:
         """
@@ -306,6 +384,70 @@ class SQLiteSerializer(StorageBase):
         _dict["inmemory"] = True
         return _dict
 
+    def deserialize_many(
+        self, collection_type: str, uids: Iterable[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get multiple collection items with as few queries as possible.
+
+        :param collection_type: The collection type to deserialize.
+        :param uids: The collection item uids to deserialize.
+        :return: The dictionaries of the items that were found, keyed by their uid.
+        """
+        self.__connect()
+        results: Dict[str, Dict[str, Any]] = {}
+        if not self.__is_table_exists(collection_type):
+            return results
+
+        uid_list = list(uids)
+        for start in range(0, len(uid_list), self.max_bind_vars):
+            chunk = uid_list[start : start + self.max_bind_vars]
+            placeholders = ", ".join("?" for _ in chunk)
+            try:
+                cursor = self.connection.execute(  # type: ignore
+                    f"SELECT uid, item FROM {collection_type} "  # nosec
+                    f"WHERE uid IN ({placeholders})",
+                    chunk,
+                )
+            except sqlite3.DatabaseError as error:
+                raise CX(
+                    f'Unable to SELECT from table "{collection_type}": {error}'  # nosec
+                ) from error
+            cursor.arraysize = self.arraysize
+            for uid, item in cursor.fetchall():
+                _dict = json.loads(item)
+                _dict["inmemory"] = True
+                results[uid] = _dict
+        return results
+
+    def find_uids_since(
+        self, collection_type: str, mtime: float
+    ) -> Optional[List[str]]:
+        """
+        Find the items which were modified since the given time with the help of the mtime expression index.
+
+        :param collection_type: The collection type to search.
+        :param mtime: The timestamp which marks the gate if an item is included or not.
+        :return: The uids of all items which were modified since ``mtime`` or that have no mtime.
+        """
+        self.__connect()
+        if not self.__is_table_exists(collection_type):
+            return []
+        self.__create_indexes(collection_type)
+        try:
+            cursor = self.connection.execute(  # type: ignore
+                f"SELECT uid FROM {collection_type} "  # nosec
+                "WHERE json_extract(item, '$.mtime') >= :mtime "
+                "OR json_extract(item, '$.mtime') = 0",
+                {"mtime": mtime},
+            )
+        except sqlite3.DatabaseError as error:
+            raise CX(
+                f'Unable to SELECT from table "{collection_type}": {error}'  # nosec
+            ) from error
+        cursor.arraysize = self.arraysize
+        return [result[0] for result in cursor.fetchall()]
+
 
 def storage_factory(api: "CobblerAPI") -> SQLiteSerializer:
     """
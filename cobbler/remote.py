@@ -123,13 +123,18 @@ V2.8.5
 # SPDX-FileCopyrightText: Michael DeHaan <michael.dehaan AT gmail>
 
 import base64
+import contextlib
 import errno
 import fcntl
 import keyword
 import logging
+import math
 import os
+import queue
 import random
 import re
+import selectors
+import socket
 import stat
 import threading
 import time
@@ -144,7 +149,7 @@ from typing import (
     List,
     NamedTuple,
     Optional,
-    Sequence,
+    Set,
     Tuple,
     Type,
     Union,
@@ -153,6 +158,7 @@ from typing import (
 from xmlrpc.server import SimpleXMLRPCRequestHandler
 
 from cobbler import enums, utils
+from cobbler.api import RenderedFile
 from cobbler.cexceptions import CX
 from cobbler.items import network_interface, system
 from cobbler.items.abstract import base_item
@@ -160,7 +166,8 @@ from cobbler.items.abstract import bootable_item as item
 from cobbler.items.abstract.inheritable_item import InheritableItem
 from cobbler.utils import signatures
 from cobbler.utils.event import CobblerEvent
-from cobbler.utils.thread import CobblerThread
+from cobbler.utils.expiry import ExpiryQueue
+from cobbler.utils.thread import CobblerThread, TaskExecutor
 from cobbler.validate import (
     validate_autoinstall_script_name,
     validate_obj_name,
@@ -183,6 +190,7 @@ if TYPE_CHECKING:
 
 EVENT_TIMEOUT = 7 * 24 * 60 * 60  # 1 week
 CACHE_TIMEOUT = 10 * 60  # 10 minutes
+EXPIRY_SWEEP_INTERVAL = 60  # 1 minute
 
 
 class TransactionItemModifications(NamedTuple):
@@ -237,11 +245,27 @@ class CobblerXMLRPCInterface:
         self.transactions: Dict[str, Dict[str, TransactionTuple]] = {}
         self.timestamp = self.api.last_modified_time()
         self.events: Dict[str, CobblerEvent] = {}
+        self.token_expiry = ExpiryQueue(
+            self.token_cache,
+            lambda entry: entry[0],
+            lambda: self.api.settings().auth_token_expiration,
+        )
+        self.unsaved_items_expiry = ExpiryQueue(
+            self.unsaved_items, lambda entry: entry.time, lambda: CACHE_TIMEOUT
+        )
+        self.events_expiry = ExpiryQueue(
+            self.events, lambda entry: entry.statetime, lambda: float(EVENT_TIMEOUT)
+        )
         self.shared_secret = utils.get_shared_secret()
+        self.task_executor = TaskExecutor(api)
         random.seed(time.time())
         # Semaphore that suspends the execution of the background_load_items when the execution
         # of any command or any other task begins until it finishes.
         self.load_items_lock = threading.Semaphore()
+        # The server that dispatches the requests to this interface. Set by the daemon once it has been started.
+        self.xmlrpc_server: Optional[
+            Union["CobblerXMLRPCServer", "PooledCobblerXMLRPCServer"]
+        ] = None
 
     def check(self, token: str) -> List[str]:
         """
@@ -315,7 +339,7 @@ class CobblerXMLRPCInterface:
         """
         Run a full Cobbler sync in the background.
 
-        :param options: Possible options: verbose, dhcp, dns
+        :param options: Possible options: verbose, dhcp, dns, incremental
         :param token: The API-token obtained via the login() method. The API-token obtained via the login() method.
         :return: The id of the task which was started.
         """
@@ -328,7 +352,11 @@ class CobblerXMLRPCInterface:
                 what.append("dhcp")
             if self.options.get("dns", False):
                 what.append("dns")
-            self.remote.api.sync(self.options.get("verbose", False), what=what)
+            self.remote.api.sync(
+                self.options.get("verbose", False),
+                what=what,
+                incremental=self.options.get("incremental", False),
+            )
 
         return self.__start_task(runner, token, "sync", "Sync", options)
 
@@ -596,15 +624,15 @@ class CobblerXMLRPCInterface:
                 return
 
             for item_type in item_types:
-                count = 0
                 begin_time = time.time()
                 collection = self.api.get_items(item_type)
-                # "collection.py" implement the "__iter__" method, so we can just directly iterate over the items
-                for item_obj in collection:
-                    count += 1
+                uids = list(collection.listing.keys())
+                count = len(uids)
+                batch_size = collection.deserialize_batch_size
+                for start in range(0, count, batch_size):
+                    # Live XML-RPC requests hold the lock, so loading yields to them between the batches.
                     with lock:
-                        if not item_obj.inmemory:
-                            item_obj.deserialize()
+                        collection.deserialize_many(uids[start : start + batch_size])
                 if count > 0:
                     collection.inmemory = True
                     collections_types = collection.collection_types()
@@ -749,6 +777,7 @@ class CobblerXMLRPCInterface:
         """
         new_event = CobblerEvent(name=name, statetime=time.time())
         self.events[new_event.event_id] = new_event
+        self.events_expiry.push(new_event.event_id)
         return new_event
 
     def __start_task(
@@ -761,7 +790,7 @@ class CobblerXMLRPCInterface:
         on_done: Optional[Callable[["CobblerThread"], None]] = None,
     ):
         """
-        Starts a new background task.
+        Queues a new background task. It is started as soon as the limits of the background tasks allow it.
 
         :param thr_obj_fn: function handle to run in a background thread
         :param token: The API-token obtained via the login() method. The API-token obtained via the login() method. All
@@ -781,15 +810,30 @@ class CobblerXMLRPCInterface:
         thr_obj = CobblerThread(
             new_event.event_id, self, options, role_name, self.api, thr_obj_fn, on_done
         )
-        thr_obj.start()
+        self.task_executor.submit(thr_obj)
         return new_event.event_id
 
+    def cancel_task(self, event_id: str, token: str) -> bool:
+        """
+        Cancel a background task which is still queued. Tasks which are already running can't be cancelled.
+
+        :param event_id: The unique id of the task.
+        :param token: The API-token obtained via the login() method.
+        :return: True if the task was cancelled.
+        """
+        self.check_access(token, "cancel_task")
+        if not isinstance(event_id, str):  # type: ignore
+            raise TypeError('"event_id" must be of type str!')
+        self._log(f"cancel_task({event_id})", token=token)
+        return self.task_executor.cancel(event_id)
+
     def get_task_status(self, event_id: str) -> List[Union[str, float, List[str]]]:
         """
         Get the current status of the task.
 
         :param event_id: The unique id of the task.
-        :return: The event status.
+        :return: The event status. The state of a task is one of "queued", "running", "complete", "failed" or
+                 "cancelled".
         """
         if not isinstance(event_id, str):  # type: ignore
             raise TypeError('"event_id" must be of type str!')
@@ -917,20 +961,19 @@ class CobblerXMLRPCInterface:
 
     def __paginate(
         self,
-        data: Sequence["ITEM"],
-        page: int = 1,
-        items_per_page: int = 25,
-        token: Optional[str] = None,
-    ) -> Tuple[Sequence["ITEM"], Dict[str, Union[List[int], int]]]:
+        num_items: int,
+        page: Any = 1,
+        items_per_page: Any = 25,
+    ) -> Tuple[int, int, Dict[str, Union[List[int], int]]]:
         """
         Helper function to support returning parts of a selection, for example, for use in a web app where only a part
         of the results are to be presented on each screen.
 
-        :param data: The data to paginate.
+        :param num_items: The number of items in the selection.
         :param page: The page to show.
         :param items_per_page: The number of items per page.
-        :param token: The API-token obtained via the login() method.
-        :return: The paginated items.
+        :return: The position of the first item of the page, the position after the last item of the page and the
+                 information about the page.
         """
         default_page = 1
         default_items_per_page = 25
@@ -948,7 +991,6 @@ class CobblerXMLRPCInterface:
         except Exception:
             items_per_page = default_items_per_page
 
-        num_items = len(data)
         num_pages = ((num_items - 1) // items_per_page) + 1
         if num_pages == 0:
             num_pages = 1
@@ -960,7 +1002,6 @@ class CobblerXMLRPCInterface:
             start_item = num_items - 1
         if end_item > num_items:
             end_item = num_items
-        data = data[start_item:end_item]
 
         if page > 1:
             prev_page = page - 1
@@ -972,7 +1013,8 @@ class CobblerXMLRPCInterface:
             next_page = -1
 
         return (
-            data,
+            start_item,
+            end_item,
             {
                 "page": page,
                 "prev_page": prev_page,
@@ -1395,15 +1437,96 @@ class CobblerXMLRPCInterface:
         target_obj: "Template" = self.__get_object(uid, token=token)  # type: ignore
         return target_obj.content
 
-    def get_items(self, what: str) -> List[Dict[str, Any]]:
+    def __page_items(
+        self,
+        what: str,
+        criteria: Optional[Dict[str, Any]],
+        sort_field: Optional[str],
+        page: Any,
+        items_per_page: Any,
+    ) -> Tuple[List["BaseItem"], Dict[str, Union[List[int], int]]]:
+        """
+        Select the items of a single page. If the collection has an index for the sort field, the page is read in index
+        order and only the items on the page are touched. Otherwise all matching items need to be sorted.
+
+        :param what: The object type to page through.
+        :param criteria: The criteria the items need to match. None selects all items.
+        :param sort_field: The field to sort the items after. If it starts with "!" then this sorts backwards. The name
+                           is used if nothing is given.
+        :param page: The page to return.
+        :param items_per_page: The number of items per page.
+        :return: The items of the page and the information about the page.
+        """
+        collection = self.api.get_items(what)
+        items: Optional[List["BaseItem"]] = None
+        uids: Optional[Set[str]] = None
+        if criteria is None:
+            num_items = len(collection)
+        else:
+            items = self.api.find_items(what, criteria=criteria) or []  # type: ignore
+            uids = {x.uid for x in items}  # type: ignore
+            num_items = len(items)  # type: ignore
+        start, end, pageinfo = self.__paginate(num_items, page, items_per_page)
+
+        index_name = sort_field or "name"
+        reverse = index_name.startswith("!")
+        page_items: Optional[List["BaseItem"]] = collection.sorted_slice(  # type: ignore
+            index_name.lstrip("!"), start, end, reverse, uids
+        )
+        if page_items is None:
+            page_items = self.__sort(  # type: ignore
+                collection if items is None else items, sort_field  # type: ignore
+            )[start:end]
+        return page_items, pageinfo  # type: ignore
+
+    @staticmethod
+    def __item_dicts(
+        items: Iterable["BaseItem"],
+        resolved: bool = False,
+        fields: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Convert items to their dict representation.
+
+        :param items: The items to convert.
+        :param resolved: If the resolved representation of the items should be returned instead of the raw data.
+        :param fields: If given, only these keys are returned for every item.
+        :return: The dicts of the items.
+        """
+        item_dicts = [x.to_dict(resolved=resolved) for x in items]
+        if fields:
+            return [
+                {field: item_dict[field] for field in fields if field in item_dict}
+                for item_dict in item_dicts
+            ]
+        return item_dicts
+
+    def get_items(
+        self,
+        what: str,
+        page: Any = None,
+        results_per_page: Any = None,
+        fields: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
         """
         Individual list elements are the same for get_item.
 
         :param what: is the name of a Cobbler object type, as described for get_item.
+        :param page: If given, only this page of the items ordered by name is returned.
+        :param results_per_page: The number of items per page. Defaults to 25 if only the page is given.
+        :param fields: If given, only these keys are returned for every item, e.g. ``["name", "profile"]``.
         :return: This returns a list of dicts.
         """
-        items = [x.to_dict() for x in self.api.get_items(what)]
-        return self.xmlrpc_hacks(items)  # type: ignore
+        items: Iterable["BaseItem"]
+        # Some clients pass the token as the first positional argument of the get_* methods, thus only numbers request
+        # a page.
+        if not any(str(value).isdigit() for value in (page, results_per_page)):
+            items = self.api.get_items(what)
+        else:
+            items, _ = self.__page_items(
+                what, None, None, page or 1, results_per_page or 25
+            )
+        return self.xmlrpc_hacks(self.__item_dicts(items, fields=fields))  # type: ignore
 
     def get_item_names(self, what: str) -> List[str]:
         """
@@ -1419,198 +1542,220 @@ class CobblerXMLRPCInterface:
         page: Any = None,
         results_per_page: Any = None,
         token: Optional[str] = None,
+        fields: Optional[List[str]] = None,
         **rest: Any,
     ) -> List[Dict[str, Any]]:
         """
         This returns all distributions.
 
-        :param page: This parameter is not used currently.
-        :param results_per_page: This parameter is not used currently.
+        :param page: If given, only this page of the items ordered by name is returned.
+        :param results_per_page: The number of items per page. Defaults to 25 if only the page is given.
         :param token: The API-token obtained via the login() method. The API-token obtained via the login() method.
+        :param fields: If given, only these keys are returned for every item.
         :param rest: This parameter is not used currently.
         :return: The list with all distros.
         """
-        return self.get_items("distro")
+        return self.get_items("distro", page, results_per_page, fields)
 
     def get_profiles(
         self,
         page: Any = None,
         results_per_page: Any = None,
         token: Optional[str] = None,
+        fields: Optional[List[str]] = None,
         **rest: Any,
     ) -> List[Dict[str, Any]]:
         """
         This returns all profiles.
 
-        :param page: This parameter is not used currently.
-        :param results_per_page: This parameter is not used currently.
+        :param page: If given, only this page of the items ordered by name is returned.
+        :param results_per_page: The number of items per page. Defaults to 25 if only the page is given.
         :param token: The API-token obtained via the login() method. The API-token obtained via the login() method.
+        :param fields: If given, only these keys are returned for every item.
         :param rest: This parameter is not used currently.
         :return: The list with all profiles.
         """
-        return self.get_items("profile")
+        return self.get_items("profile", page, results_per_page, fields)
 
     def get_systems(
         self,
         page: Any = None,
         results_per_page: Any = None,
         token: Optional[str] = None,
+        fields: Optional[List[str]] = None,
         **rest: Any,
     ) -> List[Dict[str, Any]]:
         """
         This returns all Systems.
 
-        :param page: This parameter is not used currently.
-        :param results_per_page: This parameter is not used currently.
+        :param page: If given, only this page of the items ordered by name is returned.
+        :param results_per_page: The number of items per page. Defaults to 25 if only the page is given.
         :param token: The API-token obtained via the login() method. The API-token obtained via the login() method.
+        :param fields: If given, only these keys are returned for every item.
         :param rest: This parameter is not used currently.
         :return: The list of all systems.
         """
-        return self.get_items("system")
+        return self.get_items("system", page, results_per_page, fields)
 
     def get_repos(
         self,
         page: Any = None,
         results_per_page: Any = None,
         token: Optional[str] = None,
+        fields: Optional[List[str]] = None,
         **rest: Any,
     ) -> List[Dict[str, Any]]:
         """
         This returns all repositories.
 
-        :param page: This parameter is not used currently.
-        :param results_per_page: This parameter is not used currently.
+        :param page: If given, only this page of the items ordered by name is returned.
+        :param results_per_page: The number of items per page. Defaults to 25 if only the page is given.
         :param token: The API-token obtained via the login() method. The API-token obtained via the login() method.
+        :param fields: If given, only these keys are returned for every item.
         :param rest: This parameter is not used currently.
         :return: The list of all repositories.
         """
-        return self.get_items("repo")
+        return self.get_items("repo", page, results_per_page, fields)
 
     def get_images(
         self,
         page: Any = None,
         results_per_page: Any = None,
         token: Optional[str] = None,
+        fields: Optional[List[str]] = None,
         **rest: Any,
     ) -> List[Dict[str, Any]]:
         """
         This returns all images.
 
-        :param page: This parameter is not used currently.
-        :param results_per_page: This parameter is not used currently.
+        :param page: If given, only this page of the items ordered by name is returned.
+        :param results_per_page: The number of items per page. Defaults to 25 if only the page is given.
         :param token: The API-token obtained via the login() method. The API-token obtained via the login() method.
+        :param fields: If given, only these keys are returned for every item.
         :param rest: This parameter is not used currently.
         :return: The list of all images.
         """
-        return self.get_items("image")
+        return self.get_items("image", page, results_per_page, fields)
 
     def get_menus(
         self,
         page: Any = None,
         results_per_page: Any = None,
         token: Optional[str] = None,
+        fields: Optional[List[str]] = None,
         **rest: Any,
     ) -> List[Dict[str, Any]]:
         """
         This returns all menus.
 
-        :param page: This parameter is not used currently.
-        :param results_per_page: This parameter is not used currently.
+        :param page: If given, only this page of the items ordered by name is returned.
+        :param results_per_page: The number of items per page. Defaults to 25 if only the page is given.
         :param token: The API-token obtained via the login() method.
+        :param fields: If given, only these keys are returned for every item.
         :param rest: This parameter is not used currently.
         :return: The list of all files.
         """
-        return self.get_items("menu")
+        return self.get_items("menu", page, results_per_page, fields)
 
     def get_network_interfaces(
         self,
         page: Any = None,
         results_per_page: Any = None,
         token: Optional[str] = None,
+        fields: Optional[List[str]] = None,
         **rest: Any,
     ) -> List[Dict[str, Any]]:
         """
         This returns all network interfaces.
 
-        :param page: This parameter is not used currently.
-        :param results_per_page: This parameter is not used currently.
+        :param page: If given, only this page of the items ordered by name is returned.
+        :param results_per_page: The number of items per page. Defaults to 25 if only the page is given.
         :param token: The API-token obtained via the login() method.
+        :param fields: If given, only these keys are returned for every item.
         :param rest: This parameter is not used currently.
         :return: The list of all files.
         """
-        return self.get_items("network_interface")
+        return self.get_items("network_interface", page, results_per_page, fields)
 
     def get_templates(
         self,
         page: Any = None,
         results_per_page: Any = None,
         token: Optional[str] = None,
+        fields: Optional[List[str]] = None,
         **rest: Any,
     ) -> List[Dict[str, Any]]:
         """
         This returns all templates.
 
-        :param page: This parameter is not used currently.
-        :param results_per_page: This parameter is not used currently.
+        :param page: If given, only this page of the items ordered by name is returned.
+        :param results_per_page: The number of items per page. Defaults to 25 if only the page is given.
         :param token: The API-token obtained via the login() method.
+        :param fields: If given, only these keys are returned for every item.
         :param rest: This parameter is not used currently.
         :return: The list of all files.
         """
-        return self.get_items("template")
+        return self.get_items("template", page, results_per_page, fields)
 
     def get_distro_groups(
         self,
         page: Any = None,
         results_per_page: Any = None,
         token: Optional[str] = None,
+        fields: Optional[List[str]] = None,
         **rest: Any,
     ) -> List[Dict[str, Any]]:
         """
         This returns all distro groups.
 
-        :param page: This parameter is not used currently.
-        :param results_per_page: This parameter is not used currently.
+        :param page: If given, only this page of the items ordered by name is returned.
+        :param results_per_page: The number of items per page. Defaults to 25 if only the page is given.
         :param token: The API-token obtained via the login() method.
+        :param fields: If given, only these keys are returned for every item.
         :param rest: This parameter is not used currently.
         :return: The list of all distro groups.
         """
-        return self.get_items("distro_group")
+        return self.get_items("distro_group", page, results_per_page, fields)
 
     def get_profile_groups(
         self,
         page: Any = None,
         results_per_page: Any = None,
         token: Optional[str] = None,
+        fields: Optional[List[str]] = None,
         **rest: Any,
     ) -> List[Dict[str, Any]]:
         """
         This returns all profile groups.
 
-        :param page: This parameter is not used currently.
-        :param results_per_page: This parameter is not used currently.
+        :param page: If given, only this page of the items ordered by name is returned.
+        :param results_per_page: The number of items per page. Defaults to 25 if only the page is given.
         :param token: The API-token obtained via the login() method.
+        :param fields: If given, only these keys are returned for every item.
         :param rest: This parameter is not used currently.
         :return: The list of all profile groups.
         """
-        return self.get_items("profile_group")
+        return self.get_items("profile_group", page, results_per_page, fields)
 
     def get_system_groups(
         self,
         page: Any = None,
         results_per_page: Any = None,
         token: Optional[str] = None,
+        fields: Optional[List[str]] = None,
         **rest: Any,
     ) -> List[Dict[str, Any]]:
         """
         This returns all system groups.
 
-        :param page: This parameter is not used currently.
-        :param results_per_page: This parameter is not used currently.
+        :param page: If given, only this page of the items ordered by name is returned.
+        :param results_per_page: The number of items per page. Defaults to 25 if only the page is given.
         :param token: The API-token obtained via the login() method.
+        :param fields: If given, only these keys are returned for every item.
         :param rest: This parameter is not used currently.
         :return: The list of all system groups.
         """
-        return self.get_items("system_group")
+        return self.get_items("system_group", page, results_per_page, fields)
 
     def find_items(
         self,
@@ -1897,6 +2042,7 @@ class CobblerXMLRPCInterface:
         items_per_page: int = 25,
         resolved: bool = False,
         token: Optional[str] = None,
+        fields: Optional[List[str]] = None,
     ):
         """
         Returns a list of dicts as with find_items but additionally supports returning just a portion of the total
@@ -1904,27 +2050,29 @@ class CobblerXMLRPCInterface:
 
         :param what: The object type to find.
         :param criteria: The criteria a distribution needs to match.
-        :param sort_field: The field to sort the results after.
+        :param sort_field: The field to sort the results after. Sorting by an indexed field only touches the items on
+                           the requested page.
         :param page: The page to return
         :param items_per_page: The number of items per page.
         :param resolved: This only has an effect when ``expand = True``. It returns the resolved representation of the
                          object instead of the raw data.
         :param token: The API-token obtained via the login() method.
+        :param fields: If given, only these keys are returned for every item.
         :return: The found items.
         """
         self._log(
             f"find_items_paged({what}); criteria({criteria}); sort({sort_field})",
             token=token,
         )
-        items: Iterable["BaseItem"]
-        if criteria is None:
-            items = self.api.get_items(what)
-        else:
-            items = self.api.find_items(what, criteria=criteria)  # type: ignore[assignment]
-        items = self.__sort(items, sort_field)  # type: ignore
-        items, pageinfo = self.__paginate(items, page, items_per_page)  # type: ignore
-        items = [x.to_dict(resolved=resolved) for x in items]  # type: ignore
-        return self.xmlrpc_hacks({"items": items, "pageinfo": pageinfo})
+        items, pageinfo = self.__page_items(
+            what, criteria, sort_field, page, items_per_page
+        )
+        return self.xmlrpc_hacks(
+            {
+                "items": self.__item_dicts(items, resolved=resolved, fields=fields),
+                "pageinfo": pageinfo,
+            }
+        )
 
     def has_item(self, what: str, name: str, token: Optional[str] = None):
         """
@@ -2718,6 +2866,7 @@ class CobblerXMLRPCInterface:
             )
             return new_item.uid
         self.unsaved_items[new_item.uid] = UnsavedItemsTuple(time.time(), new_item)
+        self.unsaved_items_expiry.push(new_item.uid)
         return new_item.uid
 
     def new_distro(self, token: str) -> str:
@@ -3513,27 +3662,17 @@ class CobblerXMLRPCInterface:
         self._log("is_autoinstall_in_use", token=token)
         return self.api.is_autoinstall_in_use(ai)
 
-    def generate_autoinstall(
+    def __render_autoinstall(
         self,
         obj_identifier: str = "",
         obj_type: str = "profile",
         obj_field: str = "name",
         autoinstaller_file: str = "",
         autoinstaller_subfile: str = "",
-    ) -> str:
+    ) -> "RenderedFile":
         """
-        Generate the auto-installation file and return it.
-
-        :param obj_identifier: The identifier of the object to generate the file for.
-        :param obj_type: Must be either the str "profile" or "system".
-        :param obj_field: Must be either the str "name" or "uid".
-        :param autoinstaller_type: All currently available types can be found at
-            :class:`cobbler.enums.AutoinstallerType`. Please use the string values as an argument to this endpoint.
-        :param autoinstaller_file: TODO
-        :param autoinstaller_subfile: TODO
-        :return: The str representation of the file.
+        Look up the object and template for ``generate_autoinstall()`` and render the file through the cache of the API.
         """
-        self._log("generate_autoinstall")
         if obj_type not in ("profile", "system"):
             raise ValueError("Incorrect obj_type for generate_autoinstall!")
         if obj_field not in ("name", "uid"):
@@ -3554,12 +3693,77 @@ class CobblerXMLRPCInterface:
             )
         if search_result_template is None or isinstance(search_result_template, list):
             raise ValueError("Ambigous or no search result for template!")
-        return self.api.generate_autoinstall(
-            obj=search_result,
-            autoinstall_template=search_result_template,  # type: ignore
-            autoinstaller_subfile=autoinstaller_subfile,
+        return self.api.render_cached(
+            "autoinstall",
+            search_result,  # type: ignore
+            autoinstaller_subfile,
+            search_result_template,  # type: ignore
         )
 
+    def __render_boot_file(
+        self,
+        generator: str,
+        profile: Optional[str] = None,
+        image: Optional[str] = None,
+        system: Optional[str] = None,
+        name: str = "",
+    ) -> "RenderedFile":
+        """
+        Render an iPXE config, a boot.cfg or a script through the cache of the API. The system wins over the profile and
+        the profile wins over the image. Requests that don't name an existing object, like the iPXE menu, are generated
+        without being cached.
+        """
+        for obj_type, obj_name in (
+            ("system", system),
+            ("profile", profile),
+            ("image", image if generator == "ipxe" else None),
+        ):
+            if not obj_name:
+                continue
+            obj = self.api.find_items(
+                obj_type, criteria={"name": obj_name}, return_list=False
+            )
+            if obj is None or isinstance(obj, list):
+                break
+            return self.api.render_cached(generator, obj, name)  # type: ignore
+
+        if generator == "ipxe":
+            content = self.api.generate_ipxe(profile, image, system)  # type: ignore
+        elif generator == "bootcfg":
+            content = self.api.generate_bootcfg(profile or "", system or "")
+        else:
+            content = self.api.generate_script(profile, system, name)
+        return RenderedFile("", 0.0, content)
+
+    def generate_autoinstall(
+        self,
+        obj_identifier: str = "",
+        obj_type: str = "profile",
+        obj_field: str = "name",
+        autoinstaller_file: str = "",
+        autoinstaller_subfile: str = "",
+    ) -> str:
+        """
+        Generate the auto-installation file and return it.
+
+        :param obj_identifier: The identifier of the object to generate the file for.
+        :param obj_type: Must be either the str "profile" or "system".
+        :param obj_field: Must be either the str "name" or "uid".
+        :param autoinstaller_type: All currently available types can be found at
+            :class:`cobbler.enums.AutoinstallerType`. Please use the string values as an argument to this endpoint.
+        :param autoinstaller_file: TODO
+        :param autoinstaller_subfile: TODO
+        :return: The str representation of the file.
+        """
+        self._log("generate_autoinstall")
+        return self.__render_autoinstall(
+            obj_identifier,
+            obj_type,
+            obj_field,
+            autoinstaller_file,
+            autoinstaller_subfile,
+        ).content
+
     def generate_ipxe(
         self,
         profile: Optional[str] = None,
@@ -3577,7 +3781,7 @@ class CobblerXMLRPCInterface:
         :return: The configuration as a str representation.
         """
         self._log("generate_ipxe")
-        return self.api.generate_ipxe(profile, image, system)  # type: ignore
+        return self.__render_boot_file("ipxe", profile, image, system).content
 
     def generate_bootcfg(
         self, profile: Optional[str] = None, system: Optional[str] = None, **rest: Any
@@ -3591,9 +3795,7 @@ class CobblerXMLRPCInterface:
         :return: The generated bootcfg.
         """
         self._log("generate_bootcfg")
-        profile_name = "" if profile is None else profile
-        system_name = "" if system is None else system
-        return self.api.generate_bootcfg(profile_name, system_name)
+        return self.__render_boot_file("bootcfg", profile, None, system).content
 
     def generate_script(
         self,
@@ -3614,7 +3816,46 @@ class CobblerXMLRPCInterface:
         if not validate_autoinstall_script_name(name):
             raise ValueError('"name" handed to generate_script was not valid!')
         self._log(f'generate_script, name is "{name}"')
-        return self.api.generate_script(profile, system, name)
+        return self.__render_boot_file("script", profile, None, system, name).content
+
+    def generate_file(
+        self, generator: str, arguments: Dict[str, Any], if_none_match: str = ""
+    ) -> Dict[str, Any]:
+        """
+        Generate an autoinstallation file, an iPXE config, a boot.cfg or a script together with the validators for HTTP
+        caching. Unchanged files are served from memory and in case the client already has the current version, the
+        content is not transferred at all.
+
+        :param generator: One of "autoinstall", "ipxe", "bootcfg" or "script".
+        :param arguments: The keyword arguments of the matching ``generate_*`` method.
+        :param if_none_match: The value of the "If-None-Match" header of the client.
+        :return: A dict with the keys "etag", "last_modified", "not_modified" and "content". The "etag" is empty if the
+                 file must not be cached and "content" is empty if "not_modified" is True.
+        :raises ValueError: In case the generator is unknown or the script name is invalid.
+        """
+        self._log(f'generate_file, generator is "{generator}"')
+        if generator == "autoinstall":
+            rendered_file = self.__render_autoinstall(**arguments)
+        elif generator in ("ipxe", "bootcfg", "script"):
+            if generator == "script" and not validate_autoinstall_script_name(
+                arguments.get("name", "")
+            ):
+                raise ValueError('"name" handed to generate_file was not valid!')
+            rendered_file = self.__render_boot_file(generator, **arguments)
+        else:
+            raise ValueError(f'Unknown generator "{generator}"!')
+        client_etags = {
+            etag.strip().removeprefix("W/") for etag in if_none_match.split(",")
+        }
+        not_modified = rendered_file.etag != "" and (
+            rendered_file.etag in client_etags or "*" in client_etags
+        )
+        return {
+            "etag": rendered_file.etag,
+            "last_modified": rendered_file.last_modified,
+            "not_modified": not_modified,
+            "content": "" if not_modified else rendered_file.content,
+        }
 
     def dump_vars(
         self, item_uuid: str, formatted_output: bool = False, remove_dicts: bool = True
@@ -4245,6 +4486,26 @@ class CobblerXMLRPCInterface:
         self._log("version", token=token)
         return self.api.version(extended=True)  # type: ignore
 
+    def get_xmlrpc_server_status(self, token: str) -> Dict[str, Any]:
+        """
+        Returns the load of the XML-RPC server. For the worker pool server this contains the number of workers, the
+        number of busy workers, the depth of the connection queue and the time connections waited for a worker. The
+        number of login tokens, unsaved items and events held in memory as well as the number of queued and running
+        background tasks is always part of the status.
+
+        :param token: The API-token obtained via the login() method.
+        :return: The status of the server. Only the in-memory counts are returned if the server is not known.
+        """
+        self.check_access(token, "get_xmlrpc_server_status")
+        status: Dict[str, Any] = {}
+        if self.xmlrpc_server is not None:
+            status = self.xmlrpc_server.status()
+        status["tokens"] = len(self.token_cache)
+        status["unsaved_items"] = len(self.unsaved_items)
+        status["events"] = len(self.events)
+        status.update(self.task_executor.status())
+        return status
+
     def get_distros_since(
         self, mtime: float
     ) -> Union[List[Any], Dict[Any, Any], int, str, float]:
@@ -4377,6 +4638,97 @@ class CobblerXMLRPCInterface:
         data = self.api.get_system_groups_since(mtime, collapse=True)
         return self.xmlrpc_hacks(data)
 
+    def get_changes(
+        self,
+        since_revision: int = 0,
+        types: Optional[List[str]] = None,
+        epoch: str = "",
+        expand: bool = False,
+        token: Optional[str] = None,
+    ) -> Union[List[Any], Dict[Any, Any], int, str, float]:
+        """
+        Return the changes to items since a revision of the change feed, including the deletions.
+
+        A client starts with a full sync, remembers the returned "epoch" and "revision" and from then on only asks for
+        the changes after that revision. If "complete" is False, the requested changes are not available anymore (the
+        change feed is bounded and starts over with every restart of the daemon) and the client has to do a full sync
+        again.
+
+        :param since_revision: The last revision the client has seen.
+        :param types: The collection types to return changes for, e.g. ``["system", "profile"]``. All if not given.
+        :param epoch: The epoch the revision belongs to. If it doesn't match the current epoch, "complete" is False.
+        :param expand: Add the current dict of every item which still exists as "item".
+        :param token: The API-token obtained via the login() method.
+        :return: A dict with the keys "epoch", "revision", "complete" and "changes". Every change has the keys
+                 "revision", "type", "operation" (add, modify, rename or delete), "uid", "name", "old_name" and
+                 "mtime".
+        """
+        self._log(f"get_changes({since_revision})", token=token)
+        current_epoch, revision, changes = self.api.get_changes(since_revision, types)
+        if epoch and epoch != current_epoch:
+            changes = None
+        result: List[Dict[str, Any]] = []
+        for change in changes or []:
+            change_dict: Dict[str, Any] = {
+                "revision": change.revision,
+                "type": change.collection_type,
+                "operation": change.operation,
+                "uid": change.uid,
+                "name": change.name,
+                "old_name": change.old_name,
+                "mtime": change.mtime,
+            }
+            if expand and change.operation != "delete":
+                obj = self.api.get_items(change.collection_type).listing.get(change.uid)
+                if obj is not None:
+                    change_dict["item"] = obj.to_dict()
+            result.append(change_dict)
+        return self.xmlrpc_hacks(
+            {
+                "epoch": current_epoch,
+                "revision": revision,
+                "complete": changes is not None,
+                "changes": result,
+            }
+        )
+
+    def get_item_hashes(
+        self, what: str, digest: str = "", token: Optional[str] = None
+    ) -> Union[List[Any], Dict[Any, Any], int, str, float]:
+        """
+        Summarize the content of a collection so a replica only has to transfer the items that differ.
+
+        :param what: The collection type to summarize, e.g. "system".
+        :param digest: The digest of the collection the caller already holds. If it matches, the hashes of the single
+                       items are left out.
+        :param token: The API-token obtained via the login() method.
+        :return: A dict with the keys "digest" (of the whole collection) and "hashes" (the content hash of every item
+                 keyed by its uid, empty if the digest matched).
+        """
+        self._log(f"get_item_hashes({what})", token=token)
+        current_digest, hashes = self.api.get_item_hashes(what)
+        if digest == current_digest:
+            hashes = {}
+        return self.xmlrpc_hacks({"digest": current_digest, "hashes": hashes})
+
+    def get_items_by_uid(
+        self, what: str, uids: List[str], token: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Return the items with the given uids in the form they are persisted in, thus they can be recreated from the
+        dicts. Uids which don't exist (anymore) are skipped.
+
+        :param what: The collection type of the items, e.g. "system".
+        :param uids: The uids of the items.
+        :param token: The API-token obtained via the login() method.
+        :return: The dicts of the items.
+        """
+        self._log(f"get_items_by_uid({what})", token=token)
+        listing = self.api.get_items(what).listing
+        return self.xmlrpc_hacks(  # type: ignore
+            [listing[uid].serialize() for uid in uids if uid in listing]
+        )
+
     def get_repos_compatible_with_profile(
         self, profile: str, token: Optional[str] = None, **rest: Any
     ) -> List[Dict[Any, Any]]:
@@ -4726,6 +5078,7 @@ class CobblerXMLRPCInterface:
         """
         b64 = self.__get_random(25)
         self.token_cache[b64] = (time.time(), user)
+        self.token_expiry.push(b64)
         return b64
 
     @staticmethod
@@ -4744,24 +5097,34 @@ class CobblerXMLRPCInterface:
 
     def __invalidate_expired_tokens(self) -> None:
         """
-        Deletes any login tokens that might have expired. Also removes expired events.
+        Deletes any login tokens that might have expired. Also removes expired unsaved items and events. Only the
+        entries whose deadline has passed are visited.
         """
         timenow = time.time()
-        for token in list(self.token_cache.keys()):
-            tokentime, _ = self.token_cache[token]
-            if timenow > tokentime + self.api.settings().auth_token_expiration:
-                self._log("expiring token", token=token, debug=True)
-                del self.token_cache[token]
+        for token in self.token_expiry.expire(timenow):
+            self._log("expiring token", token=token, debug=True)
         # and also expired objects
-        for oid in list(self.unsaved_items.keys()):
-            tokentime, _ = self.unsaved_items[oid]
-            if timenow > tokentime + CACHE_TIMEOUT:
-                del self.unsaved_items[oid]
-        for tid in list(self.events.keys()):
-            event = self.events[tid]
-            if timenow > event.statetime + float(EVENT_TIMEOUT):
-                del self.events[tid]
-            # logfile cleanup should be dealt w/ by logrotate
+        self.unsaved_items_expiry.expire(timenow)
+        # logfile cleanup should be dealt w/ by logrotate
+        self.events_expiry.expire(timenow)
+
+    def start_expiry_sweeper(self, interval: float = EXPIRY_SWEEP_INTERVAL) -> None:
+        """
+        Start a background thread that removes expired tokens, unsaved items and events periodically. Without it they
+        are only removed by authenticated calls.
+
+        :param interval: The number of seconds between two sweeps.
+        """
+
+        def sweep() -> None:
+            while True:
+                time.sleep(interval)
+                try:
+                    self.__invalidate_expired_tokens()
+                except Exception:
+                    self.logger.exception("Expiring tokens failed")
+
+        threading.Thread(target=sweep, name="expiry-sweeper", daemon=True).start()
 
     def __validate_user(self, input_user: str, input_password: str) -> bool:
         """
@@ -5060,6 +5423,258 @@ class CobblerXMLRPCInterface:
         self.check_access(token, "get_tftp_file")
         return self.api.get_tftp_file(path, offset, size)
 
+    @staticmethod
+    def __bulk_result(
+        object_id: str, error: Optional[Exception] = None
+    ) -> Dict[str, Any]:
+        """
+        Helper function. Build the result of a single operation of one of the bulk methods.
+
+        :param object_id: The id of the object the operation was executed for.
+        :param error: The error that occurred while executing the operation, if any.
+        :return: The dictionary that is returned to the XML-RPC client.
+        """
+        return {
+            "object_id": object_id,
+            "success": error is None,
+            "error": "" if error is None else str(error),
+        }
+
+    def __discard_new_item(self, object_id: str, token: str) -> None:
+        """
+        Helper function. Forget an unsaved object handle again, e.g. after an error while it was set up.
+
+        :param object_id: The id of the unsaved object.
+        :param token: The API-token obtained via the login() method.
+        """
+        if token in self.transactions:
+            self.transactions[token].pop(object_id, None)
+        self.unsaved_items.pop(object_id, None)
+
+    def __commit_bulk(
+        self,
+        items: Dict[str, TransactionTuple],
+        results: Dict[str, Dict[str, Any]],
+        with_triggers: bool = True,
+        with_sync: bool = True,
+    ) -> None:
+        """
+        Helper function. Persist the collected operations of a bulk method with a single call to
+        ``CobblerAPI.add_remove_items()``. The PXE menu is thus only rebuilt once for all items.
+
+        :param items: The operations to execute, keyed by the object id.
+        :param results: The results of the bulk method. In case the commit did not succeed, the entries of ``items``
+                        which did not reach their collection are marked as failed.
+        :param with_triggers: If triggers should be run for the items.
+        :param with_sync: If the PXE configuration should be rebuilt for the items.
+        """
+        if len(items) == 0:
+            return
+        try:
+            self.api.add_remove_items(
+                list(items.values()), with_triggers=with_triggers, with_sync=with_sync
+            )
+        except Exception as error:
+            utils.log_exc()
+            for object_id, item in items.items():
+                listing = self.api.get_items(item.what).listing
+                if item.to_delete:
+                    committed = item.ref.uid not in listing
+                else:
+                    committed = listing.get(item.ref.uid) is item.ref
+                if not committed and object_id in results:
+                    results[object_id] = self.__bulk_result(object_id, error)
+
+    def new_items(
+        self,
+        what: str,
+        items: List[Dict[str, Any]],
+        token: str,
+        is_subobject: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Creates multiple new objects in a single call. For every object this is the same as calling ``new_item()``
+        followed by ``modify_item()`` for each of its attributes. The objects are persisted with ``save_items()``.
+
+        :param what: The type of the objects to create.
+        :param items: One dictionary per object with the attribute names as keys. Nested attributes are separated by
+                      a dot (e.g. "ipv4.address").
+        :param token: The API-token obtained via the login() method.
+        :param is_subobject: If the objects are subobjects of already existing objects or not.
+        :return: One result per object in the order of ``items``. Each result contains the "object_id" of the new
+                 object, whether the object was set up successfully ("success") and otherwise the "error".
+        """
+        self._log(f"new_items({what}, count={len(items)})", token=token)
+        results: List[Dict[str, Any]] = []
+        for attributes in items:
+            object_id = ""
+            try:
+                object_id = self.new_item(what, token, is_subobject)
+                for attribute, arg in attributes.items():
+                    if not self.modify_item(
+                        what, object_id, attribute.split("."), arg, token
+                    ):
+                        raise ValueError(f'Unknown attribute "{attribute}"!')
+            except Exception as error:
+                self.__discard_new_item(object_id, token)
+                results.append(self.__bulk_result("", error))
+                continue
+            results.append(self.__bulk_result(object_id))
+        return results
+
+    def modify_items(
+        self,
+        what: str,
+        modifications: List[List[Any]],
+        token: str,
+    ) -> List[Dict[str, Any]]:
+        """
+        Applies multiple modifications in a single call. Every modification is executed like ``modify_item()``.
+
+        :param what: The type of the objects to modify.
+        :param modifications: A list of ``[object_id, attribute, arg]`` triples. The attribute is either a list of
+                              attribute names or a dot-separated string.
+        :param token: The API-token obtained via the login() method.
+        :return: One result per modification in the order of ``modifications``. Each result contains the
+                 "object_id", whether the modification was successful ("success") and otherwise the "error".
+        """
+        self._log(f"modify_items({what}, count={len(modifications)})", token=token)
+        results: List[Dict[str, Any]] = []
+        for object_id, attribute, arg in modifications:
+            if isinstance(attribute, str):
+                attribute = attribute.split(".")
+            try:
+                if not self.modify_item(what, object_id, attribute, arg, token):
+                    raise ValueError(f'Unknown attribute "{".".join(attribute)}"!')
+            except Exception as error:
+                results.append(self.__bulk_result(object_id, error))
+                continue
+            results.append(self.__bulk_result(object_id))
+        return results
+
+    def save_items(
+        self,
+        what: str,
+        object_ids: List[str],
+        with_triggers: bool = True,
+        with_sync: bool = True,
+        editmode: str = "bypass",
+        token: str = "",
+    ) -> List[Dict[str, Any]]:
+        """
+        Saves multiple newly created or modified objects in a single call. All valid objects are persisted together
+        and the PXE menu is rebuilt once at the end. Inside a transaction the objects are saved on commit.
+
+        :param what: The type of the objects which shall be saved.
+        :param object_ids: The ids of the objects to save.
+        :param with_triggers: If triggers should be run during save. Set to False to suppress per-save triggers.
+        :param with_sync: If a Cobbler sync should be executed after save. Set to False to suppress per-save syncs.
+        :param editmode: The mode which shall be used to persist the changes. Currently "new" and "bypass" are
+                         supported.
+        :param token: The API-token obtained via the login() method.
+        :return: One result per object in the order of ``object_ids``. Each result contains the "object_id", whether
+                 the object was saved successfully ("success") and otherwise the "error".
+        """
+        self._log(f"save_items({what}, count={len(object_ids)})", token=token)
+        results: Dict[str, Dict[str, Any]] = {}
+        to_save: Dict[str, TransactionTuple] = {}
+        new_names: Set[str] = set()
+        for object_id in object_ids:
+            try:
+                obj = cast(InheritableItem, self.__get_object(object_id, token))
+                self.check_access(token, f"save_{what}", obj.name)
+                if token not in self.transactions or (
+                    object_id not in self.transactions[token]
+                ):
+                    obj.check_if_valid()
+                    if editmode == "new":
+                        if obj.name in new_names:
+                            raise CX(
+                                f'An object with that name "{obj.name}" is saved twice.'
+                            )
+                        self.api.get_items(what).check_for_duplicate_names(obj)  # type: ignore
+                        new_names.add(obj.name)
+                    to_save[object_id] = TransactionTuple(
+                        what, obj, False, obj.mtime, "", []
+                    )
+            except Exception as error:
+                results[object_id] = self.__bulk_result(object_id, error)
+                continue
+            results[object_id] = self.__bulk_result(object_id)
+        self.__commit_bulk(to_save, results, with_triggers, with_sync)
+        for object_id in to_save:
+            if results[object_id]["success"]:
+                self.unsaved_items.pop(object_id, None)
+        return [results[object_id] for object_id in object_ids]
+
+    def remove_items(
+        self,
+        what: str,
+        names: List[str],
+        token: str,
+        recursive: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        Deletes multiple items of a collection in a single call. All items are removed together and the PXE menu is
+        rebuilt once at the end. Inside a transaction the items are removed on commit.
+
+        :param what: The item type of the items to remove.
+        :param names: The names of the items to remove.
+        :param token: The API-token obtained via the login() method.
+        :param recursive: If items which are depending on these ones should be erased too.
+        :return: One result per name in the order of ``names``. Each result contains the "object_id" of the item (or
+                 the name if the item could not be found), whether it was removed successfully ("success") and
+                 otherwise the "error".
+        """
+        self._log(
+            f"remove_items({what}, count={len(names)}, recursive={recursive})",
+            token=token,
+        )
+        if token in self.transactions:
+            results: List[Dict[str, Any]] = []
+            for name in names:
+                try:
+                    if not self.remove_item(what, name, token, recursive):
+                        raise ValueError(f'Item "{name}" not found!')
+                except Exception as error:
+                    results.append(self.__bulk_result(name, error))
+                    continue
+                results.append(self.__bulk_result(name))
+            return results
+
+        name_results: Dict[str, Dict[str, Any]] = {}
+        to_remove: Dict[str, TransactionTuple] = {}
+        for name in names:
+            try:
+                object_id = self.get_item_handle(what, name, token)
+                obj = cast(InheritableItem, self.__get_object(object_id, token))
+                self.check_access(token, f"remove_{what}", obj.name)
+            except Exception as error:
+                name_results[name] = self.__bulk_result(name, error)
+                continue
+            name_results[name] = self.__bulk_result(object_id)
+            if object_id in self.unsaved_items:
+                self.unsaved_items.pop(object_id)
+                continue
+            to_remove[object_id] = TransactionTuple(
+                what, obj, True, obj.mtime, obj.uid, []
+            )
+            if recursive:
+                for child in self._transaction_descendants(token, obj):
+                    to_remove[child.uid] = TransactionTuple(
+                        child.COLLECTION_TYPE, child, True, child.mtime, child.uid, []
+                    )
+        results_by_id = {
+            result["object_id"]: result
+            for result in name_results.values()
+            if result["success"]
+        }
+        self.__commit_bulk(to_remove, results_by_id)
+        return [
+            results_by_id.get(name_results[name]["object_id"], name_results[name])
+            for name in names
+        ]
+
     def transaction_begin(self, token: str) -> bool:
         """
         Begins a new transaction for the logged-in client.
@@ -5115,6 +5730,16 @@ class RequestHandler(SimpleXMLRPCRequestHandler):
     Custom request handler class for our XML-RPC server. This provides custom headers to allow usage behind proxies.
     """
 
+    def setup(self) -> None:
+        """
+        Apply the gzip threshold of the server before the connection is set up. Responses larger than the threshold
+        are compressed if the client accepts gzip.
+        """
+        self.encode_threshold = getattr(
+            self.server, "gzip_threshold", self.encode_threshold
+        )
+        super().setup()
+
     def do_OPTIONS(self) -> None:
         """
         Set the HTTP status code for all of our reponses that we send and set the custom headers.
@@ -5135,23 +5760,326 @@ class RequestHandler(SimpleXMLRPCRequestHandler):
         SimpleXMLRPCRequestHandler.end_headers(self)
 
 
+class KeepAliveRequestHandler(RequestHandler):
+    """
+    Request handler for the worker pool server. It speaks HTTP/1.1, so clients can send multiple requests over one
+    connection. Unlike the other request handlers it doesn't handle the connection when it is created: the worker pool
+    calls :meth:`handle_ready` whenever a request arrives and parks the connection while it is idle, so idle
+    connections don't occupy a worker.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    # pylint: disable-next=super-init-not-called
+    def __init__(self, request: Any, client_address: Any, server: Any) -> None:
+        """
+        Set up the connection without handling a request yet.
+
+        :param request: The socket of the connection.
+        :param client_address: The address of the client.
+        :param server: The server the connection was accepted by.
+        """
+        self.request = request
+        self.client_address = client_address
+        self.server = server
+        self.close_connection = True
+        self.setup()
+
+    def setup(self) -> None:
+        """
+        Apply the keep-alive timeout of the server to the socket of the connection. It limits how long a started
+        request may stall.
+        """
+        self.timeout = getattr(self.server, "keepalive_timeout", None)
+        super().setup()
+
+    def handle_ready(self) -> bool:
+        """
+        Handle the next request of the connection and all further requests that already arrived.
+
+        :return: True if the connection is idle and stays open, False if it has to be closed.
+        """
+        self.handle_one_request()
+        while not self.close_connection:
+            if not self.__input_pending():
+                return True
+            self.handle_one_request()
+        return False
+
+    def __input_pending(self) -> bool:
+        """
+        Check without blocking if the client already sent more data, which may be buffered by the reader already.
+
+        :return: True if a read would not block.
+        """
+        self.connection.setblocking(False)
+        try:
+            return len(self.rfile.peek(1)) > 0  # type: ignore
+        except OSError:
+            return False
+        finally:
+            self.connection.settimeout(self.timeout)
+
+
 class CobblerXMLRPCServer(ThreadingMixIn, xmlrpc.server.SimpleXMLRPCServer):
     """
     This is the class for the main Cobbler XMLRPC Server. This class does not directly contain all XMLRPC methods. It
     just starts the server.
     """
 
-    def __init__(self, args: Any) -> None:
+    # Listen backlog of the socket. The default of five drops connections as soon as a few clients connect at once.
+    request_queue_size = 128
+
+    def __init__(self, args: Any, gzip_threshold: Optional[int] = 1400) -> None:
         """
         The constructor for the main Cobbler XMLRPC server.
 
         :param args: Arguments which are handed to the Python XMLRPC server.
+        :param gzip_threshold: Responses larger than this number of bytes are compressed. None disables compression.
         """
         self.allow_reuse_address = True
+        self.gzip_threshold = gzip_threshold
         xmlrpc.server.SimpleXMLRPCServer.__init__(
             self, args, requestHandler=RequestHandler
         )
 
+    def status(self) -> Dict[str, Any]:
+        """
+        Describe the current load of the server.
+
+        :return: The mode of the server and the number of threads of the daemon.
+        """
+        return {"mode": "threading", "active_threads": threading.active_count()}
+
+
+class PooledCobblerXMLRPCServer(xmlrpc.server.SimpleXMLRPCServer):
+    """
+    Cobbler XMLRPC Server that handles the connections with a fixed number of worker threads instead of a new thread
+    per connection. Accepted connections wait in a bounded queue for a free worker. If the queue is full the server
+    stops accepting connections until a worker is free again, so the load is pushed back to the listen backlog of the
+    socket. Between two requests a keep-alive connection is watched by a poller thread instead of a worker. It is queued
+    again once the next request arrives and closed if it stays idle for the keep-alive timeout.
+    """
+
+    # Listen backlog of the socket, see CobblerXMLRPCServer.
+    request_queue_size = 128
+
+    def __init__(
+        self,
+        args: Any,
+        workers: int,
+        queue_size: int,
+        keepalive_timeout: Optional[float] = 15.0,
+        gzip_threshold: Optional[int] = 1400,
+    ) -> None:
+        """
+        The constructor for the worker pool Cobbler XMLRPC server.
+
+        :param args: Arguments which are handed to the Python XMLRPC server.
+        :param workers: The number of worker threads.
+        :param queue_size: The number of accepted connections which may wait for a worker.
+        :param keepalive_timeout: Seconds after which an idle keep-alive connection is closed.
+        :param gzip_threshold: Responses larger than this number of bytes are compressed. None disables compression.
+        """
+        if workers < 1:
+            raise ValueError("The worker pool needs at least one worker!")
+        self.allow_reuse_address = True
+        self.keepalive_timeout = keepalive_timeout
+        self.gzip_threshold = gzip_threshold
+        self.connection_queue: (
+            "queue.Queue[Optional[Tuple[Union[socket.socket, KeepAliveRequestHandler], Any, float]]]"
+        ) = queue.Queue(maxsize=max(queue_size, 1))
+        self.__stats_lock = threading.Lock()
+        self.__selector = selectors.DefaultSelector()
+        self.__idle: List[KeepAliveRequestHandler] = []
+        self.__idle_lock = threading.Lock()
+        self.__wakeup_read, self.__wakeup_write = socket.socketpair()
+        self.__wakeup_read.setblocking(False)
+        self.__wakeup_write.setblocking(False)
+        self.__selector.register(self.__wakeup_read, selectors.EVENT_READ)
+        self.__closing = False
+        self.active_workers = 0
+        self.idle_connections = 0
+        self.handled_connections = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+        xmlrpc.server.SimpleXMLRPCServer.__init__(
+            self, args, requestHandler=KeepAliveRequestHandler
+        )
+        self.workers = [
+            threading.Thread(
+                target=self.__worker, name=f"xmlrpc-worker-{index}", daemon=True
+            )
+            for index in range(workers)
+        ]
+        for worker in self.workers:
+            worker.start()
+        self.poller = threading.Thread(
+            target=self.__poll_idle, name="xmlrpc-poller", daemon=True
+        )
+        self.poller.start()
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        """
+        Hand an accepted connection over to the worker pool. Blocks while the queue is full.
+
+        :param request: The socket of the connection.
+        :param client_address: The address of the client.
+        """
+        self.connection_queue.put((request, client_address, time.monotonic()))
+
+    def __worker(self) -> None:
+        """
+        Main loop of a worker thread. Handles the requests of queued connections until it receives None.
+        """
+        while True:
+            entry = self.connection_queue.get()
+            if entry is None:
+                return
+            request, client_address, queued_at = entry
+            wait_time = time.monotonic() - queued_at
+            with self.__stats_lock:
+                self.active_workers += 1
+                self.total_wait_time += wait_time
+                self.max_wait_time = max(self.max_wait_time, wait_time)
+            handler: Optional[KeepAliveRequestHandler] = None
+            if isinstance(request, KeepAliveRequestHandler):
+                handler, request = request, request.request
+            keep_open = False
+            try:
+                if handler is None:
+                    handler = KeepAliveRequestHandler(request, client_address, self)
+                keep_open = handler.handle_ready()
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                with self.__stats_lock:
+                    self.active_workers -= 1
+                if keep_open and handler is not None:
+                    self.__park(handler)
+                else:
+                    self.__close_connection(handler, request)
+
+    def __park(self, handler: KeepAliveRequestHandler) -> None:
+        """
+        Hand an idle keep-alive connection over to the poller thread.
+
+        :param handler: The handler of the connection.
+        """
+        with self.__idle_lock:
+            if self.__closing:
+                self.__close_connection(handler, handler.request)
+                return
+            self.__idle.append(handler)
+        self.__wakeup()
+
+    def __wakeup(self) -> None:
+        """
+        Interrupt the poller thread, so it picks up newly parked connections.
+        """
+        with contextlib.suppress(BlockingIOError):
+            self.__wakeup_write.send(b"\0")
+
+    def __poll_idle(self) -> None:
+        """
+        Main loop of the poller thread. Watches the idle keep-alive connections, queues them again once they become
+        readable and closes them after the keep-alive timeout.
+        """
+        deadlines: Dict[KeepAliveRequestHandler, float] = {}
+        while True:
+            with self.__idle_lock:
+                if self.__closing:
+                    break
+                parked, self.__idle = self.__idle, []
+            now = time.monotonic()
+            for handler in parked:
+                self.__selector.register(
+                    handler.connection, selectors.EVENT_READ, handler
+                )
+                deadlines[handler] = now + (self.keepalive_timeout or math.inf)
+            timeout = min(deadlines.values(), default=math.inf) - now
+            events = self.__selector.select(
+                None if timeout == math.inf else max(timeout, 0)
+            )
+            now = time.monotonic()
+            for key, _ in events:
+                if key.data is None:
+                    with contextlib.suppress(BlockingIOError):
+                        while self.__wakeup_read.recv(512):
+                            pass
+                    continue
+                handler = key.data
+                self.__selector.unregister(handler.connection)
+                del deadlines[handler]
+                self.connection_queue.put((handler, handler.client_address, now))
+            for handler, deadline in list(deadlines.items()):
+                if deadline <= now:
+                    self.__selector.unregister(handler.connection)
+                    del deadlines[handler]
+                    self.__close_connection(handler, handler.request)
+            self.idle_connections = len(deadlines)
+        for handler in deadlines:
+            self.__selector.unregister(handler.connection)
+            self.__close_connection(handler, handler.request)
+
+    def __close_connection(
+        self, handler: Optional[KeepAliveRequestHandler], request: Any
+    ) -> None:
+        """
+        Close a connection and count it as handled.
+
+        :param handler: The handler of the connection, if it was created already.
+        :param request: The socket of the connection.
+        """
+        if handler is not None:
+            with contextlib.suppress(OSError):
+                handler.finish()
+        self.shutdown_request(request)
+        with self.__stats_lock:
+            self.handled_connections += 1
+
+    def server_close(self) -> None:
+        """
+        Close the listening socket, all idle connections and stop all workers after they finished their current
+        request.
+        """
+        super().server_close()
+        with self.__idle_lock:
+            self.__closing = True
+            for handler in self.__idle:
+                self.__close_connection(handler, handler.request)
+            self.__idle = []
+        self.__wakeup()
+        self.poller.join()
+        for _ in self.workers:
+            self.connection_queue.put(None)
+        for worker in self.workers:
+            worker.join()
+        self.__selector.close()
+        self.__wakeup_read.close()
+        self.__wakeup_write.close()
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Describe the current load of the server.
+
+        :return: The size of the pool, the number of busy workers, the queue depth and the time connections waited in
+                 the queue for a worker.
+        """
+        with self.__stats_lock:
+            handled = self.handled_connections
+            return {
+                "mode": "pool",
+                "workers": len(self.workers),
+                "active_workers": self.active_workers,
+                "idle_connections": self.idle_connections,
+                "queue_depth": self.connection_queue.qsize(),
+                "queue_size": self.connection_queue.maxsize,
+                "handled_connections": handled,
+                "average_wait_time": self.total_wait_time / handled if handled else 0.0,
+                "max_wait_time": self.max_wait_time,
+            }
+
 
 # *********************************************************************************
 
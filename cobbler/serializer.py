@@ -6,14 +6,25 @@ Serializer code for Cobbler
 # SPDX-FileCopyrightText: Copyright 2006-2009, Red Hat, Inc and Others
 # SPDX-FileCopyrightText: Michael DeHaan <michael.dehaan AT gmail>
 
+import contextlib
 import fcntl
 import logging
 import os
 import pathlib
 import sys
+import threading
 import time
 from types import ModuleType
-from typing import TYPE_CHECKING, Any, Dict, Optional, TextIO
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+)
 
 if TYPE_CHECKING:
     from cobbler.api import CobblerAPI
@@ -34,10 +45,21 @@ class Serializer:
         self.api = api
         self.logger = logging.getLogger()
         self.lock_enabled = True
-        self.lock_handle: Optional[TextIO] = None
+        self.__lock_handles = threading.local()
         self.lock_file_location = "/var/lib/cobbler/lock"
         self.storage_module = self.__get_storage_module()
         self.storage_object = self.storage_module.storage_factory(api)
+        self.__batch_owner: Optional[int] = None
+        self.__batch_changes = False
+        self.__batch_items = 0
+
+    @property
+    def lock_handle(self) -> Optional[TextIO]:
+        """
+        The handle of the lock file the current thread holds the lock with. Every thread needs its own handle, otherwise
+        grabbing the lock would drop the handle of the thread holding it (e.g. for a batch) and thereby release its lock.
+        """
+        return getattr(self.__lock_handles, "handle", None)
 
     def __grab_lock(self) -> None:
         """
@@ -45,6 +67,9 @@ class Serializer:
         (A) flock to avoid multiple process access
         (B) block signal handler to avoid ctrl+c while writing YAML
         """
+        if self.__batch_owner == threading.get_ident():
+            # The lock is held for the whole batch
+            return
         try:
             if self.lock_enabled:
                 if not os.path.exists(self.lock_file_location):
@@ -52,8 +77,9 @@ class Serializer:
                 # exclusive lock requires writtable mode (r+) on NFS
                 # https://man7.org/linux/man-pages/man2/flock.2.html
                 # pylint: disable-next=consider-using-with
-                self.lock_handle = open(self.lock_file_location, "r+", encoding="UTF-8")
-                fcntl.flock(self.lock_handle.fileno(), fcntl.LOCK_EX)
+                lock_handle = open(self.lock_file_location, "r+", encoding="UTF-8")
+                self.__lock_handles.handle = lock_handle
+                fcntl.flock(lock_handle.fileno(), fcntl.LOCK_EX)
         except Exception as exception:
             # this is pretty much FATAL, avoid corruption and quit now.
             self.logger.exception("File locking error.", exc_info=exception)
@@ -65,19 +91,48 @@ class Serializer:
 
         :param with_changes: If this is true the global modification time is being updated. Default is false.
         """
+        if self.__batch_owner == threading.get_ident():
+            self.__batch_changes = self.__batch_changes or with_changes
+            return
         if with_changes:
             # this file is used to know the time of last modification on cobbler_collections
             # was made -- allowing the API to work more smoothly without
             # a lot of unnecessary reloads.
             with open(self.api.mtime_location, "w", encoding="UTF-8") as mtime_fd:
                 mtime_fd.write(f"{time.time():f}")
-        if self.lock_enabled:
-            # exclusive lock requires writtable mode (r+) on NFS
-            # https://man7.org/linux/man-pages/man2/flock.2.html
-            # pylint: disable-next=consider-using-with
-            self.lock_handle = open(self.lock_file_location, "r+", encoding="UTF-8")
-            fcntl.flock(self.lock_handle.fileno(), fcntl.LOCK_UN)
-            self.lock_handle.close()
+        lock_handle = self.lock_handle
+        if lock_handle is not None:
+            self.__lock_handles.handle = None
+            fcntl.flock(lock_handle.fileno(), fcntl.LOCK_UN)
+            lock_handle.close()
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Context manager to serialize many items under a single lock. The global modification time is written once at
+        the end instead of once per item. Nested batches of the same thread join the outermost one.
+        """
+        if self.__batch_owner == threading.get_ident():
+            yield
+            return
+        self.__grab_lock()
+        self.__batch_owner = threading.get_ident()
+        self.__batch_changes = False
+        self.__batch_items = 0
+        start_time = time.monotonic()
+        try:
+            yield
+        finally:
+            self.__batch_owner = None
+            self.__release_lock(with_changes=self.__batch_changes)
+            duration = time.monotonic() - start_time
+            if self.__batch_items > 0:
+                self.logger.info(
+                    "Serialized %d items in %.3f seconds (%.0f items/s)",
+                    self.__batch_items,
+                    duration,
+                    self.__batch_items / duration if duration > 0 else 0,
+                )
 
     def serialize(self, collection: "Collection[ITEM]") -> None:
         """
@@ -88,6 +143,8 @@ class Serializer:
 
         self.__grab_lock()
         self.storage_object.serialize(collection)
+        if self.__batch_owner == threading.get_ident():
+            self.__batch_items += len(collection)
         self.__release_lock()
 
     def serialize_item(self, collection: "Collection[ITEM]", item: "ITEM") -> None:
@@ -100,8 +157,26 @@ class Serializer:
 
         self.__grab_lock()
         self.storage_object.serialize_item(collection, item)
+        if self.__batch_owner == threading.get_ident():
+            self.__batch_items += 1
         self.__release_lock(with_changes=True)
 
+    def serialize_items(
+        self, collection: "Collection[ITEM]", items: Iterable["ITEM"]
+    ) -> None:
+        """
+        Save multiple items of a collection to disk
+
+        :param collection: The Cobbler collection to know the type of the items.
+        :param items: The collection items to serialize.
+        """
+
+        self.__grab_lock()
+        count = self.storage_object.serialize_items(collection, items)
+        if self.__batch_owner == threading.get_ident():
+            self.__batch_items += count
+        self.__release_lock(with_changes=count > 0)
+
     def serialize_delete(self, collection: "Collection[ITEM]", item: "ITEM") -> None:
         """
         Delete a collection item from disk
@@ -141,6 +216,36 @@ class Serializer:
         self.__release_lock()
         return result
 
+    def deserialize_many(
+        self, collection_type: str, uids: Iterable[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Load multiple items of a collection from disk.
+
+        :param collection_type: The collection type to deserialize.
+        :param uids: The uids of the collection items to deserialize.
+        :return: The dictionaries of the collection items, keyed by their uid.
+        """
+        self.__grab_lock()
+        result = self.storage_object.deserialize_many(collection_type, uids)
+        self.__release_lock()
+        return result
+
+    def find_uids_since(
+        self, collection_type: str, mtime: float
+    ) -> Optional[List[str]]:
+        """
+        Ask the storage module for the items which were modified since the given time.
+
+        :param collection_type: The collection type to search.
+        :param mtime: The timestamp which marks the gate if an item is included or not.
+        :return: The uids of the matching items or ``None`` if the storage module can't answer this.
+        """
+        self.__grab_lock()
+        result = self.storage_object.find_uids_since(collection_type, mtime)
+        self.__release_lock()
+        return result
+
     def __get_storage_module(self) -> ModuleType:
         """
         Look up configured module in the settings
@@ -8,7 +8,9 @@ Schema: From -> To
 Current Schema: Please refer to the documentation visible of the individual methods.
 
 V4.0.0 (unreleased)
-    * No changes
+    * Changed:
+        * ``autoinstall``, ``ipxe``, ``bootcfg`` & ``script``: Send ``ETag`` and ``Last-Modified`` headers and answer a
+          matching ``If-None-Match`` header with ``304``
 
 V3.3.4 (unreleased)
     * No changes
@@ -64,16 +66,24 @@ V2.8.5
 # SPDX-FileCopyrightText: based on code copyright 2007 Albert P. Tobey <tobert@gmail.com>
 # SPDX-FileCopyrightText: additions: 2007-2009 Michael DeHaan <michael.dehaan AT gmail>
 
+import email.utils
 import json
+import logging
+import os
+import queue
+import threading
 import time
 import xmlrpc.client
-from typing import Any, Callable, Dict, List, Optional, Union
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
 from urllib import parse
 
 import yaml
 
 from cobbler import download_manager
 
+logger = logging.getLogger()
+
 VALUE_KEY = object()
 """
 Empty instance. A unique marker value used instead of None to differentiate between when a key should be used for a
@@ -81,22 +91,105 @@ value and when 'None' is a valid entry in a dictionary.
 """
 
 
+class SettingsSnapshot:
+    """
+    Process wide copy of the settings file. The file is only parsed again once its mtime changed, so requests don't pay
+    for reading and parsing the YAML.
+    """
+
+    def __init__(self, path: str = "/etc/cobbler/settings.yaml") -> None:
+        """
+        Constructor
+
+        :param path: The path to the settings file.
+        """
+        self.path = path
+        self.__lock = threading.Lock()
+        self.__mtime: Optional[int] = None
+        self.__data: Dict[str, Any] = {}
+
+    def get(self) -> Dict[str, Any]:
+        """
+        Return the parsed settings. The returned dict is shared and must not be modified.
+
+        :return: The content of the settings file.
+        """
+        mtime = os.stat(self.path).st_mtime_ns
+        with self.__lock:
+            if mtime != self.__mtime:
+                with open(self.path, encoding="UTF-8") as main_settingsfile:
+                    self.__data = yaml.safe_load(main_settingsfile) or {}
+                self.__mtime = mtime
+            return self.__data
+
+
+class XMLRPCConnectionPool:
+    """
+    Pool of connections to the Cobbler XMLRPC server. A ``ServerProxy`` keeps its HTTP connection open between calls if
+    the server supports keep-alive, but it must not be shared between threads. Thus every request checks out a proxy
+    exclusively and hands it back afterwards.
+    """
+
+    def __init__(self, server: str, max_idle: int = 16) -> None:
+        """
+        Constructor
+
+        :param server: The URL of the XMLRPC server.
+        :param max_idle: The maximum number of idle connections that are kept open.
+        """
+        self.server = server
+        self.max_idle = max_idle
+        self.__idle: "queue.LifoQueue[xmlrpc.client.ServerProxy]" = queue.LifoQueue()
+
+    @contextmanager
+    def connection(self) -> Iterator[xmlrpc.client.ServerProxy]:
+        """
+        Check out a connection for the duration of the context. Only connections that completed their last request
+        (successfully or with an XMLRPC fault) are reused, all others are closed since the state of their HTTP
+        connection is unknown.
+
+        :return: The proxy to the XMLRPC server.
+        """
+        try:
+            proxy = self.__idle.get_nowait()
+        except queue.Empty:
+            proxy = xmlrpc.client.ServerProxy(self.server, allow_none=True)
+        reusable = False
+        try:
+            yield proxy
+            reusable = True
+        except xmlrpc.client.Fault:
+            reusable = True
+            raise
+        finally:
+            if reusable and self.__idle.qsize() < self.max_idle:
+                self.__idle.put(proxy)
+            else:
+                proxy("close")()  # type: ignore
+
+
 class CobblerSvc:
     """
     Interesting mod python functions are all keyed off the parameter mode, which defaults to index. All options are
     passed as parameters into the function.
     """
 
-    def __init__(self, server: str = "") -> None:
+    def __init__(
+        self, server: str = "", remote: Optional[xmlrpc.client.ServerProxy] = None
+    ) -> None:
         """
         Default constructor which sets up everything to be ready.
 
         :param server: The domain to run at.
-        :param req: This parameter is unused.
+        :param remote: An already established connection to the Cobbler XMLRPC server, e.g. from a
+                       ``XMLRPCConnectionPool``.
         """
         self.server = server
-        self.__remote: Optional[xmlrpc.client.Server] = None
-        self.dlmgr = download_manager.DownloadManager()
+        self.__remote: Optional[xmlrpc.client.ServerProxy] = remote
+        self.__dlmgr: Optional[download_manager.DownloadManager] = None
+        self.etag = ""
+        self.last_modified = 0.0
+        self.not_modified = False
 
     @property
     def remote(self) -> xmlrpc.client.ServerProxy:
@@ -107,6 +200,34 @@ class CobblerSvc:
             self.__remote = xmlrpc.client.Server(self.server, allow_none=True)
         return self.__remote
 
+    @property
+    def dlmgr(self) -> download_manager.DownloadManager:
+        """
+        The download manager is only needed to fetch autoinstallation files, thus it is created on first use.
+        """
+        if self.__dlmgr is None:
+            self.__dlmgr = download_manager.DownloadManager()
+        return self.__dlmgr
+
+    def __generate_file(
+        self, generator: str, arguments: Dict[str, Any], if_none_match: str
+    ) -> str:
+        """
+        Fetch a generated file from the server and remember its validators for the response headers.
+
+        :param generator: One of "autoinstall", "ipxe", "bootcfg" or "script".
+        :param arguments: The arguments for the generator.
+        :param if_none_match: The "If-None-Match" header of the client.
+        :return: The content of the file. Empty if the client already has the current version.
+        """
+        data = self.remote.generate_file(generator, arguments, if_none_match)
+        if not isinstance(data, dict) or not isinstance(data.get("content"), str):
+            return "ERROR: Server returned unexpected data!"
+        self.etag = data["etag"]
+        self.last_modified = data["last_modified"]
+        self.not_modified = data["not_modified"]
+        return data["content"]
+
     def settings(self, **kwargs: Any) -> str:
         """
         Get the application configuration.
@@ -155,16 +276,17 @@ class CobblerSvc:
         elif "network-config" in kwargs:
             subfile = "network-config"
 
-        data = self.remote.generate_autoinstall(
-            profile if profile else system,
-            "profile" if profile else "system",
-            "name",
-            file,
-            subfile,
+        return self.__generate_file(
+            "autoinstall",
+            {
+                "obj_identifier": profile if profile else system,
+                "obj_type": "profile" if profile else "system",
+                "obj_field": "name",
+                "autoinstaller_file": file,
+                "autoinstaller_subfile": subfile,
+            },
+            kwargs.get("IF_NONE_MATCH", ""),
         )
-        if isinstance(data, str):
-            return data
-        return "ERROR: Server returned unexpected data!"
 
     def ipxe(
         self,
@@ -194,10 +316,11 @@ class CobblerSvc:
             if found:
                 system = found[0]
 
-        data = self.remote.generate_ipxe(profile, image, system)
-        if isinstance(data, str):
-            return data
-        return "ERROR: Server returned unexpected data!"
+        return self.__generate_file(
+            "ipxe",
+            {"profile": profile, "image": image, "system": system},
+            kwargs.get("IF_NONE_MATCH", ""),
+        )
 
     def bootcfg(
         self, profile: Optional[str] = None, system: Optional[str] = None, **kwargs: Any
@@ -210,10 +333,11 @@ class CobblerSvc:
         :param kwargs: This parameter is unused.
         :return:
         """
-        data = self.remote.generate_bootcfg(profile, system)
-        if isinstance(data, str):
-            return data
-        return "ERROR: Server returned unexpected data!"
+        return self.__generate_file(
+            "bootcfg",
+            {"profile": profile, "system": system},
+            kwargs.get("IF_NONE_MATCH", ""),
+        )
 
     def script(
         self, profile: Optional[str] = None, system: Optional[str] = None, **kwargs: Any
@@ -228,12 +352,15 @@ class CobblerSvc:
                      array. The element from position zero is taken.
         :return: The generated script.
         """
-        data = self.remote.generate_script(
-            profile, system, kwargs["query_string"]["script"][0]
+        return self.__generate_file(
+            "script",
+            {
+                "profile": profile,
+                "system": system,
+                "name": kwargs["query_string"]["script"][0],
+            },
+            kwargs.get("IF_NONE_MATCH", ""),
         )
-        if isinstance(data, str):
-            return data
-        return "ERROR: Server returned unexpected data!"
 
     def events(self, user: str = "", **kwargs: Any) -> str:
         """
@@ -456,6 +583,10 @@ class CobblerSvc:
             return f"# automatic installation file retrieval failed ({url})"
 
 
+__settings_snapshot = SettingsSnapshot()
+__connection_pools: Dict[str, XMLRPCConnectionPool] = {}
+
+
 def __fillup_form_dict(form: Dict[Any, Any], my_uri: str) -> str:
     """
     Helper function to fillup the form dict with required mode information.
@@ -513,13 +644,17 @@ def application(
 
     # REMOTE_ADDR isn't a required wsgi attribute so it may be naive to assume it's always present in this context.
     form["REMOTE_ADDR"] = environ.get("REMOTE_ADDR", None)
+    # Installers that fetch a file repeatedly can revalidate their copy instead of downloading it again.
+    form["IF_NONE_MATCH"] = environ.get("HTTP_IF_NONE_MATCH", "")
 
     # Read config for the XMLRPC port to connect to:
-    with open("/etc/cobbler/settings.yaml", encoding="UTF-8") as main_settingsfile:
-        ydata = yaml.safe_load(main_settingsfile)
-
-    # Instantiate a CobblerWeb object
-    http_api = CobblerSvc(server=f'http://127.0.0.1:{ydata.get("xmlrpc_port", 25151)}')
+    ydata = __settings_snapshot.get()
+    server = f'http://127.0.0.1:{ydata.get("xmlrpc_port", 25151)}'
+    connection_pool = __connection_pools.get(server)
+    if connection_pool is None:
+        connection_pool = __connection_pools.setdefault(
+            server, XMLRPCConnectionPool(server)
+        )
 
     # Check for a valid path/mode; handle invalid paths gracefully
     mode = form.get("op", "index")
@@ -527,38 +662,58 @@ def application(
     # TODO: We could do proper exception handling here and return
     # Corresponding HTTP status codes:
 
+    start_time = time.monotonic()
     status = "200 OK"
-    if hasattr(http_api, mode):
-        # Execute corresponding operation on the CobblerSvc object:
-        func = getattr(http_api, mode)
-        try:
-            content = func(**form)
-
-            if content.find("# *** ERROR ***") != -1:
+    with connection_pool.connection() as remote:
+        # Instantiate a CobblerWeb object
+        http_api = CobblerSvc(server=server, remote=remote)
+        if hasattr(http_api, mode):
+            # Execute corresponding operation on the CobblerSvc object:
+            func = getattr(http_api, mode)
+            try:
+                content = func(**form)
+
+                if http_api.not_modified:
+                    status = "304 NOT MODIFIED"
+                elif content.find("# *** ERROR ***") != -1:
+                    status = "500 SERVER ERROR"
+                    print("possible cheetah template error")
+
+                # TODO: Not sure these strings are the right ones to look for...
+                elif (
+                    content.find("# profile not found") != -1
+                    or content.find("# system not found") != -1
+                    or content.find("# object not found") != -1
+                ):
+                    print(f"content not found: {my_uri}")
+                    status = "404 NOT FOUND"
+            except xmlrpc.client.Fault as err:
                 status = "500 SERVER ERROR"
-                print("possible cheetah template error")
-
-            # TODO: Not sure these strings are the right ones to look for...
-            elif (
-                content.find("# profile not found") != -1
-                or content.find("# system not found") != -1
-                or content.find("# object not found") != -1
-            ):
-                print(f"content not found: {my_uri}")
-                status = "404 NOT FOUND"
-        except xmlrpc.client.Fault as err:
-            status = "500 SERVER ERROR"
-            content = err.faultString
-    else:
-        status = "404 NOT FOUND"
-        content = "Unkown endpoint!"
+                content = err.faultString
+        else:
+            status = "404 NOT FOUND"
+            content = "Unkown endpoint!"
+    logger.info(
+        'svc endpoint "%s" answered with "%s" in %.1f ms',
+        mode,
+        status,
+        (time.monotonic() - start_time) * 1000,
+    )
 
     content = content.encode("utf-8")
 
-    response_headers = [
-        ("Content-type", "text/plain;charset=utf-8"),
-        ("Content-Length", str(len(content))),
-    ]
+    response_headers: List[Any] = []
+    if not http_api.not_modified:
+        response_headers.append(("Content-type", "text/plain;charset=utf-8"))
+        response_headers.append(("Content-Length", str(len(content))))
+    if http_api.etag:
+        response_headers.append(("ETag", http_api.etag))
+        response_headers.append(
+            (
+                "Last-Modified",
+                email.utils.formatdate(http_api.last_modified, usegmt=True),
+            )
+        )
     start_response(status, response_headers)
 
     return [content]
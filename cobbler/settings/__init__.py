@@ -10,6 +10,7 @@ Cobbler app-wide settings
 # SPDX-FileCopyrightText: 2022 Pablo Suárez Hernández <psuarezhernandez@suse.de>
 # SPDX-FileCopyrightText: Copyright SUSE LLC
 
+import copy
 import datetime
 import logging
 import os.path
@@ -17,7 +18,8 @@ import pathlib
 import shutil
 import traceback
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 import yaml
 from schema import (  # type: ignore
@@ -35,6 +37,10 @@ class Settings:
     This class contains all app-wide settings of Cobbler. It should only exist once in a Cobbler instance.
     """
 
+    # The settings themselves are the content of "__dict__". The version and the snapshot are stored in slots, so they
+    # are neither saved nor validated as settings.
+    __slots__ = ("__dict__", "_version", "_snapshot")
+
     @staticmethod
     def collection_type() -> str:
         """
@@ -55,6 +61,8 @@ class Settings:
         """
         Constructor.
         """
+        self._version = 0
+        self._snapshot: Optional[Tuple[int, Mapping[str, Any]]] = None
         self.auto_migrate_settings = False
         self.autoinstall_scheme = "http"
         self.allow_duplicate_hostnames = False
@@ -66,6 +74,16 @@ class Settings:
         self.auth_token_expiration = 3600
         self.authn_pam_service = "login"
         self.autoinstall_templates_dir = "/var/lib/cobbler/templates"
+        self.background_tasks = {
+            "max_running": 4,
+            "limits": {
+                "buildiso": 1,
+                "hardlink": 1,
+                "import": 1,
+                "replicate": 1,
+                "reposync": 1,
+            },
+        }
         self.bind_chroot_path = ""
         self.bind_zonefile_path = "/var/lib/named"
         self.bind_master = "127.0.0.1"
@@ -219,6 +237,7 @@ class Settings:
             "serializers": {"module": "serializers.file"},
         }
         self.mongodb = {"host": "localhost", "port": 27017}
+        self.sqlite = {"synchronous": "NORMAL"}
         self.next_server_v4 = "127.0.0.1"
         self.next_server_v6 = "::1"
         self.ndjbdns_data_file = "/etc/ndjbdns/data"
@@ -257,11 +276,13 @@ class Settings:
         self.scm_track_mode = "git"
         self.scm_track_author = "cobbler <cobbler@localhost>"
         self.scm_push_script = "/bin/true"
+        self.serializer_fsync = False
         self.serializer_pretty_json = False
         self.server = "127.0.0.1"
         self.sign_puppet_certs_automatically = False
         self.signature_path = "/var/lib/cobbler/distro_signatures.json"
         self.signature_url = "https://cobbler.github.io/signatures/3.0.x/latest.json"
+        self.sync_workers = 1
         self.syslinux_dir = "/usr/share/syslinux"
         self.syslinux_memdisk_folder = "/usr/share/syslinux"
         self.syslinux_pxelinux_folder = "/usr/share/syslinux"
@@ -285,6 +306,12 @@ class Settings:
             "webui",
         ]
         self.xmlrpc_port = 25151
+        self.xmlrpc_server = {
+            "workers": 0,
+            "queue_size": 256,
+            "keepalive_timeout": 15,
+            "gzip_threshold": 1400,
+        }
         self.yum_distro_priority = 1
         self.yum_post_install_mirror = True
         self.yumdownloader_flags = "--resolve"
@@ -328,6 +355,7 @@ class Settings:
                     "nonunique": self.allow_duplicate_hostnames,
                     "disabled": self.allow_duplicate_hostnames,
                 },
+                "system_uid": {"nonunique": True, "disabled": False},
             },
             "profile": {
                 "name": {"nonunique": False, "disabled": False},
@@ -357,6 +385,9 @@ class Settings:
             "system_group": {
                 "name": {"nonunique": False, "disabled": False},
             },
+            "template": {
+                "name": {"nonunique": True, "disabled": False},
+            },
         }
 
     @property
@@ -366,6 +397,53 @@ class Settings:
         """
         return self.manage_dhcp_v4 or self.manage_dhcp_v6
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name not in Settings.__slots__:
+            self._version += 1
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The snapshot can't be pickled and is rebuilt on demand anyway.
+        return self.__dict__.copy()
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self._version = 0
+        self._snapshot = None
+        self.__dict__.update(state)
+
+    @property
+    def version(self) -> int:
+        """
+        Counter which is increased every time a setting is assigned or the settings are loaded with ``from_dict()``.
+
+        .. note:: Modifying the value of a setting in place (e.g. a key of a dict) does not increase the version. Assign
+                  the modified value again or call ``bump_version()`` afterwards.
+
+        :getter: The current version of the settings.
+        """
+        return self._version
+
+    def bump_version(self) -> None:
+        """
+        Increase the version of the settings. This invalidates the snapshot returned by ``snapshot()``.
+        """
+        self._version += 1
+
+    def snapshot(self) -> Mapping[str, Any]:
+        """
+        Read-only copy of all settings. The copy is only rebuilt after the version of the settings changed, so it can
+        be shared by all templates that are rendered in the meantime. Code that needs to add data to it should layer its
+        own dict in front of it with a ``collections.ChainMap``.
+
+        :return: The mapping with a deep copy of the settings.
+        """
+        if self._snapshot is None or self._snapshot[0] != self._version:
+            self._snapshot = (
+                self._version,
+                MappingProxyType(copy.deepcopy(self.__dict__)),
+            )
+        return self._snapshot[1]
+
     def to_dict(self, resolved: bool = False) -> Dict[str, Any]:
         """
         Return an easily serializable representation of the config.
@@ -397,6 +475,7 @@ class Settings:
         self.__dict__.update(  # pylint: disable=access-member-before-definition
             new_values
         )
+        self.bump_version()
 
         if not self.is_valid():
             self.__dict__ = old_settings
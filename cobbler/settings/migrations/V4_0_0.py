@@ -31,6 +31,10 @@ schema = Schema(
         Optional("auth_token_expiration"): int,
         Optional("authn_pam_service"): str,
         Optional("autoinstall_templates_dir"): str,
+        Optional("background_tasks"): {
+            Optional("max_running"): int,
+            Optional("limits"): {Optional(str): int},
+        },
         Optional("bind_chroot_path"): str,
         Optional("bind_zonefile_path"): str,
         Optional("bind_master"): str,
@@ -141,16 +145,24 @@ schema = Schema(
         Optional("scm_track_mode"): str,
         Optional("scm_track_author"): str,
         Optional("scm_push_script"): str,
+        Optional("serializer_fsync"): bool,
         Optional("serializer_pretty_json"): bool,
         Optional("server"): str,
         Optional("sign_puppet_certs_automatically"): bool,
         Optional("signature_path"): str,
         Optional("signature_url"): str,
+        Optional("sync_workers"): int,
         Optional("tftpboot_location"): str,
         Optional("virt_auto_boot"): bool,
         Optional("webdir"): str,
         Optional("webdir_whitelist"): [str],
         Optional("xmlrpc_port"): int,
+        Optional("xmlrpc_server"): {
+            Optional("workers"): int,
+            Optional("queue_size"): int,
+            Optional("keepalive_timeout"): int,
+            Optional("gzip_threshold"): int,
+        },
         Optional("yum_distro_priority"): int,
         Optional("yum_post_install_mirror"): bool,
         Optional("yumdownloader_flags"): str,
@@ -172,6 +184,9 @@ schema = Schema(
             Optional("host"): str,
             Optional("port"): int,
         },
+        Optional("sqlite"): {
+            Optional("synchronous"): str,
+        },
         Optional("cache_enabled"): bool,
         Optional("autoinstall_scheme"): str,
         Optional("lazy_start"): bool,
@@ -243,6 +258,11 @@ schema = Schema(
                     Optional("nonunique"): bool,
                     Optional("disabled"): bool,
                 },
+                Optional("system_uid"): {
+                    Optional("property"): str,
+                    Optional("nonunique"): bool,
+                    Optional("disabled"): bool,
+                },
             },
             Optional("profile"): {
                 Optional("name"): {
@@ -321,6 +341,13 @@ schema = Schema(
                     Optional("disabled"): bool,
                 },
             },
+            Optional("template"): {
+                Optional("name"): {
+                    Optional("property"): str,
+                    Optional("nonunique"): bool,
+                    Optional("disabled"): bool,
+                },
+            },
         },
     },  # type: ignore
     ignore_extra_keys=False,
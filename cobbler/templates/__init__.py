@@ -9,6 +9,7 @@ snippets/etc. (And it's not spelled wrong!)
 # SPDX-FileCopyrightText: Copyright 2006-2009, Red Hat, Inc and Others
 # SPDX-FileCopyrightText: Michael DeHaan <michael.dehaan AT gmail>
 
+import hashlib
 import importlib
 import inspect
 import logging
@@ -17,6 +18,8 @@ import os.path
 import pathlib
 import pkgutil
 import re
+from collections import OrderedDict
+from threading import Lock
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, TextIO, Tuple, Union
 
 try:
@@ -26,7 +29,7 @@ except ImportError:
 
 from cobbler import enums
 from cobbler.items.template import Template
-from cobbler.utils import filesystem_helpers
+from cobbler.utils import filesystem_helpers, thread
 
 if TYPE_CHECKING:
     from cobbler.api import CobblerAPI
@@ -123,6 +126,11 @@ class BaseTemplateProvider:
     Identifier for the template type. Must be identical to the module name.
     """
 
+    compiled_template_cache_size = 256
+    """
+    Maximum number of compiled templates that are kept in memory per template provider.
+    """
+
     def __init__(self, api: "CobblerAPI"):
         """
         Construcutor
@@ -133,6 +141,12 @@ class BaseTemplateProvider:
         self.logger = logging.getLogger()
         # First attempt to stay backwards compatible for the auto-installation validation
         self.last_errors: List[Any] = []
+        # LRU cache of compiled templates. The key is the SHA256 hash of the template source.
+        self.__compiled_templates: "OrderedDict[str, Any]" = OrderedDict()
+        self.__compiled_templates_lock = Lock()
+        thread.register_fork_locks(self, self.__compiled_templates_lock)
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     @property
     def template_file_extension(self) -> str:
@@ -244,6 +258,62 @@ class BaseTemplateProvider:
                 result.extend(self.__load_templates_in_folder(entry))
         return result
 
+    def compile(self, raw_data: str) -> Any:
+        """
+        Compile the template source into an object that can be rendered multiple times.
+
+        :param raw_data: Is the template code which should be compiled.
+        :return: The compiled template. The type of the object is specific to the template provider.
+        """
+        raise NotImplementedError(
+            '"compile" must be implemented to use the compiled template cache'
+        )
+
+    def get_compiled_template(self, raw_data: str) -> Any:
+        """
+        Return the compiled template for the given source. Compiled templates are kept in a bounded LRU cache, so
+        templates that are shared by many items are only compiled once.
+
+        :param raw_data: Is the template code which should be compiled.
+        :return: The compiled template as returned by ``compile()``.
+        """
+        key = hashlib.sha256(raw_data.encode("UTF-8")).hexdigest()
+        with self.__compiled_templates_lock:
+            compiled_template = self.__compiled_templates.get(key)
+            if compiled_template is not None:
+                self.__compiled_templates.move_to_end(key)
+                self.cache_hits += 1
+                return compiled_template
+            self.cache_misses += 1
+
+        compiled_template = self.compile(raw_data)
+
+        with self.__compiled_templates_lock:
+            self.__compiled_templates[key] = compiled_template
+            while len(self.__compiled_templates) > self.compiled_template_cache_size:
+                self.__compiled_templates.popitem(last=False)
+        return compiled_template
+
+    def clear_compiled_templates(self) -> None:
+        """
+        Drop all compiled templates of this provider from the cache.
+        """
+        with self.__compiled_templates_lock:
+            self.__compiled_templates.clear()
+
+    @property
+    def cache_statistics(self) -> Dict[str, int]:
+        """
+        Statistics about the compiled template cache of this provider.
+
+        :getter: A dict with the number of cache hits, misses and the current number of cached templates.
+        """
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "size": len(self.__compiled_templates),
+        }
+
     def render(self, raw_data: str, search_table: Dict[str, Any]) -> str:
         """
         Render data_input back into a file.
@@ -272,6 +342,7 @@ class Templar:
         self.last_errors: List[Dict[str, Any]] = []
         self.logger = logging.getLogger()
         self.__loaded_template_providers: Dict[str, BaseTemplateProvider] = {}
+        self.template_generation = 0
 
     def load_template_providers(self) -> None:
         """
@@ -314,6 +385,27 @@ class Templar:
             total_templates += len(built_in_templates)
         self.logger.info("Loaded %s built-in templates", total_templates)
 
+    def clear_template_cache(self) -> None:
+        """
+        Drop the compiled templates of all template providers. This must be called whenever the source of a template
+        changes.
+        """
+        self.template_generation += 1
+        for provider in self.__loaded_template_providers.values():
+            provider.clear_compiled_templates()
+
+    @property
+    def template_cache_statistics(self) -> Dict[str, Dict[str, int]]:
+        """
+        Statistics about the compiled template caches.
+
+        :getter: A dict with the name of the template provider as key and the cache statistics as value.
+        """
+        return {
+            name: provider.cache_statistics
+            for name, provider in self.__loaded_template_providers.items()
+        }
+
     @property
     def available_template_providers(self) -> List[str]:
         """
@@ -362,8 +454,7 @@ class Templar:
     @staticmethod
     def __save_template_to_disk(out_path: str, data_out: str):
         filesystem_helpers.mkdir(os.path.dirname(out_path))
-        with open(out_path, "w+", encoding="UTF-8") as file_descriptor:
-            file_descriptor.write(data_out)
+        filesystem_helpers.write_file(out_path, data_out)
 
     @staticmethod
     def __replace_at_variables(data_out: str, search_table: Dict[str, Any]) -> str:
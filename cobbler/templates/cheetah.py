@@ -60,28 +60,33 @@ class CobblerCheetahTemplate(CheetahTemplate):  # type: ignore
     # FIXME: Replace Snippet Mechanism with one that can load templates by name from the API, don't reuse the name since
     # the mechanism is completly different.
 
+    # The compiled SNIPPET macro never changes, thus it is compiled once and shared by all instances.
+    _builtin_template_class: Any = None
+
     def __init__(self, **kwargs: Any):
         """
         Constructor for this derived class. We include two additional default templates.
 
         :param kwargs: These arguments get passed to the super constructor of this class.
         """
-        # pylint: disable-next=invalid-name
-        self.BuiltinTemplate = CheetahTemplate.compile(  # type: ignore
-            source="\n".join(
-                [
-                    "#def SNIPPET($file)",
-                    "#set $snippet = $read_snippet($file)",
-                    "#if $snippet",
-                    "#include source=$snippet",
-                    "#else",
-                    "# Error: no snippet data for $file",
-                    "#end if",
-                    "#end def",
-                ]
+        if CobblerCheetahTemplate._builtin_template_class is None:
+            CobblerCheetahTemplate._builtin_template_class = CheetahTemplate.compile(  # type: ignore
+                source="\n".join(
+                    [
+                        "#def SNIPPET($file)",
+                        "#set $snippet = $read_snippet($file)",
+                        "#if $snippet",
+                        "#include source=$snippet",
+                        "#else",
+                        "# Error: no snippet data for $file",
+                        "#end if",
+                        "#end def",
+                    ]
+                )
+                + "\n"
             )
-            + "\n"
-        )
+        # pylint: disable-next=invalid-name
+        self.BuiltinTemplate = CobblerCheetahTemplate._builtin_template_class
         self.cobbler_api: "CobblerAPI" = kwargs.pop("cobbler_api")
         super().__init__(**kwargs)  # type: ignore
 
@@ -293,6 +298,15 @@ class CheetahTemplateProvider(BaseTemplateProvider):
                 if rest not in self.api.settings().cheetah_import_whitelist:
                     raise CX(f"Potentially insecure import in template: {rest}")
 
+    def compile(self, raw_data: str) -> Any:
+        return CobblerCheetahTemplate.compile(
+            moduleName="cobbler.template_api",
+            className="CobblerDynamicTemplate",
+            source=raw_data,
+            compilerSettings={"useStackFrame": False},
+            baseclass=CobblerCheetahTemplate,
+        )
+
     def render(self, raw_data: str, search_table: Dict[str, Any]) -> str:
         self.check_for_invalid_imports(raw_data)
 
@@ -330,13 +344,7 @@ class CheetahTemplateProvider(BaseTemplateProvider):
         search_table.update({"template_universe": table_copy})
 
         # Now do full templating scan, where we will also templatify the snippet insertions
-        template = CobblerCheetahTemplate.compile(
-            moduleName="cobbler.template_api",
-            className="CobblerDynamicTemplate",
-            source=raw_data,
-            compilerSettings={"useStackFrame": False},
-            baseclass=CobblerCheetahTemplate,
-        )
+        template = self.get_compiled_template(raw_data)
 
         try:
             generated_template_class = template(searchList=[search_table], cobbler_api=self.api)  # type: ignore
@@ -77,11 +77,14 @@ class JinjaTemplateProvider(BaseTemplateProvider):
     def template_file_extension(self) -> str:
         return "jinja"
 
+    def compile(self, raw_data: str) -> "jinja2.Template":
+        return self.jinja2_env.from_string(raw_data)
+
     def render(self, raw_data: str, search_table: Dict[str, Any]) -> str:
         if not JINJA2_AVAILABLE:
             return ""
         try:
-            template = self.jinja2_env.from_string(raw_data)
+            template: "jinja2.Template" = self.get_compiled_template(raw_data)
             data_out = template.render(search_table)
         except Exception as exc:
             self.logger.warning("errors were encountered rendering the template")
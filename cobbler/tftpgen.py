@@ -13,7 +13,20 @@ import os.path
 import pathlib
 import re
 import socket
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union, cast
+from collections import ChainMap, OrderedDict
+from threading import Lock, RLock
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 try:
     from importlib.resources import files  # type: ignore
@@ -23,7 +36,12 @@ except ImportError:
 from cobbler import enums, grub, utils
 from cobbler.cexceptions import CX
 from cobbler.enums import Archs, ImageTypes
-from cobbler.utils import filesystem_helpers, input_converters, kernel_command_line
+from cobbler.utils import (
+    filesystem_helpers,
+    input_converters,
+    kernel_command_line,
+    thread,
+)
 from cobbler.validate import validate_autoinstall_script_name
 
 if TYPE_CHECKING:
@@ -42,11 +60,30 @@ if TYPE_CHECKING:
     from cobbler.items.template import Template
 
 
+class MenuEntry(NamedTuple):
+    """
+    A profile or image of the boot menu together with its rendered menu entries.
+    """
+
+    item: Union["Profile", "Image"]
+    arch: Optional[Archs]
+    """The architecture the entry is listed for."""
+    fragments: Dict[enums.BootLoader, str]
+    """The rendered menu entry for every boot loader of the item that produced one."""
+
+
+MENU_TREE = Dict[Optional[Archs], Dict[str, Tuple[List[MenuEntry], List[MenuEntry]]]]
+"""The profile and image entries of every menu by architecture. ``None`` holds the entries of all architectures."""
+
+
 class TFTPGen:
     """
     Generate files provided by TFTP server
     """
 
+    generated_file_cache_size = 1024
+    """Maximum number of generated configuration files that are kept in memory for the TFTP server."""
+
     def __init__(self, api: "CobblerAPI"):
         """
         Constructor
@@ -61,6 +98,19 @@ class TFTPGen:
         self.images = api.images()
         self.menus = api.menus()
         self.bootloc = self.settings.tftpboot_location
+        self.menu_generation = 0
+        self.__generated_files: (
+            "OrderedDict[pathlib.Path, Tuple[Tuple[float, int], str, float, bytes]]"
+        ) = OrderedDict()
+        self.__system_paths: Dict[pathlib.Path, List[str]] = {}
+        self.__system_paths_stamp: Optional[Tuple[float, int, int, int]] = None
+        self.__generated_files_lock = Lock()
+        self.__menu_tree: Optional[MENU_TREE] = None
+        self.__menu_tree_stamp: Optional[Tuple[Any, ...]] = None
+        self.__menu_items: Dict[Optional[Archs], Dict[str, Any]] = {}
+        self.__submenu_templates: Optional[Dict[enums.BootLoader, str]] = None
+        self.__menu_lock = RLock()
+        thread.register_fork_locks(self, self.__generated_files_lock, self.__menu_lock)
 
     def copy_static_grub_files(self) -> None:
         """
@@ -144,10 +194,7 @@ class TFTPGen:
                             run in chroot environments (tftpd,..)
         :raises FileNotFoundError: Raised in case no kernel was found.
         """
-        full_path: Optional[str] = utils.find_kernel(d_file)
-
-        if not full_path:
-            full_path = utils.find_initrd(d_file)
+        full_path = self._find_distro_file(d_file)
 
         if full_path is None or not full_path:
             # Will raise if None or an empty str
@@ -166,6 +213,52 @@ class TFTPGen:
             dst = os.path.join(distro_dir, b_file)
             filesystem_helpers.copyremotefile(full_path, dst, api=None)
 
+    @staticmethod
+    def _find_distro_file(d_file: str) -> Optional[str]:
+        """
+        Resolve the kernel or initrd of a distro to the file that is copied.
+
+        :param d_file: distro's kernel/initrd absolut or remote file path value
+        :return: The full path of the file or an empty string if it wasn't found.
+        """
+        full_path: Optional[str] = utils.find_kernel(d_file)
+
+        if not full_path:
+            full_path = utils.find_initrd(d_file)
+        return full_path
+
+    def hash_distro_files(
+        self, distros: Iterable["Distro"], dirtree: str, symlink_ok: bool
+    ) -> Dict[str, int]:
+        """
+        Hash the kernels and initrds of many distros which have to be copied through the link cache in parallel,
+        before ``copy_single_distro_files()`` copies them one after another. The number of threads is taken from the
+        setting ``sync_workers``.
+
+        :param distros: The distros that will be copied.
+        :param dirtree: This is the root where the images are located. The folder "images" gets automatically appended.
+        :param symlink_ok: If it is okay to use a symlink to link the destination to the source.
+        :return: The number of files served from the hash index ("hits") and of files that were read ("misses").
+        """
+        links: List[Tuple[str, str]] = []
+        for distro in distros:
+            distro_dir = os.path.join(dirtree, "images", distro.name)
+            for d_file in (distro.kernel, distro.initrd):
+                # Remote files are downloaded instead of linked.
+                if not d_file or utils.file_is_remote(d_file):
+                    continue
+                full_path = self._find_distro_file(d_file)
+                if full_path:
+                    links.append(
+                        (
+                            full_path,
+                            os.path.join(distro_dir, os.path.basename(full_path)),
+                        )
+                    )
+        return filesystem_helpers.hash_link_sources(
+            self.api, links, symlink_ok, self.settings.sync_workers
+        )
+
     def copy_single_distro_files(
         self, distro: "Distro", dirtree: str, symlink_ok: bool
     ):
@@ -302,13 +395,12 @@ class TFTPGen:
                 kopts = self._format_s390x_kernel_options(
                     distro, profile, image, system
                 )
-                with open(pxe_f, "w", encoding="UTF-8") as out:
-                    out.write(kernel_path + "\n" + initrd_path + "\n")
-                with open(parm_f, "w", encoding="UTF-8") as out:
-                    out.write(kopts)
+                filesystem_helpers.write_file(
+                    pxe_f, kernel_path + "\n" + initrd_path + "\n"
+                )
+                filesystem_helpers.write_file(parm_f, kopts)
                 # Write conf file with one newline in it if netboot is enabled
-                with open(conf_f, "w", encoding="UTF-8") as out:
-                    out.write("\n")
+                filesystem_helpers.write_file(conf_f, "\n")
             else:
                 self.logger.info("S390x: netboot_disabled")
                 # Write empty conf file if netboot is disabled
@@ -489,6 +581,7 @@ class TFTPGen:
             grub_target = sorted(grub_targets)[0]
             try:
                 os.symlink(os.path.join("..", "system", grub_target), link_path)
+                filesystem_helpers.record_generated_file(link_path)
             except OSError as os_error:
                 self.logger.warning(
                     'Failed to create GRUB system link for "%s": %s',
@@ -621,6 +714,7 @@ class TFTPGen:
         self._make_pxe_menu_pxe(metadata, menu_items, menu_labels, boot_menu)  # type: ignore
         self._make_pxe_menu_ipxe(metadata, menu_items, menu_labels, boot_menu)  # type: ignore
         self._make_pxe_menu_grub(boot_menu)
+        self.clear_generated_files()
         return boot_menu
 
     def _make_pxe_menu_pxe(
@@ -724,7 +818,9 @@ class TFTPGen:
             outfile = (
                 pathlib.Path(self.bootloc) / "grub" / f"{arch.value}_menu_items.cfg"
             )
-            outfile.write_text(arch_menu_items.get("grub", ""), encoding="UTF-8")  # type: ignore
+            filesystem_helpers.write_file(
+                str(outfile), arch_menu_items.get("grub", "")  # type: ignore
+            )
 
     def generate_pxe_menu(
         self, path: pathlib.Path, metadata: Dict[str, Union[str, Dict[str, str]]]
@@ -828,11 +924,199 @@ class TFTPGen:
         """
         Generates menu items for pxe, ipxe and grub. Grub menu items are grouped into submenus by profile.
 
+        The menu items of every architecture are assembled from the menu tree and kept until a menu, profile, image,
+        distro, template or setting changes.
+
         :param arch: The processor architecture to generate the menu items for. (Optional)
         :returns: A dictionary with the pxe, ipxe and grub menu items. It has the keys from
                   utils.get_supported_system_boot_loaders().
         """
-        return self.get_menu_level(None, arch)
+        with self.__menu_lock:
+            stamp = self._get_menu_tree_stamp()
+            if stamp != self.__menu_tree_stamp:
+                self.clear_menu_tree()
+                self.__menu_tree_stamp = stamp
+            menu_items = self.__menu_items.get(arch)
+            if menu_items is None:
+                menu_items = self.get_menu_level(None, arch)
+                self.__menu_items[arch] = menu_items
+        # Callers replace the menu items with the ones of a single boot loader, so they must not see the cached dicts.
+        return {
+            key: value.copy() if isinstance(value, dict) else value  # type: ignore
+            for key, value in menu_items.items()
+        }
+
+    def clear_menu_tree(self) -> None:
+        """
+        Drop the menu tree and the menu items assembled from it. Both are rebuilt with the next request for menu items.
+        """
+        with self.__menu_lock:
+            self.__menu_tree = None
+            self.__menu_tree_stamp = None
+            self.__menu_items.clear()
+            self.__submenu_templates = None
+
+    def _get_menu_tree_stamp(self) -> Tuple[Any, ...]:
+        """
+        Collect the modification state of everything the menu entries are rendered from: The menus, profiles, images
+        and distros, the image files, the settings and the templates.
+
+        :returns: The stamp.
+        """
+        stamp: List[Tuple[Any, ...]] = [
+            ("settings", self.settings.version, self.api.resolved_cache_generation),
+            ("templar", self.api.templar.template_generation),
+        ]
+        for collection in (
+            self.menus,
+            self.profiles,
+            self.images,
+            self.distros,
+            self.api.templates(),
+        ):
+            newest = max((item.mtime for item in collection), default=0.0)
+            stamp.append((collection.collection_type(), len(collection), newest))
+        stamp.append(tuple(os.path.exists(image.file) for image in self.images))
+        return tuple(stamp)
+
+    def _get_menu_tree(self) -> MENU_TREE:
+        """
+        Return the menu tree and build it if it was cleared.
+
+        :returns: The profile and image entries of every menu by architecture.
+        """
+        with self.__menu_lock:
+            if self.__menu_tree is None:
+                self.__menu_tree = self._build_menu_tree()
+            return self.__menu_tree
+
+    def _get_submenu_templates(self) -> Dict[enums.BootLoader, str]:
+        """
+        Return the content of the submenu template of every boot loader. The templates are looked up once per menu tree.
+
+        :returns: The template content by boot loader. Boot loaders without a submenu template are missing.
+        """
+        with self.__menu_lock:
+            if self.__submenu_templates is not None:
+                return self.__submenu_templates
+            template_data: Dict[enums.BootLoader, str] = {}
+            for boot_loader in utils.get_supported_system_boot_loaders():
+                search_result = self.api.find_template(
+                    True, False, tags=f"{boot_loader.value}_submenu"
+                )
+                if search_result is None or not isinstance(search_result, list):
+                    raise TypeError(
+                        f"Search result for {boot_loader} Sub-Menu Template must of of type list!"
+                    )
+                submenu_template: Optional["Template"] = None
+                for template in search_result:
+                    if enums.TemplateTag.ACTIVE.value in template.tags:
+                        submenu_template = template
+                        break
+                    if enums.TemplateTag.DEFAULT.value in template.tags:
+                        submenu_template = template
+
+                if submenu_template is None:
+                    self.logger.warning(
+                        'Template for building a submenu not found for bootloader "%s"! Submenu '
+                        "structure thus missing for this bootloader.",
+                        boot_loader.value,
+                    )
+                    continue
+
+                template_data[boot_loader] = submenu_template.content
+            self.__submenu_templates = template_data
+            return template_data
+
+    def _build_menu_tree(self) -> MENU_TREE:
+        """
+        Render the menu entries of all profiles and images in a single pass. The entries are grouped by menu and then
+        partitioned by architecture, so the menus of all architectures are assembled without rendering an entry twice.
+
+        :returns: The profile and image entries of every menu by architecture.
+        """
+        menu_names = [""] + sorted(menu.name for menu in self.menus)
+        levels: Dict[str, Tuple[List[MenuEntry], List[MenuEntry]]] = {}
+        for menu_name in menu_names:
+            profile_list = self.api.find_profile(return_list=True, menu=menu_name)
+            if profile_list is None:
+                profile_list = []
+            if not isinstance(profile_list, list):
+                raise ValueError("find_profile was expexted to return a list!")
+            image_list = self.api.find_image(return_list=True, menu=menu_name)
+            if image_list is None:
+                image_list = []
+            if not isinstance(image_list, list):
+                raise ValueError("find_image was expexted to return a list!")
+
+            profile_entries: List[MenuEntry] = []
+            for profile in sorted(profile_list, key=lambda profile: profile.name):
+                if not profile.enable_menu:
+                    # This profile has been excluded from the menu
+                    continue
+                distro: Optional["Distro"] = profile.get_conceptual_parent()  # type: ignore
+                profile_entries.append(
+                    self._render_menu_entry(
+                        profile,
+                        distro.arch if distro else None,  # type: ignore
+                        distro=distro,
+                        profile=profile,
+                    )
+                )
+
+            # image names towards the bottom
+            image_entries: List[MenuEntry] = []
+            for image in sorted(image_list, key=lambda image: image.name):
+                if os.path.exists(image.file):
+                    image_entries.append(
+                        self._render_menu_entry(image, image.arch, image=image)
+                    )
+
+            levels[menu_name] = (profile_entries, image_entries)
+
+        menu_tree: MENU_TREE = {None: levels}
+        for arch in enums.Archs:
+            menu_tree[arch] = {
+                menu_name: (
+                    [entry for entry in profile_entries if entry.arch == arch],
+                    [entry for entry in image_entries if entry.arch == arch],
+                )
+                for menu_name, (profile_entries, image_entries) in levels.items()
+            }
+        return menu_tree
+
+    def _render_menu_entry(
+        self,
+        item: Union["Profile", "Image"],
+        arch: Optional[enums.Archs],
+        distro: Optional["Distro"] = None,
+        profile: Optional["Profile"] = None,
+        image: Optional["Image"] = None,
+    ) -> MenuEntry:
+        """
+        Render the menu entries of a profile or image for all of its boot loaders.
+
+        :param item: The profile or image to render the entries for.
+        :param arch: The architecture to render the entries for.
+        :param distro: The distro of the profile.
+        :param profile: The profile to render the entries for.
+        :param image: The image to render the entries for.
+        :returns: The menu entry.
+        """
+        fragments: Dict[enums.BootLoader, str] = {}
+        for boot_loader in item.boot_loaders:
+            contents = self.write_pxe_file(
+                filename=None,
+                system=None,
+                profile=profile,
+                distro=distro,
+                arch=arch,
+                image=image,
+                bootloader_format=boot_loader,
+            )
+            if contents and contents != "":
+                fragments[boot_loader] = contents
+        return MenuEntry(item, arch, fragments)
 
     def _get_submenu_child(
         self,
@@ -914,45 +1198,19 @@ class TFTPGen:
 
     def _get_item_menu(
         self,
-        arch: Optional[enums.Archs],
-        boot_loader: enums.BootLoader,
+        entry: MenuEntry,
         current_menu_items: Dict[enums.BootLoader, Any],
         menu_labels: Dict[enums.BootLoader, Any],
-        distro: Optional["Distro"] = None,
-        profile: Optional["Profile"] = None,
-        image: Optional["Image"] = None,
     ) -> None:
         """
-        Common logic for generating both profile and image based menu entries.
+        Common logic for adding both profile and image based menu entries.
 
-        :param arch: The architecture to generate the entries for.
-        :param boot_loader: The bootloader that the item menu is generated for.
+        :param entry: The rendered menu entry of the profile or image.
         :param current_menu_items: The already generated menu items.
         :param menu_labels: The list of labels that are used for displaying the menu entry.
-        :param distro: The distro to generate the entries for.
-        :param profile: The profile to generate the entries for.
-        :param image: The image to generate the entries for.
         """
-        target_item: Optional[Union["Profile", "Image"]] = None
-        if image is None:
-            target_item = profile
-        elif profile is None:
-            target_item = image
-        if target_item is None:
-            raise ValueError(
-                '"image" and "profile" are mutually exclusive arguments! At least one of both must be given!'
-            )
-
-        contents = self.write_pxe_file(
-            filename=None,
-            system=None,
-            profile=profile,
-            distro=distro,
-            arch=arch,
-            image=image,
-            bootloader_format=boot_loader,
-        )
-        if contents and contents != "":
+        target_item = entry.item
+        for boot_loader, contents in entry.fragments.items():
             if boot_loader not in current_menu_items:
                 current_menu_items[boot_loader] = ""
             current_menu_items[boot_loader] += contents
@@ -985,45 +1243,13 @@ class TFTPGen:
         menu_name = ""
         if menu is not None:
             menu_name = menu.name
-        profile_filter = {"menu": menu_name}
-        if arch:
-            profile_filter["arch"] = arch.value
-        profile_list = self.api.find_profile(
-            return_list=True,
-            **profile_filter,  # type: ignore[reportArgumentType,arg-type]
-        )
-        if profile_list is None:
-            profile_list = []
-        if not isinstance(profile_list, list):
-            raise ValueError("find_profile was expexted to return a list!")
-        profile_list.sort(key=lambda profile: profile.name)
+        profile_entries, _ = self._get_menu_tree()[arch].get(menu_name, ([], []))
 
         current_menu_items: Dict[enums.BootLoader, Any] = {}
         menu_labels = metadata["menu_labels"]
 
-        for profile in profile_list:
-            if not profile.enable_menu:
-                # This profile has been excluded from the menu
-                continue
-            arch = None
-            distro = profile.get_conceptual_parent()
-            boot_loaders = profile.boot_loaders
-
-            if distro:
-                arch = distro.arch  # type: ignore
-
-            for boot_loader in boot_loaders:
-                if boot_loader not in profile.boot_loaders:
-                    continue
-                self._get_item_menu(
-                    arch,  # type: ignore
-                    boot_loader,
-                    current_menu_items,
-                    menu_labels,
-                    distro=distro,  # type: ignore
-                    profile=profile,
-                    image=None,
-                )
+        for entry in profile_entries:
+            self._get_item_menu(entry, current_menu_items, menu_labels)
 
         metadata["menu_items"] = current_menu_items
         metadata["menu_labels"] = menu_labels
@@ -1044,31 +1270,14 @@ class TFTPGen:
         menu_name = ""
         if menu is not None:
             menu_name = menu.name
-        image_filter = {"menu": menu_name}
-        if arch:
-            image_filter["arch"] = arch.value
-        image_list = self.api.find_image(return_list=True, **image_filter)  # type: ignore[reportArgumentType,arg-type]
-        if image_list is None:
-            image_list = []
-        if not isinstance(image_list, list):
-            raise ValueError("find_image was expexted to return a list!")
-        image_list = sorted(image_list, key=lambda image: image.name)
+        _, image_entries = self._get_menu_tree()[arch].get(menu_name, ([], []))
 
         current_menu_items = metadata["menu_items"]
         menu_labels = metadata["menu_labels"]
 
         # image names towards the bottom
-        for image in image_list:
-            if os.path.exists(image.file):
-                arch = image.arch
-                boot_loaders = image.boot_loaders
-
-                for boot_loader in boot_loaders:
-                    if boot_loader not in image.boot_loaders:
-                        continue
-                    self._get_item_menu(
-                        arch, boot_loader, current_menu_items, menu_labels, image=image
-                    )
+        for entry in image_entries:
+            self._get_item_menu(entry, current_menu_items, menu_labels)
 
         metadata["menu_items"] = current_menu_items
         metadata["menu_labels"] = menu_labels
@@ -1087,7 +1296,6 @@ class TFTPGen:
         metadata: Dict[str, Any] = {}
         metadata["parent_menu_name"] = "Cobbler"
         metadata["parent_menu_label"] = "Cobbler"
-        template_data: Dict[enums.BootLoader, Any] = {}
         boot_loaders = utils.get_supported_system_boot_loaders()
 
         if menu:
@@ -1104,31 +1312,7 @@ class TFTPGen:
                 if parent_menu.display_name and parent_menu.display_name != "":
                     metadata["parent_menu_label"] = parent_menu.display_name
 
-        for boot_loader in boot_loaders:
-            search_result = self.api.find_template(
-                True, False, tags=f"{boot_loader.value}_submenu"
-            )
-            if search_result is None or not isinstance(search_result, list):
-                raise TypeError(
-                    f"Search result for {boot_loader} Sub-Menu Template must of of type list!"
-                )
-            submenu_template: Optional["Template"] = None
-            for template in search_result:
-                if enums.TemplateTag.ACTIVE.value in template.tags:
-                    submenu_template = template
-                    break
-                if enums.TemplateTag.DEFAULT.value in template.tags:
-                    submenu_template = template
-
-            if submenu_template is None:
-                self.logger.warning(
-                    'Template for building a submenu not found for bootloader "%s"! Submenu '
-                    "structure thus missing for this bootloader.",
-                    boot_loader.value,
-                )
-                continue
-
-            template_data[boot_loader] = submenu_template.content
+        template_data = self._get_submenu_templates()
 
         self.get_submenus(menu, metadata, arch)
         nested_menu_items = metadata["menu_items"]
@@ -1250,8 +1434,9 @@ class TFTPGen:
         if boot_loaders is None or bootloader_format not in boot_loaders:
             return None  # type: ignore
 
-        settings = input_converters.input_string_or_dict(self.settings.to_dict())
-        metadata.update(settings)  # type: ignore
+        # Layer the settings on top of the passed metadata instead of copying them into it. The snapshot is shared by
+        # all files rendered until the settings change, everything set below only ends up in the first map.
+        metadata = ChainMap({}, self.settings.snapshot(), metadata)  # type: ignore
         # ---
         # just some random variables
         buffer = ""
@@ -1349,8 +1534,7 @@ class TFTPGen:
             # Ensure destination path exists to avoid race condition
             if not os.path.exists(os.path.dirname(filename)):
                 filesystem_helpers.mkdir(os.path.dirname(filename))
-            with open(filename, "w", encoding="UTF-8") as pxe_file_fd:
-                pxe_file_fd.write(buffer)
+            filesystem_helpers.write_file(filename, buffer)
         return buffer
 
     def build_kernel(
@@ -1816,8 +2000,7 @@ class TFTPGen:
 
             if write_file:
                 self.logger.info("generating: %s", dest)
-                with open(dest, "w", encoding="UTF-8") as template_fd:
-                    template_fd.write(buffer)
+                filesystem_helpers.write_file(dest, buffer)
 
         return results
 
@@ -2131,8 +2314,7 @@ class TFTPGen:
         self.logger.info("generating: %s", bootcfg_path)
         if not os.path.exists(os.path.dirname(bootcfg_path)):
             filesystem_helpers.mkdir(os.path.dirname(bootcfg_path))
-        with open(bootcfg_path, "w", encoding="UTF-8") as bootcfg_path_fd:
-            bootcfg_path_fd.write(buffer)
+        filesystem_helpers.write_file(bootcfg_path, buffer)
 
         # symlink to esxi UEFI bootloader in same dir as boot.cfg
         # based on https://stackoverflow.com/a/55741590
@@ -2151,6 +2333,7 @@ class TFTPGen:
                     pass
             try:
                 os.replace(temp_link_file, link_file)
+                filesystem_helpers.record_generated_file(link_file)
             except OSError as os_error:
                 os.remove(temp_link_file)
                 raise OSError(f"Error creating symlink {link_file}") from os_error
@@ -2203,22 +2386,120 @@ class TFTPGen:
                 return self._read_chunk(initrd_path, offset, size)
         return None
 
+    def clear_generated_files(self) -> None:
+        """
+        Drop all generated configuration files that are cached for the TFTP server. This is done every time the menu
+        is rebuilt since the menu entries are part of the PXE configuration files.
+        """
+        with self.__generated_files_lock:
+            self.menu_generation += 1
+            self.__generated_files.clear()
+            self.__system_paths_stamp = None
+
+    def _get_system_tftp_paths(self, system: "System") -> List[pathlib.Path]:
+        """
+        Collect all paths of configuration files that may be generated for a system by ``generate_system_file``.
+
+        :param system: The system to collect the paths for.
+        :returns: The list of candidate paths. The system may not provide all of them.
+        """
+        short_name = system.name.split(".")[0]
+        s390_name = "linux" + short_name[7:10]
+        paths = [
+            pathlib.Path(f"/s390x/s_{s390_name}"),
+            pathlib.Path(f"/s390x/s_{s390_name}_conf"),
+            pathlib.Path(f"/s390x/s_{s390_name}_parm"),
+        ]
+        interfaces = list(system.interfaces.keys())
+        for name in interfaces:
+            pxe_name = system.get_config_filename(
+                interface=name, loader=enums.BootLoader.PXE
+            )
+            if pxe_name:
+                paths.append(pathlib.Path("/pxelinux.cfg", pxe_name))
+                paths.append(pathlib.Path("/esxi/pxelinux.cfg", pxe_name))
+            grub_name = system.get_config_filename(
+                interface=name, loader=enums.BootLoader.GRUB
+            )
+            if grub_name:
+                paths.append(pathlib.Path("/grub/system", grub_name))
+        if interfaces:
+            paths.append(pathlib.Path("/esxi/system", system.name, "boot.cfg"))
+        return paths
+
+    def _find_systems_by_tftp_path(
+        self, path: pathlib.Path, modified_time: float
+    ) -> List["System"]:
+        """
+        Look up the systems that may provide a configuration file with the given path. The reverse index from paths to
+        systems is built with a single pass over all systems and rebuilt when Cobbler has been modified.
+
+        :param path: The normalized path of the requested file.
+        :param modified_time: The time of the last modification to Cobbler.
+        :returns: The candidate systems in the order of the systems collection.
+        """
+        stamp = (
+            modified_time,
+            self.menu_generation,
+            len(self.systems),
+            len(self.api.network_interfaces()),
+        )
+        with self.__generated_files_lock:
+            if self.__system_paths_stamp != stamp:
+                system_paths: Dict[pathlib.Path, List[str]] = {}
+                for system in self.systems:
+                    for system_path in self._get_system_tftp_paths(system):
+                        uids = system_paths.setdefault(system_path, [])
+                        if system.uid not in uids:
+                            uids.append(system.uid)
+                self.__system_paths = system_paths
+                self.__system_paths_stamp = stamp
+            uids = self.__system_paths.get(path, [])
+        result: List["System"] = []
+        for uid in uids:
+            system = self.systems.listing.get(uid)
+            if system is not None:
+                result.append(system)
+        return result
+
     def _generate_tftp_config_file(
         self, path: pathlib.Path, offset: int, size: int
     ) -> Optional[Tuple[bytes, int]]:
+        modified_time = self.api.last_modified_time()
+        stamp = (modified_time, self.menu_generation)
+        with self.__generated_files_lock:
+            cached_file = self.__generated_files.get(path)
+            if cached_file is not None:
+                cached_stamp, system_uid, system_mtime, enc = cached_file
+                system = self.systems.listing.get(system_uid) if system_uid else None
+                if cached_stamp == stamp and (
+                    not system_uid
+                    or (system is not None and system.mtime == system_mtime)
+                ):
+                    self.__generated_files.move_to_end(path)
+                    return enc[offset : offset + size], len(enc)
+                del self.__generated_files[path]
+
         metadata = self.get_menu_items()
-        # TODO: This iterates through all systems for each request. Can this be optimized?
         contents = None
-        for system in self.api.systems():
+        system_uid = ""
+        system_mtime = 0.0
+        for system in self._find_systems_by_tftp_path(path, modified_time):
             if not system.is_management_supported():
                 continue
             contents = self.generate_system_file(system, path, metadata)
             if contents is not None:
+                system_uid = system.uid
+                system_mtime = system.mtime
                 break
         if contents is None:
             contents = self.generate_pxe_menu(path, metadata)
         if contents is not None:
             enc = contents.encode("UTF-8")
+            with self.__generated_files_lock:
+                self.__generated_files[path] = (stamp, system_uid, system_mtime, enc)
+                while len(self.__generated_files) > self.generated_file_cache_size:
+                    self.__generated_files.popitem(last=False)
             return enc[offset : offset + size], len(enc)
         return None
 
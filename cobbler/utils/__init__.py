@@ -16,6 +16,8 @@ import re
 import shutil
 import subprocess
 import sys
+import threading
+import time
 import traceback
 import urllib.error
 import urllib.request
@@ -26,7 +28,9 @@ from typing import (
     Any,
     Dict,
     Hashable,
+    Iterator,
     List,
+    Mapping,
     Optional,
     Pattern,
     Tuple,
@@ -76,6 +80,9 @@ re_initrd = re.compile(r"(initrd(.*)\.img|ramdisk\.image\.gz|boot\.sdi|imgpayld\
 # logging.getLogger is not annotated fully according to pylance.
 logger = logging.getLogger()  # type: ignore
 
+# Per thread state of blend_cache()
+_blend_context = threading.local()
+
 
 def die(msg: str) -> None:
     """
@@ -463,12 +470,12 @@ def blender(
     :param root_obj: The object which should act as the root-node object.
     :return: A dictionary with all the information from the root node downwards.
     """
+    start_time = time.monotonic()
     tree = root_obj.grab_tree()
     tree.reverse()  # start with top of tree, override going down
     results: Dict[str, Any] = {}
     results["obj_type"] = root_obj.TYPE_NAME
-    for node in tree:
-        __consolidate(node, results)
+    results.update(__consolidate_tree(api_handle, tree))
     # Make interfaces accessible without Cheetah-voodoo in the templates
     # EXAMPLE: $ip == $ip0, $ip1, $ip2 and so on.
 
@@ -535,6 +542,100 @@ def blender(
         # is a distro object
         results["distro_name"] = results["name"]
 
+    statistics: Optional[Dict[str, Any]] = getattr(_blend_context, "statistics", None)
+    if statistics is not None:
+        statistics["blends"] += 1
+        statistics["time"] += time.monotonic() - start_time
+    return results
+
+
+@contextlib.contextmanager
+def blend_cache() -> Iterator[Dict[str, Any]]:
+    """
+    Context manager which memoizes the consolidated data of every tree node that is blended by ``blender()`` in the
+    current thread. Children are composed from the cached data of their parents, so items shared by many systems are
+    only consolidated once. A cached node is only reused as long as the modification time of the node and of all its
+    parents is unchanged. Nested contexts share the cache of the outermost one.
+
+    :return: Statistics with the number of blends, the number of tree nodes served from the cache and the time spent
+             blending in seconds. The values are final once the context is left.
+    """
+    statistics: Optional[Dict[str, Any]] = getattr(_blend_context, "statistics", None)
+    if statistics is not None:
+        yield statistics
+        return
+    statistics = {"blends": 0, "cached_nodes": 0, "time": 0.0}
+    _blend_context.nodes = {}
+    _blend_context.statistics = statistics
+    try:
+        yield statistics
+    finally:
+        del _blend_context.nodes
+        del _blend_context.statistics
+
+
+def __copy_consolidated(data: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Copy consolidated data with the same depth as ``__consolidate`` copies the data of a node.
+
+    :param data: The consolidated data.
+    :return: The copy.
+    """
+    return {
+        key: value.copy() if isinstance(value, (dict, list)) else value  # type: ignore
+        for key, value in data.items()
+    }
+
+
+def __consolidate_tree(
+    api_handle: "CobblerAPI", tree: List[Union["ITEM", "Settings"]]
+) -> Dict[str, Any]:
+    """
+    Consolidate the data of all nodes of a tree. Inside of ``blend_cache()`` the consolidated data of every node is
+    memoized.
+
+    :param api_handle: The api to use for validating the cached data.
+    :param tree: The nodes starting at the top of the tree.
+    :return: The consolidated data.
+    """
+    results: Dict[str, Any] = {}
+    nodes: Optional[Dict[str, Tuple[Tuple[Any, ...], Dict[str, Any]]]] = getattr(
+        _blend_context, "nodes", None
+    )
+    if nodes is None:
+        for node in tree:
+            if isinstance(node, settings.Settings):
+                # Settings contain no inherited values, so their snapshot is already consolidated.
+                results.update(__copy_consolidated(node.snapshot()))
+            else:
+                __consolidate(node, results)
+        return results
+
+    statistics: Dict[str, Any] = _blend_context.statistics
+    stamp: Tuple[Any, ...] = ()
+    cached: Optional[Dict[str, Any]] = {}
+    for node in tree:
+        if isinstance(node, settings.Settings):
+            key = "settings"
+            stamp += ((key, api_handle.resolved_cache_generation, node.version),)
+        else:
+            key = node.uid
+            stamp += ((key, node.mtime),)
+        if cached is not None:
+            entry = nodes.get(key)
+            if entry is not None and entry[0] == stamp:
+                cached = entry[1]
+                statistics["cached_nodes"] += 1
+                continue
+            results = __copy_consolidated(cached)
+            cached = None
+        if isinstance(node, settings.Settings):
+            results.update(__copy_consolidated(node.snapshot()))
+        else:
+            __consolidate(node, results)
+        nodes[key] = (stamp, __copy_consolidated(results))
+    if cached is not None:
+        results = __copy_consolidated(cached)
     return results
 
 
@@ -0,0 +1,84 @@
+"""
+This module contains the logic to expire the entries of the in-memory caches of the XML-RPC API without scanning them.
+"""
+
+import heapq
+import threading
+from typing import Callable, Dict, Generic, List, Tuple, TypeVar
+
+VALUE = TypeVar("VALUE")
+
+
+class ExpiryQueue(Generic[VALUE]):
+    """
+    Min-heap of the deadlines of the entries of a dict. Entries may be refreshed by updating their timestamp in the dict
+    without touching the heap: once their old deadline is reached the current timestamp is read and the entry is
+    scheduled again. Entries removed from the dict by other code are skipped. Thus, every entry costs O(log n) once per
+    timeout and a check without expired entries is O(1). A raised timeout applies once the old deadline is reached, a
+    lowered timeout rebuilds the heap in O(n) at the next check.
+    """
+
+    def __init__(
+        self,
+        entries: Dict[str, VALUE],
+        timestamp: Callable[[VALUE], float],
+        timeout: Callable[[], float],
+    ) -> None:
+        """
+        Constructor
+
+        :param entries: The dict whose entries expire. It is modified in place.
+        :param timestamp: Returns the time an entry was last used.
+        :param timeout: Returns the number of seconds after which an unused entry expires. This is called for every
+                        expiry check, so changes to the timeout apply to the existing entries as well.
+        """
+        self.entries = entries
+        self.timestamp = timestamp
+        self.timeout = timeout
+        self.__heap: List[Tuple[float, str]] = []
+        # The largest timeout any deadline in the heap was computed with.
+        self.__heap_timeout = 0.0
+        self.__lock = threading.Lock()
+
+    def push(self, key: str) -> None:
+        """
+        Schedule the expiry of an entry that was added to the dict.
+
+        :param key: The key of the entry.
+        """
+        timeout = self.timeout()
+        deadline = self.timestamp(self.entries[key]) + timeout
+        with self.__lock:
+            heapq.heappush(self.__heap, (deadline, key))
+            self.__heap_timeout = max(self.__heap_timeout, timeout)
+
+    def expire(self, now: float) -> List[str]:
+        """
+        Remove all entries from the dict whose deadline has passed.
+
+        :param now: The current time.
+        :return: The keys of the removed entries.
+        """
+        expired: List[str] = []
+        timeout = self.timeout()
+        with self.__lock:
+            if timeout < self.__heap_timeout:
+                # Deadlines computed with a larger timeout would only be reached too late.
+                self.__heap = [
+                    (self.timestamp(entry) + timeout, key)
+                    for key, entry in list(self.entries.items())
+                ]
+                heapq.heapify(self.__heap)
+                self.__heap_timeout = timeout
+            while self.__heap and self.__heap[0][0] < now:
+                _, key = heapq.heappop(self.__heap)
+                entry = self.entries.get(key)
+                if entry is None:
+                    continue
+                deadline = self.timestamp(entry) + timeout
+                if deadline < now:
+                    self.entries.pop(key, None)
+                    expired.append(key)
+                else:
+                    heapq.heappush(self.__heap, (deadline, key))
+        return expired
@@ -2,27 +2,51 @@
 Utilities for filesystem operations used by Cobbler, including file linking, copying, hashing, and directory management.
 """
 
+import contextlib
 import errno
 import glob
 import hashlib
-import json
 import logging
 import os
 import pathlib
 import shutil
+import sqlite3
+import stat
 import subprocess
+import tempfile
+import threading
 import urllib.request
-from typing import TYPE_CHECKING, Dict, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from cobbler import utils
 from cobbler.cexceptions import CX
-from cobbler.utils import log_exc, mtab
+from cobbler.utils import log_exc, mtab, thread
 
 if TYPE_CHECKING:
     from cobbler.api import CobblerAPI
 
 
 logger = logging.getLogger()
+_generated_files = threading.local()
+
+# The SHA1 sums of the files in the link caches are independent of the cache, so one index is shared by all caches.
+# It is kept outside the caches because a full sync removes the caches in the TFTP and web directories.
+HASH_INDEX_PATH = "/var/lib/cobbler/link_cache.db"
+HASH_BUFFER_SIZE = 1024 * 1024
+_hash_index: Optional["HashIndex"] = None
+_hash_index_lock = threading.Lock()
+_inherited_hash_indexes: List["HashIndex"] = []
 
 
 def is_safe_to_hardlink(src: str, dst: str, api: "CobblerAPI") -> bool:
@@ -80,36 +104,232 @@ def sha1_file(file_path: Union[str, pathlib.Path], buffer_size: int = 65536) ->
     return sha1.hexdigest()
 
 
-def hashfile(file_name: str, lcache: Optional[pathlib.Path] = None) -> Optional[str]:
+class HashIndex:
+    """
+    Persistent index of the SHA1 sums of the files which are copied into the link caches. The index is an SQLite
+    database keyed by the path of the file. An entry is only valid as long as the inode, the size and the modification
+    time of the file are unchanged. New entries are committed in batches.
+    """
+
+    schema = (
+        "CREATE TABLE IF NOT EXISTS hashes (path TEXT PRIMARY KEY, inode INTEGER, size INTEGER, mtime INTEGER, "
+        "sha1 TEXT)"
+    )
+
+    def __init__(self, path: str, batch_size: int = 256) -> None:
+        """
+        Constructor
+
+        :param path: The SQLite database the index is stored in.
+        :param batch_size: The number of new entries which may be pending inside of ``batch()`` before they are
+                           committed.
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.hits = 0
+        self.misses = 0
+        self.__connection: Optional[sqlite3.Connection] = None
+        self.__pending = 0
+        self.__batch_depth = 0
+        self.__lock = threading.Lock()
+        thread.register_fork_locks(self, self.__lock)
+
+    def __connect(self) -> sqlite3.Connection:
+        """
+        Open the database if it isn't open yet. The database is reopened if it was removed in the meantime.
+
+        :return: The connection to the database.
+        """
+        if self.__connection is not None and not os.path.exists(self.path):
+            self.__connection.close()
+            self.__connection = None
+            self.__pending = 0
+        if self.__connection is None:
+            mkdir(os.path.dirname(self.path))
+            connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            try:
+                connection.execute(self.schema)
+            except sqlite3.DatabaseError:
+                # The index is only a cache, thus a damaged one is simply started over.
+                connection.close()
+                logger.warning(
+                    "Link cache index %s is damaged, recreating it", self.path
+                )
+                os.remove(self.path)
+                connection = sqlite3.connect(
+                    self.path, timeout=30, check_same_thread=False
+                )
+                connection.execute(self.schema)
+            connection.commit()
+            self.__connection = connection
+        return self.__connection
+
+    def hash_file(self, file_name: str) -> Optional[str]:
+        """
+        Return the SHA1 sum of a file. The file is only read if the index doesn't know its current state.
+
+        :param file_name: The file to get the SHA1 sum of.
+        :return: The SHA1 sum or None if the file doesn't exist.
+        """
+        try:
+            stat = os.stat(file_name)
+        except FileNotFoundError:
+            return None
+        key = (file_name, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        with self.__lock:
+            row = (
+                self.__connect()
+                .execute(
+                    "SELECT sha1 FROM hashes WHERE path = ? AND inode = ? AND size = ? AND mtime = ?",
+                    key,
+                )
+                .fetchone()
+            )
+            if row is not None:
+                self.hits += 1
+                return row[0]
+            self.misses += 1
+        sha1 = sha1_file(file_name, buffer_size=HASH_BUFFER_SIZE)
+        with self.__lock:
+            self.__connect().execute(
+                "INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?, ?)", key + (sha1,)
+            )
+            self.__pending += 1
+            if self.__batch_depth == 0 or self.__pending >= self.batch_size:
+                self.__commit()
+        return sha1
+
+    def hash_files(
+        self, file_names: Iterable[str], workers: int = 1
+    ) -> Dict[str, Optional[str]]:
+        """
+        Return the SHA1 sums of many files. Files the index doesn't know are read in parallel.
+
+        :param file_names: The files to get the SHA1 sums of.
+        :param workers: The number of threads which read the files. ``0`` uses one thread per CPU.
+        :return: The SHA1 sums by file name. The sum is None for files that don't exist.
+        """
+        unique_names = list(dict.fromkeys(file_names))
+        if workers <= 0:
+            workers = os.cpu_count() or 1
+        if workers == 1 or len(unique_names) < 2:
+            return {file_name: self.hash_file(file_name) for file_name in unique_names}
+        with self.batch():
+            with ThreadPoolExecutor(
+                max_workers=workers,
+                thread_name_prefix=thread.helper_thread_prefix("hashfile"),
+            ) as executor:
+                return dict(
+                    zip(unique_names, executor.map(self.hash_file, unique_names))
+                )
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[Dict[str, int]]:
+        """
+        Context manager which defers the commits of new entries until the context is left or ``batch_size`` entries
+        are pending. Nested contexts are committed together with the outermost one.
+
+        :return: Statistics with the number of files served from the index ("hits") and the number of files that had
+                 to be read ("misses") while the context was active. The values are final once the context is left.
+        """
+        statistics = {"hits": 0, "misses": 0}
+        with self.__lock:
+            self.__batch_depth += 1
+            hits, misses = self.hits, self.misses
+        try:
+            yield statistics
+        finally:
+            with self.__lock:
+                self.__batch_depth -= 1
+                if self.__batch_depth == 0:
+                    self.__commit()
+                statistics["hits"] = self.hits - hits
+                statistics["misses"] = self.misses - misses
+
+    def __commit(self) -> None:
+        """
+        Commit the pending entries. The caller must hold the lock.
+        """
+        if self.__connection is not None and self.__pending:
+            self.__connection.commit()
+        self.__pending = 0
+
+    def close(self) -> None:
+        """
+        Commit the pending entries and close the database.
+        """
+        with self.__lock:
+            self.__commit()
+            if self.__connection is not None:
+                self.__connection.close()
+                self.__connection = None
+
+
+def get_hash_index() -> HashIndex:
+    """
+    Return the hash index which is shared by all link caches.
+
+    :return: The index stored at ``HASH_INDEX_PATH``.
+    """
+    global _hash_index
+    with _hash_index_lock:
+        if _hash_index is None or _hash_index.path != HASH_INDEX_PATH:
+            _hash_index = HashIndex(HASH_INDEX_PATH)
+        return _hash_index
+
+
+def _reset_hash_index() -> None:
+    """
+    Drop the hash index inherited by a forked child, the child opens its own connection to the database on first use.
+    The inherited index stays referenced without ever being used again because closing its connection would roll back
+    the pending entries of the parent.
+    """
+    global _hash_index, _hash_index_lock
+    if _hash_index is not None:
+        _inherited_hash_indexes.append(_hash_index)
+    _hash_index = None
+    _hash_index_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_hash_index)
+
+
+def hashfile(file_name: str) -> Optional[str]:
     r"""
-    Returns the sha1sum of the file
+    Returns the sha1sum of the file. The sum is looked up in the shared hash index to avoid reading the file again as
+    long as it is unchanged.
 
     :param file_name: The file to get the sha1sum of.
-    :param lcache: This is a directory where Cobbler would store its ``link_cache.json`` file to speed up the return
-                   of the hash. The hash looked up would be checked against the Cobbler internal mtime of the object.
     :return: The sha1 sum or None if the file doesn't exist.
     """
-    hashfile_db: Dict[str, Tuple[float, str]] = {}
-    if lcache is None:
-        return None
+    return get_hash_index().hash_file(file_name)
 
-    dbfile = pathlib.Path(lcache) / "link_cache.json"
-    if dbfile.exists():
-        hashfile_db = json.loads(dbfile.read_text(encoding="utf-8"))
 
-    file = pathlib.Path(file_name)
-    if file.exists():
-        mtime = file.stat().st_mtime
-        if file_name in hashfile_db:
-            if hashfile_db[file_name][0] >= mtime:
-                return hashfile_db[file_name][1]
+def hash_link_sources(
+    api: "CobblerAPI",
+    links: Iterable[Tuple[str, str]],
+    symlink_ok: bool = False,
+    workers: int = 1,
+) -> Dict[str, int]:
+    """
+    Hash the sources of the links which ``linkfile()`` can neither hardlink nor symlink ahead of time in parallel. The
+    subsequent ``linkfile()`` calls find their hashes in the hash index then.
 
-        key = sha1_file(file_name)
-        hashfile_db[file_name] = (mtime, key)
-        __create_if_not_exists(lcache)
-        dbfile.write_text(json.dumps(hashfile_db), encoding="utf-8")
-        return key
-    return None
+    :param api: The api-instance to check if a file can be hardlinked with.
+    :param links: Pairs of the source and the destination of the links.
+    :param symlink_ok: If it is okay to use a symbolic link for the links.
+    :param workers: The number of threads which read the files. ``0`` uses one thread per CPU.
+    :return: The statistics of ``HashIndex.batch()``.
+    """
+    sources: List[str] = []
+    if not symlink_ok:
+        for src, dst in links:
+            if not is_safe_to_hardlink(src, dst, api):
+                sources.append(src)
+    hash_index = get_hash_index()
+    with hash_index.batch() as statistics:
+        hash_index.hash_files(sources, workers)
+    return statistics
 
 
 def cachefile(src: str, dst: str) -> None:
@@ -123,7 +343,7 @@ def cachefile(src: str, dst: str) -> None:
     lcache = pathlib.Path(dst).parent.parent / ".link_cache"
     if not lcache.is_dir():
         lcache.mkdir()
-    key = hashfile(src, lcache=lcache)
+    key = hashfile(src)
     if key is None:
         logger.info("Cachefile skipped due to missing key for it!")
         return None
@@ -151,6 +371,7 @@ def linkfile(
     :param cache: If it is okay to use a cached file instead of the real one.
     :raises CX: Raised in case the API is not given.
     """
+    record_generated_file(dst)
     dst_obj = pathlib.Path(dst)
     src_obj = pathlib.Path(src)
     if dst_obj.exists():
@@ -225,6 +446,73 @@ def copyfile(src: str, dst: str, symlink: bool = False) -> None:
             # raise CX("Error copying %(src)s to %(dst)s" % { "src" : src, "dst" : dst})
 
 
+@contextlib.contextmanager
+def record_generated_files() -> Iterator[Set[str]]:
+    """
+    Collect the paths of all files which the current thread generates with ``write_file()`` or ``linkfile()`` while
+    the context is active. Nested contexts report their paths to the enclosing context as well.
+
+    :return: The set which is filled with the absolute paths of the generated files.
+    """
+    previous: Optional[Set[str]] = getattr(_generated_files, "paths", None)
+    paths: Set[str] = set()
+    _generated_files.paths = paths
+    try:
+        yield paths
+    finally:
+        _generated_files.paths = previous
+        if previous is not None:
+            previous.update(paths)
+
+
+def record_generated_file(path: str) -> None:
+    """
+    Report a generated file to the active ``record_generated_files()`` context of the current thread, if any.
+
+    :param path: The path of the generated file.
+    """
+    paths: Optional[Set[str]] = getattr(_generated_files, "paths", None)
+    if paths is not None:
+        paths.add(os.path.abspath(path))
+
+
+def write_file(path: str, data: str) -> bool:
+    """
+    Write a text file unless it already has exactly the given content. Unchanged files keep their inode and mtime. The
+    content is written to a temporary file which then replaces the file, thus readers never see a partial file. The
+    file keeps its mode, new files are created with mode 0644. If the path is a symlink, the file it points to is
+    replaced.
+
+    :param path: The file to write.
+    :param data: The new content of the file.
+    :return: True if the file was written.
+    """
+    record_generated_file(path)
+    try:
+        if pathlib.Path(path).read_bytes() == data.encode("UTF-8"):
+            return False
+    except OSError:
+        pass
+    target = os.path.realpath(path)
+    try:
+        mode = stat.S_IMODE(os.stat(target).st_mode)
+    except FileNotFoundError:
+        mode = 0o644
+    tmp_fd, tmp_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(target)}.", dir=os.path.dirname(target)
+    )
+    try:
+        with os.fdopen(tmp_fd, "w", encoding="UTF-8") as file_fd:
+            file_fd.write(data)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, target)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+        raise
+    return True
+
+
 def copyremotefile(src: str, dst1: str, api: Optional["CobblerAPI"] = None) -> None:
     """
     Copys a file from a remote place to the local destionation.
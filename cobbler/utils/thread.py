@@ -2,10 +2,16 @@
 This module is responsible for managing the custom common threading logic Cobbler has.
 """
 
+import contextlib
+import heapq
+import itertools
 import logging
+import os
 import pathlib
-from threading import Thread
-from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+import time
+import weakref
+from threading import Lock, Thread, current_thread
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from cobbler import enums, utils
 
@@ -13,6 +19,90 @@ if TYPE_CHECKING:
     from cobbler.api import CobblerAPI
     from cobbler.remote import CobblerXMLRPCInterface
 
+TASK_PRIORITIES: Dict[str, int] = {
+    "load_items": 0,
+    "power": 0,
+    "sync": 0,
+    "syncsystems": 0,
+    "aclsetup": 1,
+    "mkloaders": 1,
+    "sigreload": 1,
+    "sigupdate": 1,
+    "templates_refresh_content": 1,
+    "validate_autoinstall_files": 1,
+}
+"""
+The priority of the queued tasks by their task name, lower values are started first. Long running tasks like reposync or
+buildiso get :data:`DEFAULT_TASK_PRIORITY`.
+"""
+DEFAULT_TASK_PRIORITY = 2
+
+
+def helper_thread_prefix(name: str) -> str:
+    """
+    Name helper threads, e.g. of a ``ThreadPoolExecutor``, after the thread that starts them. This way the log records
+    of the helper threads end up in the task log if they are started by a :class:`CobblerThread`.
+
+    :param name: What the helper threads do.
+    :return: The prefix for the names of the helper threads.
+    """
+    return f"{current_thread().name}-{name}"
+
+
+_fork_locks: "weakref.WeakKeyDictionary[Any, Tuple[Any, ...]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def register_fork_locks(owner: Any, *locks: Any) -> None:
+    """
+    Register the locks of an object which are used by forked worker processes. See :func:`fork_locks_held`.
+
+    :param owner: The object the locks belong to. The locks are forgotten together with the object.
+    :param locks: The ``Lock`` and ``RLock`` objects of the owner.
+    """
+    _fork_locks[owner] = locks
+
+
+@contextlib.contextmanager
+def fork_locks_held() -> Iterator[None]:
+    """
+    Hold all registered locks while worker processes are forked. No other thread can be inside of a locked section at
+    the time of the fork then, thus the children don't inherit half finished updates. A lock that is busy makes this
+    release all locks again and retry, so threads nesting the locks in another order can't deadlock with it. The
+    calling thread must not hold any of the locks itself.
+    """
+    locks = [lock for owner_locks in list(_fork_locks.values()) for lock in owner_locks]
+    while True:
+        acquired: List[Any] = []
+        for lock in locks:
+            if not lock.acquire(blocking=False):
+                break
+            acquired.append(lock)
+        else:
+            break
+        for lock in reversed(acquired):
+            lock.release()
+        time.sleep(0.001)
+    try:
+        yield
+    finally:
+        for lock in reversed(locks):
+            lock.release()
+
+
+def _reinit_fork_locks() -> None:
+    """
+    Reset the registered locks in a forked child. They are held by the forking thread or by threads that don't exist in
+    the child.
+    """
+    for owner_locks in list(_fork_locks.values()):
+        for lock in owner_locks:
+            lock._at_fork_reinit()  # pylint: disable=protected-access
+
+
+os.register_at_fork(after_in_child=_reinit_fork_locks)
+
 
 class CobblerThread(Thread):
     """
@@ -45,9 +135,10 @@ class CobblerThread(Thread):
         self.remote = remote
         self.logger = logging.getLogger()
         self.__task_log_handler: Optional[logging.FileHandler] = None
-        self.__setup_logger()
         self._run = run
         self.on_done = on_done
+        # Set by the TaskExecutor to learn that the thread is done, no matter if it succeeded or not.
+        self.on_finish: Optional[Callable[["CobblerThread"], None]] = None
         self.options = options
         self.task_name = task_name
         self.api = api
@@ -62,9 +153,24 @@ class CobblerThread(Thread):
             "[%(threadName)s] %(asctime)s - %(levelname)s | %(message)s"
         )
         self.__task_log_handler.setFormatter(task_log_formatter)
+        # The actions log to the root logger, other tasks running at the same time must not end up in this task log.
+        self.__task_log_handler.addFilter(self.__is_own_record)
         self.logger.setLevel(logging.INFO)
         self.logger.addHandler(self.__task_log_handler)
 
+    def __is_own_record(self, record: logging.LogRecord) -> bool:
+        """
+        Check if a log record was emitted by this thread or by one of its helper threads. Helper threads belong to the
+        task if their name starts with the name of the task thread followed by a dash, see
+        :func:`helper_thread_prefix`. Records of other helper threads are not part of the task log.
+
+        :param record: The log record.
+        :return: True if the record belongs into the log of this task.
+        """
+        return record.thread == self.ident or (record.threadName or "").startswith(
+            f"{self.name}-"
+        )
+
     def _set_task_state(self, new_state: enums.EventStatus):
         """
         Set the state of the task. (For internal use only)
@@ -89,12 +195,17 @@ class CobblerThread(Thread):
 
         :return: The return code of the action. This may a boolean or a Linux return code.
         """
-        self.logger.info("start_task(%s); event_id(%s)", self.task_name, self.event_id)
         lock = "load_items_lock" in self.options and self.task_name != "load_items"
         if lock:
             # Shared lock to suspend execution of _background_load_items
             self.options["load_items_lock"].acquire(blocking=False)
         try:
+            # Inside the try, thus the slot of the task is freed even if the task log can't be opened
+            self.__setup_logger()
+            self._set_task_state(enums.EventStatus.RUNNING)
+            self.logger.info(
+                "start_task(%s); event_id(%s)", self.task_name, self.event_id
+            )
             if utils.run_triggers(
                 api=self.api,
                 globber=f"/var/lib/cobbler/triggers/task/{self.task_name}/pre/*",
@@ -124,3 +235,107 @@ class CobblerThread(Thread):
                 self.options["load_items_lock"].release()
             if self.__task_log_handler is not None:
                 self.logger.removeHandler(self.__task_log_handler)
+                self.__task_log_handler.close()
+            if self.on_finish is not None:
+                self.on_finish(self)
+
+
+class TaskExecutor:
+    """
+    Starts the background tasks of the XML-RPC API with a bounded concurrency. Tasks wait in a priority queue until the
+    overall limit and the limit of their task name allow them to run. The limits are read from the
+    ``background_tasks`` setting every time a task is queued or finished.
+    """
+
+    def __init__(self, api: "CobblerAPI") -> None:
+        """
+        Constructor
+
+        :param api: The Cobbler api object to read the limits from.
+        """
+        self.api = api
+        self.__queue: List[Tuple[int, int, CobblerThread]] = []
+        self.__running: Dict[str, CobblerThread] = {}
+        self.__counter = itertools.count()
+        self.__lock = Lock()
+
+    def submit(self, task: CobblerThread) -> None:
+        """
+        Queue a task. It is started right away if the limits allow it.
+
+        :param task: The task to run.
+        """
+        task.on_finish = self.__task_finished
+        task._set_task_state(  # pylint: disable=protected-access
+            enums.EventStatus.QUEUED
+        )
+        priority = TASK_PRIORITIES.get(task.task_name, DEFAULT_TASK_PRIORITY)
+        with self.__lock:
+            heapq.heappush(self.__queue, (priority, next(self.__counter), task))
+            self.__dispatch()
+
+    def cancel(self, event_id: str) -> bool:
+        """
+        Cancel a task that is still queued. Running tasks can't be interrupted.
+
+        :param event_id: The event id of the task.
+        :return: True if the task was removed from the queue.
+        """
+        with self.__lock:
+            for index, (_, _, task) in enumerate(self.__queue):
+                if task.event_id == event_id:
+                    self.__queue.pop(index)
+                    heapq.heapify(self.__queue)
+                    break
+            else:
+                return False
+        task._set_task_state(  # pylint: disable=protected-access
+            enums.EventStatus.CANCELLED
+        )
+        return True
+
+    def status(self) -> Dict[str, int]:
+        """
+        Describe the current load of the executor.
+
+        :return: The number of queued and running tasks.
+        """
+        with self.__lock:
+            return {
+                "tasks_queued": len(self.__queue),
+                "tasks_running": len(self.__running),
+            }
+
+    def __task_finished(self, task: CobblerThread) -> None:
+        """
+        Free the slot of a finished task and start the next queued tasks.
+
+        :param task: The finished task.
+        """
+        with self.__lock:
+            self.__running.pop(task.event_id, None)
+            self.__dispatch()
+
+    def __dispatch(self) -> None:
+        """
+        Start queued tasks in the order of their priority as long as the limits allow it. Must be called with the lock
+        held.
+        """
+        task_settings = self.api.settings().background_tasks
+        max_running: int = task_settings.get("max_running", 0)
+        limits: Dict[str, int] = task_settings.get("limits", {})
+        blocked: List[Tuple[int, int, CobblerThread]] = []
+        while self.__queue and (max_running <= 0 or len(self.__running) < max_running):
+            entry = heapq.heappop(self.__queue)
+            task = entry[2]
+            limit = limits.get(task.task_name, 0)
+            if limit > 0 and limit <= sum(
+                1 for x in self.__running.values() if x.task_name == task.task_name
+            ):
+                # Tasks with a lower priority may still run in the meantime
+                blocked.append(entry)
+                continue
+            self.__running[task.event_id] = task
+            task.start()
+        for entry in blocked:
+            heapq.heappush(self.__queue, entry)
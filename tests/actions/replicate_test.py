@@ -2,7 +2,8 @@
 Tests for the replicate action of Cobbler.
 """
 
-from typing import Callable
+import xmlrpc.client
+from typing import Any, Callable, Dict, Optional
 
 import pytest
 from pytest_mock import MockerFixture
@@ -10,6 +11,7 @@ from pytest_mock import MockerFixture
 from cobbler.actions import replicate
 from cobbler.api import CobblerAPI
 from cobbler.items.distro import Distro
+from cobbler.items.profile import Profile
 
 
 @pytest.fixture(scope="function")
@@ -37,77 +39,116 @@ def test_rsync_it(mocker: MockerFixture, replicate_obj: replicate.Replicate):
     )
 
 
-def test_remove_objects_not_on_master(
-    mocker: MockerFixture, replicate_obj: replicate.Replicate
+@pytest.mark.parametrize(
+    "remote_digest,expected_hashes",
+    [
+        ("local", None),
+        ("remote", {"fake_uid": "fake_hash"}),
+    ],
+)
+def test_fetch_item_hashes(
+    mocker: MockerFixture,
+    replicate_obj: replicate.Replicate,
+    remote_digest: str,
+    expected_hashes: Optional[Dict[str, str]],
 ):
     """
-    Test that asserts that the remove_objects_not_on_master subroutine works as expected.
+    Test that asserts that the item hashes are only compared if the digests of the collections differ.
     """
     # Arrange
-    replicate_obj.local_data["distro"] = []
-    replicate_obj.remote_data["distro"] = []
-    mocker.patch(
-        "cobbler.utils.lod_to_dod",
-        side_effect=[{"fake_uid": {"uid": "fake_uid", "name": "test"}}, {}],
+    mocker.patch.object(
+        replicate_obj.api, "get_item_hashes", return_value=("local", {})
     )
-    api_mock = mocker.patch.object(replicate_obj, "api")
+    remote_mock = mocker.MagicMock()
+    remote_mock.get_item_hashes.return_value = {  # type: ignore
+        "digest": remote_digest,
+        "hashes": {"fake_uid": "fake_hash"},
+    }
+    replicate_obj.remote = remote_mock
 
     # Act
-    replicate_obj.remove_objects_not_on_master("distro")
+    replicate_obj.fetch_item_hashes("distro")
 
     # Assert
-    api_mock.remove_item.assert_called_with("distro", "test", recursive=True)  # type: ignore
+    remote_mock.get_item_hashes.assert_called_with("distro", "local")  # type: ignore
+    assert replicate_obj.local_hashes["distro"] == {}
+    assert replicate_obj.remote_hashes["distro"] == expected_hashes
 
 
-def test_add_objects_not_on_local(
-    mocker: MockerFixture, replicate_obj: replicate.Replicate
+def test_remove_objects_not_on_master(
+    cobbler_api: CobblerAPI,
+    replicate_obj: replicate.Replicate,
+    create_distro: Callable[[], Distro],
+    create_profile: Callable[[str], Profile],
 ):
     """
-    Test that asserts that the add_objects_not_on_local subroutine works as expected.
+    Test that asserts that the remove_objects_not_on_master subroutine works as expected.
     """
     # Arrange
-    replicate_obj.local_data["distro"] = []
-    replicate_obj.remote_data["distro"] = []
-    replicate_obj.must_include["distro"] = ["test"]  # type: ignore
-    mocker.patch("cobbler.utils.lod_to_dod", return_value={})
-    mocker.patch(
-        "cobbler.utils.lod_sort_by_key",
-        return_value=[{"uid": "fake_uid", "name": "test"}],
-    )
-    api_mock = mocker.patch.object(replicate_obj, "api")
+    test_distro = create_distro()
+    test_profile = create_profile(test_distro.uid)
+    _, replicate_obj.local_hashes["distro"] = cobbler_api.get_item_hashes("distro")
+    replicate_obj.remote_hashes["distro"] = {}
 
     # Act
-    replicate_obj.add_objects_not_on_local("distro")
+    result = replicate_obj.remove_objects_not_on_master("distro")
 
     # Assert
-    api_mock.new_distro.assert_called_once()  # type: ignore
+    assert [(x.what, x.uid, x.to_delete) for x in result] == [
+        ("distro", test_distro.uid, True),
+        ("profile", test_profile.uid, True),
+    ]
 
 
-def test_replace_objects_newer_on_remote(
-    mocker: MockerFixture, replicate_obj: replicate.Replicate
+def test_update_objects_differing_on_remote(
+    mocker: MockerFixture,
+    cobbler_api: CobblerAPI,
+    replicate_obj: replicate.Replicate,
+    create_distro: Callable[[], Distro],
 ):
     """
-    Test that asserts that the replace_objects_newer_on_remote subroutine works as expected.
+    Test that asserts that only the differing objects are fetched from the master and applied in one transaction.
     """
     # Arrange
-    replicate_obj.local_data["distro"] = []
-    replicate_obj.remote_data["distro"] = []
-    replicate_obj.must_include["distro"] = ["test"]  # type: ignore
-    mocker.patch(
-        "cobbler.utils.lod_to_dod",
-        side_effect=[
-            {"fake_uid": {"uid": "fake_uid", "name": "test", "mtime": 4}},
-            {"fake_uid": {"uid": "fake_uid", "name": "test", "mtime": 5}},
+    unchanged_distro = create_distro()
+    changed_distro = create_distro()
+    remote_changed = changed_distro.serialize()
+    remote_changed["name"] = "replicated_rename"
+    remote_changed["comment"] = "changed on master"
+    _, replicate_obj.local_hashes["distro"] = cobbler_api.get_item_hashes("distro")
+    replicate_obj.remote_hashes["distro"] = {
+        unchanged_distro.uid: replicate_obj.local_hashes["distro"][
+            unchanged_distro.uid
         ],
-    )
-    api_mock = mocker.patch.object(replicate_obj, "api")
+        changed_distro.uid: "changed_hash",
+    }
+    replicate_obj.remote_data["distro"] = [
+        {"uid": unchanged_distro.uid, "name": unchanged_distro.name},
+        {"uid": changed_distro.uid, "name": "replicated_rename"},
+    ]
+    replicate_obj.must_include["distro"] = {
+        unchanged_distro.name: 1,
+        "replicated_rename": 1,
+    }
+    remote_mock = mocker.MagicMock()
+    remote_mock.get_items_by_uid.return_value = [remote_changed]  # type: ignore
+    replicate_obj.remote = remote_mock
 
     # Act
-    replicate_obj.replace_objects_newer_on_remote("distro")
+    result = replicate_obj.update_objects_differing_on_remote("distro")
+    cobbler_api.add_remove_items(result)
 
     # Assert
-    api_mock.new_distro.assert_called_once()  # type: ignore
-    api_mock.add_item.assert_called_once()  # type: ignore
+    remote_mock.get_items_by_uid.assert_called_once_with(  # type: ignore
+        "distro", [changed_distro.uid]
+    )
+    assert len(result) == 1
+    assert result[0].uid == changed_distro.uid
+    replicated_distro = cobbler_api.find_distro(name="replicated_rename")
+    assert isinstance(replicated_distro, Distro)
+    assert replicated_distro.uid == changed_distro.uid
+    assert replicated_distro.comment == "changed on master"
+    assert cobbler_api.find_distro(name=changed_distro.name) is None
 
 
 def test_replicate_data(mocker: MockerFixture, replicate_obj: replicate.Replicate):
@@ -119,9 +160,8 @@ def test_replicate_data(mocker: MockerFixture, replicate_obj: replicate.Replicat
     remote_mock.get_settings.return_value = {"webdir": "/srv/www/cobbler"}  # type: ignore
     remote_mock.get_items.return_value = {}  # type: ignore
     replicate_obj.remote = remote_mock
-    local_mock = mocker.MagicMock(return_value={"webdir": "/srv/www/cobbler"})
-    local_mock.get_items.return_value = {}  # type: ignore
-    replicate_obj.local = local_mock
+    replicate_obj.local = mocker.MagicMock()
+    mocker.patch.object(replicate_obj, "fetch_item_hashes")
     rsync_mock = mocker.patch.object(replicate_obj, "rsync_it")
     expected_rsync_it_calls = [
         mocker.call("cobbler-distros/config/", "/srv/www/cobbler/distro_mirror/config"),
@@ -129,18 +169,98 @@ def test_replicate_data(mocker: MockerFixture, replicate_obj: replicate.Replicat
         mocker.call("cobbler-triggers", "/var/lib/cobbler/triggers"),
         mocker.call("cobbler-scripts", "/var/lib/cobbler/scripts"),
     ]
-    not_on_local_mock = mocker.patch.object(replicate_obj, "add_objects_not_on_local")
-    newer_on_remote_mock = mocker.patch.object(
-        replicate_obj, "replace_objects_newer_on_remote"
+    differing_on_remote_mock = mocker.patch.object(
+        replicate_obj, "update_objects_differing_on_remote", return_value=[]
     )
+    add_remove_items_mock = mocker.patch.object(replicate_obj.api, "add_remove_items")
 
     # Act
     replicate_obj.replicate_data()
 
     # Assert
     assert rsync_mock.mock_calls == expected_rsync_it_calls
-    assert not_on_local_mock.call_count == len(replicate.OBJ_TYPES)
-    assert newer_on_remote_mock.call_count == len(replicate.OBJ_TYPES)
+    assert differing_on_remote_mock.call_count == len(replicate.OBJ_TYPES)
+    add_remove_items_mock.assert_not_called()
+
+
+def test_replicate_data_recreated_name(
+    mocker: MockerFixture,
+    cobbler_api: CobblerAPI,
+    replicate_obj: replicate.Replicate,
+    create_distro: Callable[[], Distro],
+):
+    """
+    Test that asserts that an object which was deleted and recreated under the same name on the master replaces the
+    local object.
+    """
+    # Arrange
+    local_distro = create_distro()
+    remote_distro = local_distro.serialize()
+    remote_distro["uid"] = "recreated_uid"
+    remote_distro["comment"] = "recreated on master"
+
+    def get_items(what: str, *args: Any):
+        if what == "distro":
+            return [{"uid": "recreated_uid", "name": local_distro.name}]
+        return []
+
+    def get_item_hashes(what: str, digest: str):
+        if what == "distro":
+            return {"digest": "remote", "hashes": {"recreated_uid": "remote_hash"}}
+        return {"digest": digest, "hashes": {}}
+
+    remote_mock = mocker.MagicMock()
+    remote_mock.get_settings.return_value = {"webdir": "/srv/www/cobbler"}  # type: ignore
+    remote_mock.get_items.side_effect = get_items  # type: ignore
+    remote_mock.get_item_hashes.side_effect = get_item_hashes  # type: ignore
+    remote_mock.get_items_by_uid.return_value = [remote_distro]  # type: ignore
+    replicate_obj.remote = remote_mock
+    replicate_obj.local = mocker.MagicMock()
+    replicate_obj.prune = True
+    replicate_obj.omit_data = True
+    replicate_obj.sync_all = True
+
+    # Act
+    replicate_obj.replicate_data()
+
+    # Assert
+    replicated_distro = cobbler_api.find_distro(name=local_distro.name)
+    assert isinstance(replicated_distro, Distro)
+    assert replicated_distro.uid == "recreated_uid"
+    assert replicated_distro.comment == "recreated on master"
+    assert local_distro.uid not in cobbler_api.distros().listing
+
+
+def test_fetch_items_old_master(
+    mocker: MockerFixture,
+    replicate_obj: replicate.Replicate,
+    create_distro: Callable[[], Distro],
+):
+    """
+    Test that asserts that all objects are transferred and compared by mtime if the master can't compare the content
+    of the collections.
+    """
+    # Arrange
+    test_distro = create_distro()
+    remote_distro = {"uid": test_distro.uid, "name": test_distro.name, "mtime": 1.0}
+    remote_mock = mocker.MagicMock()
+    remote_mock.get_items.side_effect = [  # type: ignore
+        xmlrpc.client.Fault(1, "get_items() takes 2 positional arguments"),
+        [remote_distro],
+    ]
+    replicate_obj.remote = remote_mock
+
+    # Act
+    replicate_obj.fetch_items("distro")
+
+    # Assert
+    remote_mock.get_item_hashes.assert_not_called()  # type: ignore
+    assert replicate_obj.remote_data["distro"] == [remote_distro]
+    assert replicate_obj.local_hashes["distro"] == {
+        test_distro.uid: str(test_distro.mtime)
+    }
+    assert replicate_obj.remote_hashes["distro"] == {test_distro.uid: "1.0"}
+    assert replicate_obj.remote_objects["distro"] == {test_distro.uid: remote_distro}
 
 
 def test_link_distros(
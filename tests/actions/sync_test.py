@@ -3,10 +3,21 @@ Tests that validate the functionality of the module that is responsible for sync
 with each other.
 """
 
+import os
+import pathlib
+from typing import TYPE_CHECKING, Callable
+
 import pytest
 
 from cobbler.actions import sync
 from cobbler.api import CobblerAPI
+from cobbler.items.distro import Distro
+from cobbler.items.profile import Profile
+from cobbler.items.system import System
+from cobbler.modules.managers import in_tftpd
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
 
 
 @pytest.mark.skip("TODO")
@@ -41,3 +52,54 @@ def test_rsync_gen():
     # Act
     # Assert
     assert False
+
+
+def test_run_incremental(
+    mocker: "MockerFixture",
+    cobbler_api: CobblerAPI,
+    create_distro: Callable[[], Distro],
+    create_profile: Callable[[str], Profile],
+    create_system: Callable[..., System],
+    tmp_path: pathlib.Path,
+):
+    """
+    Test to verify that the incremental sync only rewrites the files that changed and removes the files of removed
+    systems.
+    """
+    # Arrange
+    in_tftpd.MANAGER = None
+    mocker.patch.object(cobbler_api.tftpgen, "copy_bootloaders")
+    mocker.patch("cobbler.utils.run_triggers")
+    test_distro = create_distro()
+    test_profile = create_profile(test_distro.uid)
+    test_system = create_system(profile_uid=test_profile.uid)
+    test_interface = test_system.interfaces["default"]
+    test_interface.mac_address = "aa:bb:cc:dd:ee:01"  # type: ignore[method-assign]
+    cobbler_api.add_network_interface(test_interface)
+    bootloc = cobbler_api.settings().tftpboot_location
+    system_file = os.path.join(bootloc, "pxelinux.cfg", "01-aa-bb-cc-dd-ee-01")
+    menu_file = os.path.join(bootloc, "pxelinux.cfg", "default")
+    test_sync = cobbler_api.get_sync()
+    test_sync.manifest_path = str(tmp_path / "sync_manifest.json")
+
+    # Act
+    result_initial = test_sync.run_incremental()
+    result_noop = test_sync.run_incremental()
+    menu_stat = os.stat(menu_file)
+    test_system.netboot_enabled = True  # type: ignore[method-assign]
+    cobbler_api.add_system(test_system, with_sync=False)
+    result_modified = test_sync.run_incremental()
+    cobbler_api.remove_system(test_system, recursive=True, with_sync=False)
+    result_removed = test_sync.run_incremental()
+
+    # Assert
+    total = result_initial["written"]
+    assert result_initial["removed"] == 0
+    assert result_noop == {"written": 0, "unchanged": total, "removed": 0}
+    assert 0 < result_modified["written"] < total
+    assert result_modified["written"] + result_modified["unchanged"] == total
+    assert result_modified["removed"] == 0
+    assert os.stat(menu_file).st_mtime_ns == menu_stat.st_mtime_ns
+    assert result_removed["removed"] > 0
+    assert result_removed["written"] == 0
+    assert not os.path.exists(system_file)
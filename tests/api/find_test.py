@@ -3,11 +3,13 @@ Tests that validate the functionality of the module that is responsible for prov
 application.
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 import pytest
 
 from cobbler.api import CobblerAPI
+from cobbler.items.distro import Distro
+from cobbler.items.profile import Profile
 
 from tests.conftest import does_not_raise
 
@@ -55,6 +57,28 @@ def test_find_items(
             assert result == expected_result
 
 
+def test_find_items_by_uid(
+    cobbler_api: CobblerAPI,
+    create_distro: Callable[[], Distro],
+    create_profile: Callable[[str], Profile],
+):
+    """
+    Test to verify that items of any collection are found by their uid until they are removed.
+    """
+    # Arrange
+    test_distro = create_distro()
+    test_profile = create_profile(test_distro.uid)
+    cobbler_api.remove_profile(test_profile)
+
+    # Act
+    result_distro = cobbler_api.find_items("", {"uid": test_distro.uid}, False)
+    result_profile = cobbler_api.find_items("", {"uid": test_profile.uid}, False)
+
+    # Assert
+    assert result_distro is test_distro
+    assert result_profile is None
+
+
 @pytest.mark.parametrize(
     "return_list,no_errors,criteria,expected_exception,expected_result",
     [
@@ -0,0 +1,74 @@
+"""
+Tests that validate the functionality of the module that is responsible for recording the changes to items.
+"""
+
+from typing import Callable
+
+from cobbler.api import CobblerAPI
+from cobbler.cobbler_collections.change_feed import ChangeFeed
+from cobbler.cobbler_collections.manager import CollectionManager
+from cobbler.items import distro, profile
+
+
+def test_record_and_since(
+    collection_mgr: CollectionManager,
+    cobbler_api: CobblerAPI,
+    create_distro: Callable[..., distro.Distro],
+    create_profile: Callable[..., profile.Profile],
+):
+    """
+    Test to verify that adding, modifying, renaming and removing items is recorded in order and can be filtered by
+    collection type.
+    """
+    # Arrange
+    start_revision = collection_mgr.change_feed.revision
+    test_distro = create_distro()
+    test_profile = create_profile(test_distro.uid)
+    test_profile.comment = "changed"
+    cobbler_api.add_profile(test_profile)
+    cobbler_api.rename_profile(test_profile, "change_feed_renamed")
+    cobbler_api.remove_profile(test_profile)
+
+    # Act
+    revision, changes = collection_mgr.change_feed.since(start_revision)
+    _, profile_changes = collection_mgr.change_feed.since(start_revision, ["profile"])
+
+    # Assert
+    assert changes is not None
+    assert profile_changes is not None
+    assert revision == start_revision + 5
+    assert [(x.collection_type, x.operation) for x in changes] == [
+        ("distro", "add"),
+        ("profile", "add"),
+        ("profile", "modify"),
+        ("profile", "rename"),
+        ("profile", "delete"),
+    ]
+    assert [x.revision for x in changes] == list(
+        range(start_revision + 1, revision + 1)
+    )
+    assert changes[3].old_name != changes[3].name == "change_feed_renamed"
+    assert profile_changes == changes[1:]
+
+
+def test_since_bounded(create_distro: Callable[..., distro.Distro]):
+    """
+    Test to verify that a revision which is not covered by the log anymore requires a full resync.
+    """
+    # Arrange
+    change_feed = ChangeFeed(max_changes=2)
+    test_distro = create_distro()
+    for _ in range(3):
+        change_feed.record("modify", test_distro)
+
+    # Act
+    revision, changes_dropped = change_feed.since(0)
+    _, changes_kept = change_feed.since(1)
+    _, changes_unknown = change_feed.since(4)
+
+    # Assert
+    assert revision == 3
+    assert changes_dropped is None
+    assert changes_kept is not None
+    assert [x.revision for x in changes_kept] == [2, 3]
+    assert changes_unknown is None
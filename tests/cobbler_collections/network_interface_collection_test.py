@@ -2,7 +2,7 @@
 Tests that validate the functionality of the module that is responsible for managing the list of network interfaces.
 """
 
-from typing import Any, Callable
+from typing import Any, Callable, Set
 
 import pytest
 
@@ -362,12 +362,13 @@ def test_indexes(
     # Arrange
 
     # Assert
-    assert len(network_interface_collection.indexes) == 5
+    assert len(network_interface_collection.indexes) == 6
     assert len(network_interface_collection.indexes["name"]) == 0
     assert len(network_interface_collection.indexes["dns.name"]) == 0
     assert len(network_interface_collection.indexes["ipv4.address"]) == 0
     assert len(network_interface_collection.indexes["ipv6.address"]) == 0
     assert len(network_interface_collection.indexes["mac_address"]) == 0
+    assert len(network_interface_collection.indexes["system_uid"]) == 0
 
 
 def test_add_to_indexes(
@@ -486,3 +487,106 @@ def test_find_by_indexes(
     assert len(kwargs2) == 0
     assert result3 is None
     assert len(kwargs3) == 1
+
+
+@pytest.mark.parametrize(
+    "search,expected_names",
+    [
+        ("*", {"default", "eth0", "eth1"}),
+        ("~*", set()),
+        ("", {"default", "eth1"}),
+        ("~", {"eth0"}),
+        ("aa:bb:*", {"eth0"}),
+        ("~aa:bb:*", {"default", "eth1"}),
+    ],
+)
+def test_find_by_indexes_empty_values(
+    cobbler_api: CobblerAPI,
+    create_distro: Callable[[], distro.Distro],
+    create_profile: Callable[[str], profile.Profile],
+    create_system: Callable[[str], system.System],
+    network_interface_collection: network_interfaces.NetworkInterfaces,
+    search: str,
+    expected_names: Set[str],
+):
+    """
+    Test that searching a unique index with a pattern matching empty values also finds the items without a value.
+    """
+    # Arrange
+    test_distro = create_distro()
+    test_profile = create_profile(test_distro.uid)
+    test_system = create_system(test_profile.uid)
+    item1 = cobbler_api.new_network_interface(system_uid=test_system.uid, name="eth0")
+    item1.mac_address = "aa:bb:cc:dd:ee:ff"
+    network_interface_collection.add(item1)
+    item2 = cobbler_api.new_network_interface(system_uid=test_system.uid, name="eth1")
+    network_interface_collection.add(item2)
+
+    # Act
+    result = network_interface_collection.find(return_list=True, mac_address=search)
+
+    # Assert
+    assert isinstance(result, list)
+    assert {item.name for item in result} == expected_names
+
+
+def test_update_system_uid_index(
+    cobbler_api: CobblerAPI,
+    create_distro: Callable[[], distro.Distro],
+    create_profile: Callable[[str], profile.Profile],
+    create_system: Callable[[str], system.System],
+    network_interface_collection: network_interfaces.NetworkInterfaces,
+):
+    """
+    Test that moving a Network Interface to another system updates the "system_uid" index.
+    """
+    # Arrange
+    test_distro = create_distro()
+    test_profile = create_profile(test_distro.uid)
+    test_system1 = create_system(test_profile.uid)
+    test_system2 = create_system(test_profile.uid, name="test_system2")
+    item1 = cobbler_api.new_network_interface(system_uid=test_system1.uid, name="eth1")
+    network_interface_collection.add(item1)
+
+    # Act
+    item1.system_uid = test_system2.uid
+
+    # Assert
+    assert item1.uid not in network_interface_collection.indexes["system_uid"].get(
+        test_system1.uid, set()
+    )
+    assert (
+        item1.uid
+        in network_interface_collection.indexes["system_uid"][test_system2.uid]
+    )
+
+
+@pytest.mark.parametrize("index_enabled", [True, False])
+def test_find_by_system(
+    cobbler_api: CobblerAPI,
+    create_distro: Callable[[], distro.Distro],
+    create_profile: Callable[[str], profile.Profile],
+    create_system: Callable[[str], system.System],
+    network_interface_collection: network_interfaces.NetworkInterfaces,
+    index_enabled: bool,
+):
+    """
+    Test that the interfaces of a system are found with and without the "system_uid" index.
+    """
+    # Arrange
+    test_distro = create_distro()
+    test_profile = create_profile(test_distro.uid)
+    test_system = create_system(test_profile.uid)
+    item1 = cobbler_api.new_network_interface(system_uid=test_system.uid, name="eth1")
+    network_interface_collection.add(item1)
+    if not index_enabled:
+        network_interface_collection.indexes.pop("system_uid")
+
+    # Act
+    result = network_interface_collection.find_by_system(test_system.uid)
+    fake_result = network_interface_collection.find_by_system("fake_uid")
+
+    # Assert
+    assert [item.name for item in result] == ["default", "eth1"]
+    assert fake_result == []
+    assert list(test_system.interfaces.keys()) == ["default", "eth1"]
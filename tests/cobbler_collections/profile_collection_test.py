@@ -141,6 +141,40 @@ def test_from_list(
         assert len(indx) == 1
 
 
+def test_from_list_subprofiles(
+    create_distro: Callable[[], distro.Distro],
+    profile_collection: profiles.Profiles,
+):
+    """
+    Test that subprofiles of a topologically sorted list can resolve their parents while the collection is loaded.
+    """
+    # Arrange
+    distro1 = create_distro()
+    item_list = [
+        {
+            "uid": "c6292be68ce0416490414420a7467b21",
+            "name": "test_from_list_parent",
+            "distro": distro1.uid,
+            "depth": 1,
+        },
+        {
+            "uid": "0a1c6a9e5ba34b8e8c5e1c5b3d2c1f0e",
+            "name": "test_from_list_child",
+            "parent": "c6292be68ce0416490414420a7467b21",
+            "depth": 2,
+        },
+    ]
+
+    # Act
+    profile_collection.from_list(item_list)
+
+    # Assert
+    assert len(profile_collection.listing) == 2
+    child = profile_collection.listing["0a1c6a9e5ba34b8e8c5e1c5b3d2c1f0e"]
+    assert child.get_parent == "c6292be68ce0416490414420a7467b21"
+    assert profile_collection.find(name="test_from_list_child") == child
+
+
 def test_copy(
     cobbler_api: CobblerAPI,
     create_distro: Callable[[], distro.Distro],
@@ -2,7 +2,7 @@
 Tests that validate the functionality of the module that is responsible for managing the list of systems.
 """
 
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, List, Optional, Set
 
 import pytest
 
@@ -837,3 +837,152 @@ def test_find_by_indexes(
         assert len((kwargs[indx])[1]) == 0
         assert result[2] is None
         assert len((kwargs[indx])[2]) == 1
+
+
+@pytest.mark.parametrize(
+    "kwargs,expected_names,remaining_keys",
+    [
+        ({"name": "rack12-*"}, {"rack12-node1", "rack12-node2"}, []),
+        ({"name": "*-node1"}, {"rack12-node1", "rack13-node1"}, []),
+        (
+            {"name": "rack1[23]-node?"},
+            {"rack12-node1", "rack12-node2", "rack13-node1"},
+            [],
+        ),
+        ({"name": "~rack12-*"}, {"rack13-node1"}, []),
+        ({"name": "~rack12-node1"}, {"rack12-node2", "rack13-node1"}, []),
+        (
+            {"name": "rack12-*", "profile": "~fake_profile"},
+            {"rack12-node1", "rack12-node2"},
+            [],
+        ),
+        ({"name": "rack13-*", "comment": "*"}, {"rack13-node1"}, ["comment"]),
+        ({"name": "rack14-*"}, None, []),
+    ],
+)
+def test_find_by_indexes_patterns(
+    create_distro: Callable[[], distro.Distro],
+    create_profile: Callable[[str], profile.Profile],
+    create_system: Callable[..., system.System],
+    system_collection: systems.Systems,
+    kwargs: Dict[str, Any],
+    expected_names: Optional[Set[str]],
+    remaining_keys: List[str],
+):
+    """
+    Validate that wildcard, negated and combined searches are answered by the secondary indices.
+    """
+    # Arrange
+    test_distro = create_distro()
+    test_profile = create_profile(test_distro.uid)
+    for name in ("rack12-node1", "rack12-node2", "rack13-node1"):
+        create_system(profile_uid=test_profile.uid, name=name)
+    search = dict(kwargs)
+
+    # Act
+    result = system_collection.find_by_indexes(search)
+
+    # Assert
+    if expected_names is None:
+        assert result is None
+    else:
+        assert result is not None
+        assert {item.name for item in result} == expected_names
+    assert list(search.keys()) == remaining_keys
+
+
+@pytest.mark.parametrize(
+    "index_name,start,stop,reverse,subset",
+    [
+        ("name", 0, 2, False, False),
+        ("name", 1, 3, True, False),
+        ("profile", 0, 3, False, False),
+        ("profile", 1, 2, True, False),
+        ("profile", 0, 3, False, True),
+    ],
+)
+def test_sorted_slice(
+    create_distro: Callable[[], distro.Distro],
+    create_profile: Callable[..., profile.Profile],
+    create_system: Callable[..., system.System],
+    system_collection: systems.Systems,
+    index_name: str,
+    start: int,
+    stop: int,
+    reverse: bool,
+    subset: bool,
+):
+    """
+    Validate that a page of systems can be read in the order of an index.
+    """
+    # Arrange
+    test_distro = create_distro()
+    profile_1 = create_profile(test_distro.uid, name="sorted-slice-profile-1")
+    profile_2 = create_profile(test_distro.uid, name="sorted-slice-profile-2")
+    test_systems = [
+        create_system(profile_uid=profile_1.uid, name="node-c"),
+        create_system(profile_uid=profile_2.uid, name="node-a"),
+        create_system(profile_uid=profile_1.uid, name="node-b"),
+    ]
+    uids = {test_systems[0].uid, test_systems[1].uid} if subset else None
+    expected = sorted(
+        (x for x in test_systems if uids is None or x.uid in uids),
+        key=lambda x: (getattr(x, f"_{index_name}"), x.name),
+        reverse=reverse,
+    )
+
+    # Act
+    result = system_collection.sorted_slice(index_name, start, stop, reverse, uids)
+
+    # Assert
+    assert result is not None
+    assert [x.name for x in result] == [x.name for x in expected[start:stop]]
+
+
+def test_sorted_slice_coverage_cache(
+    create_distro: Callable[[], distro.Distro],
+    create_profile: Callable[..., profile.Profile],
+    create_system: Callable[..., system.System],
+    system_collection: systems.Systems,
+):
+    """
+    Validate that the coverage of an index is only counted again after the index changed.
+    """
+    # Arrange
+    test_distro = create_distro()
+    test_profile = create_profile(test_distro.uid)
+    create_system(profile_uid=test_profile.uid, name="node-b")
+    first_page = system_collection.sorted_slice("name", 0, 1)
+    cached = "name" in system_collection._index_coverage  # type: ignore
+
+    # Act
+    create_system(profile_uid=test_profile.uid, name="node-a")
+    invalidated = "name" not in system_collection._index_coverage  # type: ignore
+    second_page = system_collection.sorted_slice("name", 0, 1)
+
+    # Assert
+    assert first_page is not None and [x.name for x in first_page] == ["node-b"]
+    assert cached
+    assert invalidated
+    assert second_page is not None and [x.name for x in second_page] == ["node-a"]
+
+
+def test_sorted_slice_without_index(
+    create_distro: Callable[[], distro.Distro],
+    create_profile: Callable[..., profile.Profile],
+    create_system: Callable[..., system.System],
+    system_collection: systems.Systems,
+):
+    """
+    Validate that no order is returned for a field without an index.
+    """
+    # Arrange
+    test_distro = create_distro()
+    test_profile = create_profile(test_distro.uid)
+    create_system(profile_uid=test_profile.uid)
+
+    # Act
+    result = system_collection.sorted_slice("comment", 0, 10)
+
+    # Assert
+    assert result is None
@@ -7,9 +7,10 @@ import os
 import pathlib
 import shutil
 import subprocess
+import threading
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Callable, Generator
+from typing import Callable, Generator, List, Tuple, Union
 
 import pytest
 
@@ -23,9 +24,17 @@ from cobbler.items.profile import Profile
 from cobbler.items.profile_group import ProfileGroup
 from cobbler.items.system import System
 from cobbler.items.system_group import SystemGroup
+from cobbler.remote import (
+    CobblerXMLRPCInterface,
+    CobblerXMLRPCServer,
+    PooledCobblerXMLRPCServer,
+    ProxiedXMLRPCInterface,
+)
 
 logger = logging.getLogger()
 
+XMLRPCServerType = Union[CobblerXMLRPCServer, PooledCobblerXMLRPCServer]
+
 
 @contextmanager
 def does_not_raise():
@@ -403,3 +412,45 @@ def fixture_fk_kernel(request: "pytest.FixtureRequest") -> str:
     return "vmlinuz_%s" % (
         request.node.originalname if request.node.originalname else request.node.name  # type: ignore
     )
+
+
+@pytest.fixture(name="start_xmlrpc_server", scope="function")
+def fixture_start_xmlrpc_server(
+    cobbler_api: CobblerAPI,
+) -> Generator[
+    Callable[..., Tuple[ProxiedXMLRPCInterface, XMLRPCServerType]], None, None
+]:
+    """
+    Returns a function that starts the XML-RPC server of the daemon on a free local port. Zero workers start the
+    thread-per-connection server, otherwise the worker pool server is started. All servers are stopped on teardown.
+    """
+    servers: List[XMLRPCServerType] = []
+
+    def _start_xmlrpc_server(
+        workers: int = 0,
+        keepalive_timeout: float = 1,
+    ) -> Tuple[ProxiedXMLRPCInterface, XMLRPCServerType]:
+        xinterface = ProxiedXMLRPCInterface(cobbler_api, CobblerXMLRPCInterface)
+        server: XMLRPCServerType
+        if workers > 0:
+            server = PooledCobblerXMLRPCServer(
+                ("127.0.0.1", 0),
+                workers=workers,
+                queue_size=64,
+                keepalive_timeout=keepalive_timeout,
+            )
+        else:
+            server = CobblerXMLRPCServer(("127.0.0.1", 0))
+        server.logRequests = False  # type: ignore[attr-defined]
+        server.register_instance(xinterface)
+        server.register_multicall_functions()
+        xinterface.proxied.xmlrpc_server = server
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return xinterface, server
+
+    yield _start_xmlrpc_server
+
+    for server in servers:
+        server.shutdown()
+        server.server_close()
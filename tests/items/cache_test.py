@@ -35,7 +35,7 @@ def test_collection_types(cobbler_api: CobblerAPI):
     result = mgr.__dict__.items()
 
     # Assert
-    assert len(result) == 13
+    assert len(result) == 15
 
 
 @pytest.mark.parametrize(
@@ -589,17 +589,17 @@ def test_dict_cache_edit_invalidate(
     objs.append(test_system2)
 
     # Act
-    repo1_dep = test_repo1.tree_walk("_owners")
-    repo2_dep = test_repo2.tree_walk("_owners")
-    menu1_dep = test_menu1.tree_walk("_owners")
-    menu2_dep = test_menu2.tree_walk("_owners")
-    distro_dep = test_distro.tree_walk("_owners")
-    profile1_dep = test_profile1.tree_walk("_owners")
-    profile2_dep = test_profile2.tree_walk("_owners")
-    profile3_dep = test_profile3.tree_walk("_owners")
-    image_dep = test_image.tree_walk("_owners")
-    system1_dep = test_system1.tree_walk("_owners")
-    system2_dep = test_system2.tree_walk("_owners")
+    repo1_dep = test_repo1.resolved_dependants("_owners")
+    repo2_dep = test_repo2.resolved_dependants("_owners")
+    menu1_dep = test_menu1.resolved_dependants("_owners")
+    menu2_dep = test_menu2.resolved_dependants("_owners")
+    distro_dep = test_distro.resolved_dependants("_owners")
+    profile1_dep = test_profile1.resolved_dependants("_owners")
+    profile2_dep = test_profile2.resolved_dependants("_owners")
+    profile3_dep = test_profile3.resolved_dependants("_owners")
+    image_dep = test_image.resolved_dependants("_owners")
+    system1_dep = test_system1.resolved_dependants("_owners")
+    system2_dep = test_system2.resolved_dependants("_owners")
 
     settings_dep = objs
     signatures_dep = [
@@ -684,7 +684,7 @@ def test_dict_cache_rename_invalidate(
         remain_objs = set(objs)
         deps: Set[BaseItem] = set()
         if isinstance(obj_test, BootableItem):
-            deps = set(obj_test.tree_walk())
+            deps = set(obj_test.resolved_dependants())
             remain_objs = remain_objs - deps
             remain_objs.remove(obj_test)
             logger.info("Pre Rename")
@@ -785,3 +785,83 @@ def test_dict_cache_rename_invalidate(
     assert validate_caches(objs, test_system2) == expected_output
     with expected_exception:
         cobbler_api.clean_items_cache(True)  # type: ignore[reportArgumentType,arg-type]
+
+
+def test_dict_cache_parent_edit_invalidate(
+    cobbler_api: CobblerAPI,
+    create_distro: Callable[[], Distro],
+    create_image: Callable[[], Image],
+    create_profile: Any,
+    create_system: Any,
+):
+    """
+    Test to verify that editing a parent invalidates the resolved dict cache of exactly the items that inherit from it.
+    """
+    # Arrange
+    cobbler_api.settings().cache_enabled = True
+    test_distro = create_distro()
+    test_profile1: Profile = create_profile(
+        distro_uid=test_distro.uid, name="test_profile1"
+    )
+    test_profile2: Profile = create_profile(
+        profile_uid=test_profile1.uid, name="test_profile2"
+    )
+    test_profile2.owners = ["explicit"]  # type: ignore[method-assign]
+    test_system1: System = create_system(
+        profile_uid=test_profile1.uid, name="test_system1"
+    )
+    test_system2: System = create_system(
+        profile_uid=test_profile2.uid, name="test_system2"
+    )
+    test_image = create_image()
+    test_system3: System = create_system(image_uid=test_image.uid, name="test_system3")
+    objs: List[BaseItem] = [
+        test_distro,
+        test_profile1,
+        test_profile2,
+        test_system1,
+        test_system2,
+        test_image,
+        test_system3,
+    ]
+    for obj in objs:
+        obj.to_dict(resolved=True)
+
+    # Act
+    test_distro.owners = ["distro_owner"]  # type: ignore[method-assign]
+
+    # Assert
+    assert test_profile1.cache.get_dict_cache(True) is None
+    assert test_system1.cache.get_dict_cache(True) is None
+    assert test_profile2.cache.get_dict_cache(True) is not None
+    assert test_system2.cache.get_dict_cache(True) is not None
+    assert test_system3.cache.get_dict_cache(True) is not None
+    assert test_system1.to_dict(resolved=True)["owners"] == ["distro_owner"]
+    assert test_system2.to_dict(resolved=True)["owners"] == ["explicit"]
+
+
+def test_dict_cache_settings_invalidate(
+    cobbler_api: CobblerAPI,
+    create_distro: Callable[[], Distro],
+    create_profile: Any,
+):
+    """
+    Test to verify that a settings change invalidates the resolved dict cache of all items but keeps the raw dicts.
+    """
+    # Arrange
+    cobbler_api.settings().cache_enabled = True
+    test_distro = create_distro()
+    test_profile: Profile = create_profile(distro_uid=test_distro.uid)
+    for obj in (test_distro, test_profile):
+        obj.to_dict(resolved=False)
+        obj.to_dict(resolved=True)
+
+    # Act
+    cobbler_api.settings().default_ownership = ["settings_owner"]
+    cobbler_api.clean_items_cache(cobbler_api.settings())
+
+    # Assert
+    for obj in (test_distro, test_profile):
+        assert obj.cache.get_dict_cache(True) is None
+        assert obj.cache.get_dict_cache(False) is not None
+    assert test_profile.to_dict(resolved=True)["owners"] == ["settings_owner"]
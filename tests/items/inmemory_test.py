@@ -198,3 +198,29 @@ def test_inmemory(
 
     # Assert
     assert result
+
+
+def test_inmemory_deserialize_many(inmemory_api: CobblerAPI):
+    """
+    Test that verifies that a batch of lazy loaded items is loaded without touching the other items.
+    """
+    # Arrange
+    test_repos = [
+        Repo(inmemory_api, **{"name": f"test_repo{i}", "comment": "test comment"})
+        for i in range(3)
+    ]
+    for test_repo in test_repos:
+        inmemory_api.add_repo(test_repo)
+        inmemory_api.repos().listing.pop(test_repo.uid)
+    inmemory_api.repos().indexes = {}
+    inmemory_api.deserialize()
+    repos = inmemory_api.repos()
+
+    # Act
+    repos.deserialize_many([test_repos[0].uid, test_repos[2].uid])
+
+    # Assert
+    assert repos.listing[test_repos[0].uid].inmemory
+    assert not repos.listing[test_repos[1].uid].inmemory
+    assert repos.listing[test_repos[2].uid].inmemory
+    assert repos.listing[test_repos[2].uid].__dict__["_comment"] == "test comment"
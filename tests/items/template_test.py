@@ -2,6 +2,8 @@
 Test module to verify the functionality of the Template item class.
 """
 
+import pytest
+
 from cobbler import enums
 from cobbler.api import CobblerAPI
 from cobbler.items.template import Template
@@ -64,3 +66,34 @@ def test_to_dict_resolved(cobbler_api: CobblerAPI):
 
     # Assert
     assert isinstance(result, dict)
+
+
+def test_refresh_content_clears_template_cache(
+    cobbler_api: CobblerAPI, monkeypatch: pytest.MonkeyPatch
+):
+    """
+    Test to verify that a changed template source drops the compiled templates.
+    """
+    # Arrange
+    monkeypatch.setenv("COBBLER_TEST_TEMPLATE", "$test")
+    test_template = Template(
+        cobbler_api,
+        template_type="cheetah",
+        uri={
+            "schema": enums.TemplateSchema.ENVIRONMENT.value,
+            "path": "COBBLER_TEST_TEMPLATE",
+        },
+    )
+    test_template.refresh_content()
+    cobbler_api.templar.render(test_template.content, {"test": 5}, None, "cheetah")
+    monkeypatch.setenv("COBBLER_TEST_TEMPLATE", "$test $test")
+
+    # Act
+    test_template.refresh_content()
+
+    # Assert
+    assert cobbler_api.templar.template_cache_statistics["cheetah"]["size"] == 0
+    assert (
+        cobbler_api.templar.render(test_template.content, {"test": 5}, None, "cheetah")
+        == "5 5"
+    )
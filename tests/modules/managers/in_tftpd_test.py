@@ -3,11 +3,13 @@ Tests that validate the functionality of the module that is responsible for mana
 ISC DHCP server.
 """
 
-from typing import TYPE_CHECKING, Any, Generator, List
+import pathlib
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generator, List
 
 import pytest
 
 from cobbler.api import CobblerAPI
+from cobbler.cexceptions import CX
 from cobbler.items.distro import Distro
 from cobbler.items.profile import Profile
 from cobbler.items.system import System
@@ -56,7 +58,9 @@ def fixture_api_mock_tftp(mocker: "MockerFixture") -> CobblerAPI:
     settings_mock.tftpboot_location = "/var/lib/tftpboot"
     settings_mock.webdir = "/srv/www/cobbler"
     settings_mock.cache_enabled = False
+    settings_mock.sync_workers = 1
     settings_mock.to_dict.return_value = {"server": "127.0.0.1"}
+    settings_mock.snapshot.return_value = {"server": "127.0.0.1"}
     api_mock_tftp.settings.return_value = settings_mock
     test_distro = Distro(api_mock_tftp)
     test_distro.name = "test"
@@ -232,3 +236,82 @@ def test_manager_sync(api_mock_tftp: CobblerAPI):
     assert tftpgen_mock.get_menu_items.call_count == 1  # type: ignore[reportFunctionMemberAccess,attr-defined]
     assert tftpgen_mock.write_all_system_files.call_count == 1  # type: ignore[reportFunctionMemberAccess,attr-defined]
     assert tftpgen_mock.make_pxe_menu.call_count == 1  # type: ignore[reportFunctionMemberAccess,attr-defined]
+
+
+@pytest.mark.parametrize("input_workers", [2, 0])
+def test_manager_write_system_files(
+    cobbler_api: CobblerAPI,
+    create_distro: Callable[[], Distro],
+    create_profile: Callable[[str], Profile],
+    create_system: Callable[..., System],
+    input_workers: int,
+):
+    """
+    Test to verify that generating the files of the systems in worker processes yields the same files as generating
+    them in the daemon itself.
+    """
+    # Arrange
+    test_distro = create_distro()
+    test_profile = create_profile(test_distro.uid)
+    test_systems: List[System] = []
+    for index in range(5):
+        test_system = create_system(
+            profile_uid=test_profile.uid, name=f"write_system_files_{index}"
+        )
+        test_interface = test_system.interfaces["default"]
+        test_interface.mac_address = f"aa:bb:cc:dd:ee:1{index}"  # type: ignore[method-assign]
+        cobbler_api.add_network_interface(test_interface)
+        test_systems.append(test_system)
+    manager_obj = in_tftpd.get_manager(cobbler_api)
+    menu_items = cobbler_api.tftpgen.get_menu_items()
+
+    # Act
+    cobbler_api.settings().sync_workers = 1
+    result_serial = manager_obj.write_system_files(test_systems, menu_items)
+    content_serial: Dict[str, bytes] = {
+        path: pathlib.Path(path).read_bytes()
+        for paths in result_serial.values()
+        for path in paths
+        if not pathlib.Path(path).is_symlink()
+    }
+    cobbler_api.settings().sync_workers = input_workers
+    result_parallel = manager_obj.write_system_files(test_systems, menu_items)
+
+    # Assert
+    assert len(result_serial) == len(test_systems)
+    assert all(result_serial.values())
+    assert result_parallel == result_serial
+    for path, content in content_serial.items():
+        assert pathlib.Path(path).read_bytes() == content
+
+
+def test_manager_write_system_files_error(
+    mocker: "MockerFixture", api_mock_tftp: CobblerAPI
+):
+    """
+    Test to verify that a failing system doesn't stop the generation of the files of the other systems and is reported.
+    """
+    # Arrange
+    manager_obj = in_tftpd.get_manager(api_mock_tftp)
+    api_mock_tftp.settings().sync_workers = 2
+    test_systems: List[System] = []
+    for name in ("working", "broken"):
+        test_system = System(api_mock_tftp)
+        test_system.name = name  # type: ignore[method-assign]
+        test_systems.append(test_system)
+
+    def write_all_system_files(system: System, menu_items: Any):
+        if system.name == "broken":
+            raise ValueError("template error")
+
+    api_mock_tftp.tftpgen.write_all_system_files.side_effect = write_all_system_files  # type: ignore[reportFunctionMemberAccess,attr-defined]
+    logger_mock = mocker.patch.object(manager_obj, "logger")
+
+    # Act & Assert
+    with pytest.raises(CX, match="broken"):
+        manager_obj.write_system_files(test_systems, {})
+    logger_mock.error.assert_called_once_with(
+        'generating boot files for system "%s" failed: %s',
+        "broken",
+        "ValueError: template error",
+    )
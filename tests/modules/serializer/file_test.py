@@ -140,6 +140,52 @@ def test_serialize_item(
         assert json.load(json_file) == mitem.serialize()
 
 
+@pytest.mark.parametrize("serializer_fsync", [False, True])
+def test_serialize_items(
+    mocker: "MockerFixture",
+    tmpdir: pathlib.Path,
+    serializer_obj: file.FileSerializer,
+    cobbler_api: CobblerAPI,
+    serializer_fsync: bool,
+):
+    """
+    Test that will assert if multiple items are written atomically without leaving temporary files behind.
+    """
+    # pylint: disable=protected-access
+    # Arrange
+    cobbler_api.settings().serializer_fsync = serializer_fsync
+    mcollection = MockCollection(cobbler_api._collection_mgr)  # type: ignore
+    mock_get_items = mocker.patch.object(cobbler_api, "get_items")
+    mock_get_items.return_value = mcollection
+    serializer_obj.libpath = str(tmpdir)
+    collection_path = os.path.join(tmpdir, mcollection.collection_types())
+    os.mkdir(collection_path)
+    mitems: List[MockBootableItem] = []
+    for i in range(3):
+        mitem = MockBootableItem(cobbler_api)
+        mitem.name = f"test_serializer_{i}"  # type: ignore[method-assign]
+        mitems.append(mitem)
+    # An existing item which must be replaced
+    pathlib.Path(collection_path, f"{mitems[0].uid}.json").write_text("{")
+    spy_fsync = mocker.spy(os, "fsync")
+
+    # Act
+    result = serializer_obj.serialize_items(mcollection, mitems)
+
+    # Assert
+    assert result == 3
+    assert sorted(os.listdir(collection_path)) == sorted(
+        f"{mitem.uid}.json" for mitem in mitems
+    )
+    for mitem in mitems:
+        with open(
+            os.path.join(collection_path, f"{mitem.uid}.json"), "r", encoding="UTF-8"
+        ) as json_file:
+            assert json.load(json_file) == mitem.serialize()
+    # One flush per item and one for the directory
+    assert spy_fsync.call_count == (4 if serializer_fsync else 0)
+
+
 def test_serialize_delete(
     mocker: "MockerFixture",
     tmpdir: pathlib.Path,
@@ -185,7 +231,7 @@ def test_serialize(
     """
     # Arrange
     stub = mocker.stub()
-    mocker.patch.object(serializer_obj, "serialize_item", new=stub)
+    mocker.patch.object(serializer_obj, "serialize_items", new=stub)
     mock: Union[Settings, MockCollection]
     if input_collection_type == "settings":
         mock = Settings()
@@ -205,7 +251,7 @@ def test_serialize(
         assert not stub.called
     else:
         assert stub.called
-        stub.assert_called_with(mock, input_collection)
+        stub.assert_called_with(mock, mock)
 
 
 @pytest.mark.parametrize(
@@ -233,6 +279,69 @@ def test_deserialize_raw(
     assert result == expected_result
 
 
+def test_deserialize_raw_files(
+    tmp_path: pathlib.Path, serializer_obj: file.FileSerializer
+):
+    """
+    Test that all item files of a collection are read and parsed.
+    """
+    # Arrange
+    serializer_obj.libpath = str(tmp_path)
+    (tmp_path / "distros").mkdir()
+    expected_result: List[Dict[str, Any]] = []
+    for i in range(10):
+        item = {"uid": f"uid{i}", "name": f"test_distro_{i}"}
+        (tmp_path / "distros" / f"uid{i}.json").write_text(json.dumps(item))
+        expected_result.append(item)
+
+    # Act
+    result = serializer_obj.deserialize_raw("distros")
+
+    # Assert
+    assert sorted(result, key=lambda x: x["uid"]) == expected_result
+
+
+def test_deserialize_raw_uid_mismatch(
+    tmp_path: pathlib.Path, serializer_obj: file.FileSerializer
+):
+    """
+    Test that an item file whose name doesn't match the uid inside is rejected.
+    """
+    # Arrange
+    serializer_obj.libpath = str(tmp_path)
+    (tmp_path / "distros").mkdir()
+    for i in range(3):
+        (tmp_path / "distros" / f"uid{i}.json").write_text(
+            json.dumps({"uid": "other", "name": f"test_distro_{i}"})
+        )
+
+    # Act & Assert
+    with pytest.raises(CX):
+        serializer_obj.deserialize_raw("distros")
+
+
+def test_deserialize_many(tmp_path: pathlib.Path, serializer_obj: file.FileSerializer):
+    """
+    Test that multiple items are read at once and missing items are left out.
+    """
+    # Arrange
+    serializer_obj.libpath = str(tmp_path)
+    (tmp_path / "distros").mkdir()
+    for i in range(3):
+        (tmp_path / "distros" / f"uid{i}.json").write_text(
+            json.dumps({"uid": f"uid{i}", "name": f"test_distro_{i}"})
+        )
+
+    # Act
+    result = serializer_obj.deserialize_many("distros", ["uid0", "uid2", "missing"])
+
+    # Assert
+    assert result == {
+        "uid0": {"uid": "uid0", "name": "test_distro_0", "inmemory": True},
+        "uid2": {"uid": "uid2", "name": "test_distro_2", "inmemory": True},
+    }
+
+
 @pytest.mark.parametrize(
     "input_collection_type,input_collection,input_topological,expected_result",
     [
@@ -208,3 +208,26 @@ def test_deserialize_item(
 
         # Assert
         assert result in (expected_value, {"inmemory": True})
+
+
+@pytest.mark.mongodb
+def test_deserialize_many(mongodb_obj: mongodb.MongoDBSerializer):
+    """
+    Test that will assert if multiple items are deserialized in chunks and missing items are left out.
+    """
+    # Arrange
+    collection_type = "distros"
+    for i in range(3):
+        mongodb_obj.mongodb["cobbler"][collection_type].insert_one(  # type: ignore
+            {"uid": f"uid{i}", "name": f"test{i}"}
+        )
+    mongodb_obj.max_query_uids = 1
+
+    # Act
+    result = mongodb_obj.deserialize_many(collection_type, ["uid0", "uid2", "missing"])
+
+    # Assert
+    assert result == {
+        "uid0": {"uid": "uid0", "name": "test0", "inmemory": True},
+        "uid2": {"uid": "uid2", "name": "test2", "inmemory": True},
+    }
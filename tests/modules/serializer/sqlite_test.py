@@ -30,6 +30,7 @@ def fixture_test_settings(mocker: MockerFixture) -> Settings:
     settings.cache_enabled = False
     settings.serializer_pretty_json = False
     settings.memory_indexes = {}
+    settings.sqlite = {"synchronous": "NORMAL"}
     return settings
 
 
@@ -400,3 +401,116 @@ def test_deserialize_item(
 
         # Assert
         assert result == expected_result
+
+
+def test_connect_wal(serializer_obj: sqlite.SQLiteSerializer):
+    """
+    Test to verify that the database is used in WAL mode with the configured synchronous level.
+    """
+    # Arrange & Act
+    journal_mode = serializer_obj.connection.execute("PRAGMA journal_mode").fetchone()[0]  # type: ignore
+    synchronous = serializer_obj.connection.execute("PRAGMA synchronous").fetchone()[0]  # type: ignore
+
+    # Assert
+    assert journal_mode == "wal"
+    # 1 is the numeric representation of NORMAL
+    assert synchronous == 1
+
+
+def test_connect_invalid_synchronous(
+    mocker: MockerFixture,
+    cobbler_api: CobblerAPI,
+    tmpdir: pathlib.Path,
+    test_settings: Settings,
+):
+    """
+    Test to verify that an unknown synchronous level is rejected.
+    """
+    # Arrange
+    mocker.patch.object(cobbler_api, "settings", return_value=test_settings)
+    test_settings.sqlite = {"synchronous": "SOMETIMES"}
+    sqlite_obj = sqlite.storage_factory(cobbler_api)
+    sqlite_obj.database_file = os.path.join(tmpdir, "tests.db")
+
+    # Act & Assert
+    with pytest.raises(CX):
+        sqlite_obj.deserialize_raw("tests")
+
+
+def test_serialize_items(
+    mocker: "MockerFixture",
+    serializer_obj: sqlite.SQLiteSerializer,
+    cobbler_api: CobblerAPI,
+):
+    """
+    Test to verify that multiple items are written at once and that the expression indexes are created.
+    """
+    # pylint: disable=protected-access
+    # Arrange
+    mcollection = MockCollection(cobbler_api._collection_mgr)  # type: ignore
+    mocker.patch.object(cobbler_api, "get_items", return_value=mcollection)
+    items: List[MockBootableItem] = []
+    for i in range(3):
+        mitem = MockBootableItem(cobbler_api)
+        mitem.name = f"test_serialize_items_{i}"  # type: ignore[method-assign]
+        items.append(mitem)
+
+    # Act
+    result = serializer_obj.serialize_items(mcollection, items)  # type: ignore
+    rows = serializer_obj.connection.execute("SELECT count(*) FROM tests").fetchone()[0]  # type: ignore
+    indexes = {
+        row[0]
+        for row in serializer_obj.connection.execute(  # type: ignore
+            "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='tests'"
+        )
+    }
+
+    # Assert
+    assert result == 3
+    assert rows == 3
+    assert {"tests_name", "tests_mtime"} <= indexes
+
+
+def test_deserialize_many(serializer_obj: sqlite.SQLiteSerializer):
+    """
+    Test to verify that multiple items are loaded with a single query and missing items are left out.
+    """
+    # Arrange
+    for i in range(3):
+        serializer_obj.connection.execute(  # type: ignore
+            "INSERT INTO tests(uid, item) VALUES(:uid,:item)",
+            {
+                "uid": f"uid{i}",
+                "item": json.dumps({"uid": f"uid{i}", "name": f"test{i}"}),
+            },
+        )
+    serializer_obj.connection.commit()  # type: ignore
+    serializer_obj.max_bind_vars = 1
+
+    # Act
+    result = serializer_obj.deserialize_many("tests", ["uid0", "uid2", "missing"])
+
+    # Assert
+    assert result == {
+        "uid0": {"uid": "uid0", "name": "test0", "inmemory": True},
+        "uid2": {"uid": "uid2", "name": "test2", "inmemory": True},
+    }
+
+
+def test_find_uids_since(serializer_obj: sqlite.SQLiteSerializer):
+    """
+    Test to verify that the items modified since a given time are found without loading them.
+    """
+    # Arrange
+    for uid, mtime in (("old", 10.0), ("new", 30.0), ("unset", 0.0)):
+        serializer_obj.connection.execute(  # type: ignore
+            "INSERT INTO tests(uid, item) VALUES(:uid,:item)",
+            {"uid": uid, "item": json.dumps({"uid": uid, "mtime": mtime})},
+        )
+    serializer_obj.connection.commit()  # type: ignore
+
+    # Act
+    result = serializer_obj.find_uids_since("tests", 20.0)
+
+    # Assert
+    assert sorted(result) == ["new", "unset"]  # type: ignore
@@ -37,6 +37,26 @@ class CobblerTree:
     test_rounds = int(os.environ.get("COBBLER_PERFORMANCE_TEST_ROUNDS", 1))
     test_iterations = int(os.environ.get("COBBLER_PERFORMANCE_TEST_ITERATIONS", -1))
     tree_levels = 3
+    collection_types = [
+        "template",
+        "menu",
+        "distro",
+        "repo",
+        "profile",
+        "image",
+        "system",
+        "network_interface",
+    ]
+
+    @staticmethod
+    def count_items(api: CobblerAPI) -> int:
+        """
+        Count the items of all collections which are loaded during the startup of the daemon.
+        """
+        return sum(
+            len(api.get_items(collection_type))
+            for collection_type in CobblerTree.collection_types
+        )
 
     @staticmethod
     def create_repos(api: CobblerAPI, save: bool, with_triggers: bool, with_sync: bool):
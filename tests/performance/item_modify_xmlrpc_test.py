@@ -0,0 +1,75 @@
+"""
+Test module to assert the performance of modifying items via the XML-RPC API.
+"""
+
+import xmlrpc.client
+from typing import Callable, List, Tuple
+
+import pytest
+from pytest_benchmark.fixture import (  # type: ignore[reportMissingTypeStubs,import-untyped]
+    BenchmarkFixture,
+)
+
+from cobbler.api import CobblerAPI
+from cobbler.items.distro import Distro
+from cobbler.remote import ProxiedXMLRPCInterface
+from cobbler.utils import get_shared_secret
+
+from tests.conftest import XMLRPCServerType
+from tests.performance import CobblerTree
+
+
+@pytest.mark.parametrize(
+    "what",
+    [
+        "distro",
+        "profile",
+        "system",
+    ],
+)
+def test_item_modify_xmlrpc(
+    benchmark: BenchmarkFixture,
+    cobbler_api: CobblerAPI,
+    create_distro: Callable[[str, bool], Distro],
+    start_xmlrpc_server: Callable[
+        [int], Tuple[ProxiedXMLRPCInterface, XMLRPCServerType]
+    ],
+    what: str,
+):
+    """
+    Test that asserts if modifying items via XML-RPC is running without a performance decrease. All modifications of a
+    round are sent as a single multicall, thus the object lookups of the server dominate the measurement.
+    """
+
+    def item_modify(url: str, token: str, uids: List[str]):
+        client = xmlrpc.client.ServerProxy(url)
+        multicall = xmlrpc.client.MultiCall(client)
+        for uid in uids:
+            multicall.modify_item(what, uid, ["comment"], "test comment", token)  # type: ignore
+        results = list(multicall())  # type: ignore
+        client("close")()  # type: ignore
+        return results
+
+    # Arrange
+    iterations = 1
+    if CobblerTree.test_iterations > -1:
+        iterations = CobblerTree.test_iterations
+    CobblerTree.create_all_objs(
+        cobbler_api, create_distro, save=False, with_triggers=False, with_sync=False
+    )
+    uids = [item.uid for item in cobbler_api.get_items(what)]
+    xinterface, server = start_xmlrpc_server(0)
+    token = xinterface.proxied.login("", get_shared_secret())  # type: ignore
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    # Act
+    result = benchmark.pedantic(  # type: ignore
+        item_modify,
+        args=(url, token, uids),
+        rounds=CobblerTree.test_rounds,
+        iterations=iterations,
+    )
+
+    # Assert
+    benchmark.extra_info["modifications_per_second"] = len(uids) / benchmark.stats.stats.mean  # type: ignore
+    assert result == [True] * len(uids)
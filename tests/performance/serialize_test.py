@@ -0,0 +1,68 @@
+"""
+Test module to assert the performance of writing the whole collection tree to disk.
+"""
+
+from typing import Callable
+
+import pytest
+from pytest_benchmark.fixture import (  # type: ignore[reportMissingTypeStubs,import-untyped]
+    BenchmarkFixture,
+)
+
+from cobbler.api import CobblerAPI
+from cobbler.items.distro import Distro
+from cobbler.items.system import System
+
+from tests.performance import CobblerTree
+
+
+@pytest.mark.parametrize(
+    "systems_count",
+    [
+        1000,
+        10000,
+        100000,
+    ],
+)
+@pytest.mark.parametrize("batch", [False, True])
+def test_systems_serialize(
+    benchmark: BenchmarkFixture,
+    cobbler_api: CobblerAPI,
+    create_distro: Callable[[str, bool], Distro],
+    systems_count: int,
+    batch: bool,
+):
+    """
+    Test that compares writing all systems one by one with writing them in a single batch.
+    """
+
+    def serialize_one_by_one():
+        for test_system in cobbler_api.systems():
+            # pylint: disable-next=protected-access
+            cobbler_api._collection_mgr.serialize_one_item(test_system)  # type: ignore
+
+    def serialize_batch():
+        # pylint: disable-next=protected-access
+        cobbler_api._collection_mgr.serialize()  # type: ignore
+
+    # Arrange
+    test_distro = create_distro("test_distro_serialize", False)
+    cobbler_api.distros().add(test_distro)
+    test_profile = cobbler_api.new_profile(
+        name="test_profile_serialize", distro=test_distro.uid
+    )
+    cobbler_api.profiles().add(test_profile)
+    for i in range(systems_count):
+        test_system = System(cobbler_api)
+        test_system.name = f"test_system_{i}"
+        test_system.profile = test_profile.uid
+        cobbler_api.systems().add(test_system)
+
+    # Act
+    benchmark.pedantic(  # type: ignore
+        serialize_batch if batch else serialize_one_by_one,
+        rounds=CobblerTree.test_rounds,
+    )
+
+    # Assert
+    assert len(cobbler_api.systems()) == systems_count
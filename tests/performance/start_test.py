@@ -69,7 +69,12 @@ def test_start(
         cobbler_api, create_distro, save=True, with_triggers=False, with_sync=False
     )
 
+    expected_items = CobblerTree.count_items(cobbler_api)
+
     # Act
     result = benchmark.pedantic(start_cobbler, rounds=CobblerTree.test_rounds, iterations=iterations)  # type: ignore
 
     # Assert
+    assert CobblerTree.count_items(cobbler_api) == expected_items
+    benchmark.extra_info["items"] = expected_items  # type: ignore
+    benchmark.extra_info["items_per_second"] = expected_items / benchmark.stats.stats.mean  # type: ignore
@@ -0,0 +1,70 @@
+"""
+Test module to assert that looking up the interfaces of a system does not depend on the size of the fleet.
+"""
+
+from typing import Callable, List
+
+import pytest
+from pytest_benchmark.fixture import (  # type: ignore[reportMissingTypeStubs,import-untyped]
+    BenchmarkFixture,
+)
+
+from cobbler.api import CobblerAPI
+from cobbler.items.distro import Distro
+from cobbler.items.network_interface import NetworkInterface
+from cobbler.items.system import System
+
+from tests.performance import CobblerTree
+
+SAMPLE_SIZE = 1000
+
+
+@pytest.mark.parametrize(
+    "systems_count",
+    [
+        1000,
+        10000,
+        50000,
+    ],
+)
+def test_system_interfaces(
+    benchmark: BenchmarkFixture,
+    cobbler_api: CobblerAPI,
+    create_distro: Callable[[str, bool], Distro],
+    systems_count: int,
+):
+    """
+    Test that asserts that the per-system cost of ``System.interfaces`` stays flat from 1k to 50k systems. The
+    benchmarked function always resolves the interfaces of the same number of systems.
+    """
+
+    def system_interfaces(sample: List[System]):
+        for test_system in sample:
+            _ = test_system.interfaces
+
+    # Arrange
+    test_distro = create_distro("test_distro_interfaces", False)
+    cobbler_api.distros().add(test_distro)
+    test_profile = cobbler_api.new_profile(
+        name="test_profile_interfaces", distro=test_distro.uid
+    )
+    cobbler_api.profiles().add(test_profile)
+    for i in range(systems_count):
+        test_system = System(cobbler_api)
+        test_system.name = f"test_system_{i}"
+        test_system.profile = test_profile.uid
+        cobbler_api.systems().add(test_system)
+        cobbler_api.network_interfaces().add(
+            NetworkInterface(
+                api=cobbler_api, system_uid=test_system.uid, name="default"
+            )
+        )
+    sample = list(cobbler_api.systems())[:SAMPLE_SIZE]
+
+    # Act
+    benchmark.pedantic(  # type: ignore
+        system_interfaces, args=(sample,), rounds=CobblerTree.test_rounds
+    )
+
+    # Assert
+    assert all(len(test_system.interfaces) == 1 for test_system in sample)
@@ -0,0 +1,56 @@
+"""
+Test module to assert the performance of generating the boot configuration files of all systems.
+"""
+
+import os
+from typing import Callable
+
+import pytest
+from pytest_benchmark.fixture import (  # type: ignore[reportMissingTypeStubs,import-untyped]
+    BenchmarkFixture,
+)
+
+from cobbler.api import CobblerAPI
+from cobbler.items.distro import Distro
+from cobbler.modules.managers import in_tftpd
+
+from tests.performance import CobblerTree
+
+
+@pytest.mark.parametrize("sync_workers", [1, 2, 4, 8])
+def test_write_system_files(
+    benchmark: BenchmarkFixture,
+    cobbler_api: CobblerAPI,
+    create_distro: Callable[[str, bool], Distro],
+    sync_workers: int,
+):
+    """
+    Test that asserts if generating the files of the systems during a sync scales with the number of worker processes.
+    """
+
+    def write_system_files():
+        return manager.write_system_files(systems, menu_items)
+
+    # Arrange
+    iterations = 1
+    if CobblerTree.test_iterations > -1:
+        iterations = CobblerTree.test_iterations
+    iterations_per_test = int(
+        os.getenv("COBBLER_PERFORMANCE_TEST_WRITE_SYSTEM_FILES_ITERATIONS", -1)
+    )
+    if iterations_per_test > -1:
+        iterations = iterations_per_test
+    # Reset the tftp singleton to prevent accessing stale manager collections
+    in_tftpd.MANAGER = None
+    cobbler_api.settings().sync_workers = sync_workers
+    CobblerTree.create_all_objs(cobbler_api, create_distro, False, False, False)
+    manager = in_tftpd.get_manager(cobbler_api)
+    systems = list(cobbler_api.systems())
+    menu_items = cobbler_api.tftpgen.get_menu_items()
+
+    # Act
+    result = benchmark.pedantic(write_system_files, rounds=CobblerTree.test_rounds, iterations=iterations)  # type: ignore
+
+    # Assert
+    benchmark.extra_info["systems_per_second"] = len(systems) / benchmark.stats.stats.mean  # type: ignore
+    assert len(result) == len(systems)
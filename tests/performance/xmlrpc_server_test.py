@@ -0,0 +1,84 @@
+"""
+Test module to assert the performance of the XML-RPC server under concurrent load.
+"""
+
+import os
+import xmlrpc.client
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Tuple
+
+import pytest
+from pytest_benchmark.fixture import (  # type: ignore[reportMissingTypeStubs,import-untyped]
+    BenchmarkFixture,
+)
+
+from cobbler.api import CobblerAPI
+from cobbler.items.distro import Distro
+from cobbler.remote import ProxiedXMLRPCInterface
+from cobbler.utils import get_shared_secret
+
+from tests.conftest import XMLRPCServerType
+from tests.performance import CobblerTree
+
+
+@pytest.mark.parametrize(
+    "workers",
+    [
+        0,
+        8,
+    ],
+)
+def test_xmlrpc_server_load(
+    benchmark: BenchmarkFixture,
+    cobbler_api: CobblerAPI,
+    create_distro: Callable[[str, bool], Distro],
+    start_xmlrpc_server: Callable[
+        [int], Tuple[ProxiedXMLRPCInterface, XMLRPCServerType]
+    ],
+    workers: int,
+):
+    """
+    Test that asserts if many concurrent clients are served by the XML-RPC server without a performance decrease.
+    """
+    clients = int(os.getenv("COBBLER_PERFORMANCE_TEST_XMLRPC_CLIENTS", 64))
+    requests_per_client = int(os.getenv("COBBLER_PERFORMANCE_TEST_XMLRPC_REQUESTS", 20))
+
+    def client_run(url: str, profile_names: List[str]):
+        client = xmlrpc.client.ServerProxy(url)
+        for index in range(requests_per_client):
+            client.get_profile(profile_names[index % len(profile_names)])
+        client("close")()  # type: ignore
+
+    def generate_load(url: str, profile_names: List[str]):
+        with ThreadPoolExecutor(max_workers=clients) as executor:
+            for future in [
+                executor.submit(client_run, url, profile_names) for _ in range(clients)
+            ]:
+                future.result()
+
+    # Arrange
+    iterations = 1
+    if CobblerTree.test_iterations > -1:
+        iterations = CobblerTree.test_iterations
+    CobblerTree.create_all_objs(
+        cobbler_api, create_distro, save=False, with_triggers=False, with_sync=False
+    )
+    profile_names = [profile.name for profile in cobbler_api.profiles()]
+    xinterface, server = start_xmlrpc_server(workers)
+    token = xinterface.proxied.login("", get_shared_secret())  # type: ignore
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    # Act
+    result = benchmark.pedantic(  # type: ignore
+        generate_load,
+        args=(url, profile_names),
+        rounds=CobblerTree.test_rounds,
+        iterations=iterations,
+    )
+
+    # Assert
+    status = xinterface.proxied.get_xmlrpc_server_status(token)
+    benchmark.extra_info["requests"] = clients * requests_per_client  # type: ignore
+    benchmark.extra_info["requests_per_second"] = clients * requests_per_client / benchmark.stats.stats.mean  # type: ignore
+    benchmark.extra_info["server_status"] = status  # type: ignore
+    assert status["mode"] == ("pool" if workers > 0 else "threading")
@@ -3,6 +3,7 @@ Tests that validate the functionality of the module that is responsible for abst
 (de)serializers.
 """
 
+import threading
 from typing import TYPE_CHECKING
 
 import pytest
@@ -49,8 +50,8 @@ def test_serialize(mocker: "MockerFixture", serializer_obj: serializer.Serialize
     serializer_obj.serialize(input_collection)
 
     # Assert
-    # One access for __grab_lock and one for __release_lock
-    assert mock_lock_file_location.call_count == 2
+    # One access for __grab_lock, __release_lock reuses its handle
+    assert mock_lock_file_location.call_count == 1
 
 
 def test_serialize_item(mocker: "MockerFixture", serializer_obj: serializer.Serializer):
@@ -75,8 +76,70 @@ def test_serialize_item(mocker: "MockerFixture", serializer_obj: serializer.Seri
     # Assert
     storage_object_mock.serialize_item.assert_called_with(input_collection, input_item)
     # One access for __grab_lock
-    # Two access for __release_lock (mtime is true in this case)
-    assert mock_lock_file_location.call_count == 3
+    # One access for __release_lock (mtime is true in this case)
+    assert mock_lock_file_location.call_count == 2
+
+
+def test_serialize_batch(
+    mocker: "MockerFixture", serializer_obj: serializer.Serializer
+):
+    """
+    Verify that all items written inside a batch share a single lock and a single modification time update.
+    """
+    # Arrange
+    open_mock = mocker.MagicMock()
+    open_mock.fileno.return_value = 5
+    mock_lock_file_location = mocker.patch(
+        "builtins.open", return_value=mocker.mock_open(mock=open_mock)
+    )
+    mocker.patch("fcntl.flock")
+    mocker.patch("os.path.exists", return_value=True)
+    input_collection = mocker.MagicMock()
+    storage_object_mock = mocker.patch.object(serializer_obj, "storage_object")
+    storage_object_mock.serialize_items.return_value = 2
+
+    # Act
+    with serializer_obj.batch():
+        for _ in range(10):
+            serializer_obj.serialize_item(input_collection, mocker.MagicMock())
+        serializer_obj.serialize_items(
+            input_collection, [mocker.MagicMock(), mocker.MagicMock()]
+        )
+
+    # Assert
+    assert storage_object_mock.serialize_item.call_count == 10
+    assert storage_object_mock.serialize_items.call_count == 1
+    # One access for __grab_lock and one for __release_lock (mtime is true in this case)
+    assert mock_lock_file_location.call_count == 2
+
+
+def test_serialize_batch_concurrent_thread(
+    mocker: "MockerFixture", serializer_obj: serializer.Serializer
+):
+    """
+    Verify that another thread grabbing the lock doesn't replace the lock handle of a running batch.
+    """
+    # Arrange
+    mocker.patch("fcntl.flock")
+    mocker.patch("os.path.exists", return_value=True)
+    storage_object_mock = mocker.patch.object(serializer_obj, "storage_object")
+    storage_object_mock.deserialize_item.return_value = {}
+
+    # Act
+    with serializer_obj.batch():
+        batch_handle = serializer_obj.lock_handle
+        worker = threading.Thread(
+            target=serializer_obj.deserialize_item, args=("system", "uid")
+        )
+        worker.start()
+        worker.join()
+        handle_after_worker = serializer_obj.lock_handle
+
+    # Assert
+    assert batch_handle is not None
+    assert handle_after_worker is batch_handle
+    assert batch_handle.closed
+    assert serializer_obj.lock_handle is None
 
 
 def test_serialize_delete(
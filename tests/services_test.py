@@ -0,0 +1,156 @@
+"""
+Tests that validate the functionality of the module that is responsible for the WSGI service application.
+"""
+
+import os
+import pathlib
+import xmlrpc.client
+from typing import Callable, Tuple
+
+import pytest
+from pytest_mock import MockerFixture
+
+from cobbler.remote import PooledCobblerXMLRPCServer, ProxiedXMLRPCInterface
+from cobbler.services import SettingsSnapshot, XMLRPCConnectionPool, application
+
+
+def test_settings_snapshot(tmp_path: pathlib.Path):
+    """
+    Test that the settings file is only parsed again once its mtime changed.
+    """
+    # Arrange
+    settings_file = tmp_path / "settings.yaml"
+    settings_file.write_text("xmlrpc_port: 25151\n", encoding="UTF-8")
+    snapshot = SettingsSnapshot(str(settings_file))
+
+    # Act
+    first = snapshot.get()
+    second = snapshot.get()
+    settings_file.write_text("xmlrpc_port: 25152\n", encoding="UTF-8")
+    os.utime(settings_file, ns=(0, 1))
+    third = snapshot.get()
+
+    # Assert
+    assert first is second
+    assert first["xmlrpc_port"] == 25151
+    assert third["xmlrpc_port"] == 25152
+
+
+def test_connection_pool_reuse(
+    start_xmlrpc_server: Callable[
+        [int], Tuple[ProxiedXMLRPCInterface, PooledCobblerXMLRPCServer]
+    ],
+):
+    """
+    Test that consecutive requests reuse the same keep-alive connection to the XMLRPC server.
+    """
+    # Arrange
+    _, server = start_xmlrpc_server(2)
+    pool = XMLRPCConnectionPool(f"http://127.0.0.1:{server.server_address[1]}")
+
+    # Act
+    with pool.connection() as remote:
+        first_result = remote.ping()
+    with pool.connection() as remote_reused:
+        second_result = remote_reused.ping()
+    handled_connections = server.status()["handled_connections"]
+    remote_reused("close")()  # type: ignore
+
+    # Assert
+    assert first_result is True
+    assert second_result is True
+    assert remote is remote_reused
+    assert handled_connections == 0
+
+
+def test_connection_pool_discards_broken_connection():
+    """
+    Test that a connection which failed with a transport error is not handed out again.
+    """
+    # Arrange
+    pool = XMLRPCConnectionPool("http://127.0.0.1:1")
+
+    # Act
+    with pytest.raises(OSError):
+        with pool.connection() as remote:
+            remote.ping()
+    with pool.connection() as remote_new:
+        pass
+
+    # Assert
+    assert remote is not remote_new
+
+
+@pytest.mark.parametrize(
+    "exception,expected_reuse",
+    [
+        (xmlrpc.client.Fault(1, "CX"), True),
+        (ValueError("unrelated"), False),
+        (KeyboardInterrupt(), False),
+    ],
+)
+def test_connection_pool_exceptions(exception: BaseException, expected_reuse: bool):
+    """
+    Test that a connection is only handed out again after an XMLRPC fault and closed after any other exception.
+    """
+    # Arrange
+    pool = XMLRPCConnectionPool("http://127.0.0.1:1")
+
+    # Act
+    with pytest.raises(type(exception)):
+        with pool.connection() as remote:
+            raise exception
+    with pool.connection() as remote_next:
+        pass
+
+    # Assert
+    assert (remote is remote_next) == expected_reuse
+
+
+@pytest.mark.parametrize(
+    "not_modified,expected_status,expected_body",
+    [
+        (False, "200 OK", b"kernel vmlinuz"),
+        (True, "304 NOT MODIFIED", b""),
+    ],
+)
+def test_application_etag(
+    mocker: MockerFixture,
+    not_modified: bool,
+    expected_status: str,
+    expected_body: bytes,
+):
+    """
+    Test that generated files are sent with validators and that a matching "If-None-Match" header results in a 304.
+    """
+    # Arrange
+    remote = mocker.MagicMock()
+    remote.generate_file.return_value = {
+        "etag": '"abc"',
+        "last_modified": 0.0,
+        "not_modified": not_modified,
+        "content": "" if not_modified else "kernel vmlinuz",
+    }
+    pool = mocker.MagicMock()
+    pool.connection.return_value.__enter__.return_value = remote
+    mocker.patch("cobbler.services.XMLRPCConnectionPool", return_value=pool)
+    mocker.patch.dict("cobbler.services.__connection_pools", clear=True)
+    start_response = mocker.MagicMock()
+    environ = {
+        "RAW_URI": "/cblr/svc/op/bootcfg/system/testsystem",
+        "QUERY_STRING": "",
+        "HTTP_IF_NONE_MATCH": '"abc"',
+    }
+
+    # Act
+    result = application(environ, start_response)
+
+    # Assert
+    remote.generate_file.assert_called_once_with(
+        "bootcfg", {"profile": None, "system": "testsystem"}, '"abc"'
+    )
+    status, headers = start_response.call_args[0]
+    assert status == expected_status
+    assert ("ETag", '"abc"') in headers
+    assert ("Last-Modified", "Thu, 01 Jan 1970 00:00:00 GMT") in headers
+    assert result == [expected_body]
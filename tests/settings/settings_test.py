@@ -28,6 +28,40 @@ def test_to_dict():
     assert result == test_settings.__dict__
 
 
+def test_snapshot():
+    # Arrange
+    test_settings = Settings()
+
+    # Act
+    first = test_settings.snapshot()
+    second = test_settings.snapshot()
+    test_settings.server = "192.168.1.1"
+    third = test_settings.snapshot()
+
+    # Assert
+    assert first is second
+    assert first["server"] == "127.0.0.1"
+    assert third is not first
+    assert third["server"] == "192.168.1.1"
+    assert "_version" not in test_settings.to_dict()
+    with pytest.raises(TypeError):
+        first["server"] = "192.168.1.2"  # type: ignore
+
+
+def test_snapshot_from_dict():
+    # Arrange
+    test_settings = Settings()
+    version = test_settings.version
+    test_settings.snapshot()
+
+    # Act
+    test_settings.from_dict({"server": "192.168.1.1"})
+
+    # Assert
+    assert test_settings.version > version
+    assert test_settings.snapshot()["server"] == "192.168.1.1"
+
+
 def test_is_valid():
     # Arrange
     test_settings = settings.Settings()
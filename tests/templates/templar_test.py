@@ -67,3 +67,83 @@ def test_load_template_providers(cobbler_api: CobblerAPI):
     assert list(
         test_templar.__dict__.get("_Templar__loaded_template_providers", {}).keys()
     ) == ["cheetah", "jinja"]
+
+
+def test_render_compiled_template_cache(cobbler_api: CobblerAPI):
+    """
+    Test to verify that rendering the same template twice only compiles it once.
+    """
+    # Arrange
+    test_templar = Templar(cobbler_api)
+    test_templar.load_template_providers()
+
+    # Act
+    result1 = test_templar.render("$test", {"test": 5}, None, "cheetah")
+    result2 = test_templar.render("$test", {"test": 6}, None, "cheetah")
+    result3 = test_templar.render("{{ foo }}", {"foo": "a"}, None, "jinja")
+    result4 = test_templar.render("{{ foo }}", {"foo": "b"}, None, "jinja")
+
+    # Assert
+    assert (result1, result2, result3, result4) == ("5", "6", "a", "b")
+    assert test_templar.template_cache_statistics == {
+        "cheetah": {"hits": 1, "misses": 1, "size": 1},
+        "jinja": {"hits": 1, "misses": 1, "size": 1},
+    }
+
+
+def test_render_cheetah_cached_errors(cobbler_api: CobblerAPI):
+    """
+    Test to verify that the errors of a cached Cheetah template are not carried over to the next render.
+    """
+    # Arrange
+    test_templar = Templar(cobbler_api)
+    test_templar.load_template_providers()
+    test_templar.render("$missing", {}, None, "cheetah")
+    errors_first_render = len(test_templar.last_errors)
+
+    # Act
+    test_templar.render("$missing", {}, None, "cheetah")
+
+    # Assert
+    assert errors_first_render == 1
+    assert len(test_templar.last_errors) == 1
+
+
+def test_compiled_template_cache_bounded(cobbler_api: CobblerAPI):
+    """
+    Test to verify that the compiled template cache evicts the least recently used template.
+    """
+    # Arrange
+    test_templar = Templar(cobbler_api)
+    test_templar.load_template_providers()
+    provider = test_templar.__dict__["_Templar__loaded_template_providers"]["jinja"]
+    provider.compiled_template_cache_size = 2
+    test_templar.render("{{ a }}", {}, None, "jinja")
+    test_templar.render("{{ b }}", {}, None, "jinja")
+    test_templar.render("{{ a }}", {}, None, "jinja")
+
+    # Act
+    test_templar.render("{{ c }}", {}, None, "jinja")
+    test_templar.render("{{ a }}", {}, None, "jinja")
+    test_templar.render("{{ b }}", {}, None, "jinja")
+
+    # Assert
+    assert provider.cache_statistics == {"hits": 2, "misses": 4, "size": 2}
+
+
+def test_clear_template_cache(cobbler_api: CobblerAPI):
+    """
+    Test to verify that clearing the cache drops the compiled templates of all providers.
+    """
+    # Arrange
+    test_templar = Templar(cobbler_api)
+    test_templar.load_template_providers()
+    test_templar.render("$test", {"test": 5}, None, "cheetah")
+    test_templar.render("{{ foo }}", {"foo": "a"}, None, "jinja")
+
+    # Act
+    test_templar.clear_template_cache()
+
+    # Assert
+    for statistics in test_templar.template_cache_statistics.values():
+        assert statistics["size"] == 0
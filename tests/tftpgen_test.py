@@ -18,6 +18,7 @@ from cobbler.items.image import Image
 from cobbler.items.profile import Profile
 from cobbler.items.system import System
 from cobbler.templates import Templar
+from cobbler.utils import filesystem_helpers
 
 if TYPE_CHECKING:
     from pytest_mock import MockerFixture
@@ -104,6 +105,41 @@ def test_copy_single_distro_files(
     assert os.path.exists(result_initrd)
 
 
+def test_hash_distro_files(
+    mocker: "MockerFixture",
+    tmp_path: pathlib.Path,
+    create_kernel_initrd: Callable[[str, str], str],
+    fk_initrd: str,
+    fk_kernel: str,
+    cobbler_api: CobblerAPI,
+):
+    """
+    Test to verify that the kernel and initrd which can't be hardlinked are hashed once into the hash index.
+    """
+    # Arrange
+    directory = create_kernel_initrd(fk_kernel, fk_initrd)
+    test_distro = Distro(cobbler_api)
+    test_distro.name = "test_hash_distro_files"  # type: ignore[method-assign]
+    test_distro.kernel = str(os.path.join(directory, fk_kernel))  # type: ignore[method-assign]
+    test_distro.initrd = str(os.path.join(directory, fk_initrd))  # type: ignore[method-assign]
+    mocker.patch.object(
+        filesystem_helpers, "HASH_INDEX_PATH", str(tmp_path / "link_cache.db")
+    )
+    mocker.patch.object(filesystem_helpers, "is_safe_to_hardlink", return_value=False)
+    test_gen = tftpgen.TFTPGen(cobbler_api)
+
+    # Act
+    first_result = test_gen.hash_distro_files([test_distro], directory, False)
+    second_result = test_gen.hash_distro_files([test_distro], directory, False)
+    symlink_result = test_gen.hash_distro_files([test_distro], directory, True)
+
+    # Assert
+    assert first_result == {"hits": 0, "misses": 2}
+    assert second_result == {"hits": 2, "misses": 0}
+    assert symlink_result == {"hits": 0, "misses": 0}
+    filesystem_helpers.get_hash_index().close()
+
+
 @pytest.mark.skip("Test broken atm.")
 def test_copy_single_image_files(
     cobbler_api: CobblerAPI, create_image: Callable[[], Image]
@@ -315,9 +351,9 @@ def test_write_all_system_files_s390(
     test_gen = tftpgen.TFTPGen(cobbler_api)
 
     mocker.patch.object(test_system, "is_management_supported", return_value=True)
-    open_mock = mocker.mock_open()
-    open_mock.write = mocker.MagicMock()
-    mocker.patch("builtins.open", open_mock)
+    mock_write_file = mocker.patch(
+        "cobbler.utils.filesystem_helpers.write_file", return_value=True
+    )
 
     # Act
     # pylint: disable-next=protected-access
@@ -326,9 +362,10 @@ def test_write_all_system_files_s390(
     )
 
     # Assert - ensure generated parm file has fixed 80 characters format
-    open_mock().write.assert_called()
-    open_mock().write.assert_any_call(
+    written_data = [call.args[1] for call in mock_write_file.call_args_list]
+    assert (
         "autoyast=http://xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx/this-is-a-long-string-that-\nneed-to-be-splitted/zzzzzzzzzzzzzzzzz \nfoobar1=whatever \nfoobar2=woohooo\n"
+        in written_data
     )
 
 
@@ -371,6 +408,41 @@ def test_get_menu_items(mocker: "MockerFixture", cobbler_api: CobblerAPI):
     assert result == expected_result
 
 
+def test_get_menu_items_cached(
+    mocker: "MockerFixture",
+    cobbler_api: CobblerAPI,
+    create_distro: Callable[[], Distro],
+    create_profile: Callable[[str], Profile],
+):
+    """
+    Test to verify that the menu entries are rendered once for all architectures and are kept until a profile changes.
+    """
+    # Arrange
+    test_distro = create_distro()
+    test_profile = create_profile(test_distro.uid)
+    test_gen = tftpgen.TFTPGen(cobbler_api)
+    spy_write_pxe_file = mocker.spy(test_gen, "write_pxe_file")
+
+    # Act
+    first_result = test_gen.get_menu_items()
+    arch_result = test_gen.get_menu_items(enums.Archs.X86_64)
+    other_arch_result = test_gen.get_menu_items(enums.Archs.PPC64LE)
+    first_result["menu_items"][enums.BootLoader.PXE] = ""  # type: ignore
+    cached_result = test_gen.get_menu_items()
+    renders = spy_write_pxe_file.call_count
+    test_profile.display_name = "changed"
+    cobbler_api.add_profile(test_profile, with_sync=False)
+    changed_result = test_gen.get_menu_items()
+
+    # Assert
+    assert renders == len(test_profile.boot_loaders)
+    assert test_profile.name in cached_result["menu_items"][enums.BootLoader.PXE]  # type: ignore
+    assert arch_result["menu_items"] == cached_result["menu_items"]
+    assert other_arch_result["menu_items"] == {}
+    assert spy_write_pxe_file.call_count == 2 * renders
+    assert "changed" in changed_result["menu_items"][enums.BootLoader.PXE]  # type: ignore
+
+
 @pytest.mark.skip("Test broken atm.")
 def test_get_submenus(mocker: "MockerFixture", cobbler_api: CobblerAPI):
     """
@@ -473,6 +545,34 @@ def test_write_pxe_file(mocker: "MockerFixture", cobbler_api: CobblerAPI):
     assert isinstance(result, str)
 
 
+def test_write_pxe_file_settings_snapshot(
+    cobbler_api: CobblerAPI,
+    create_distro: Callable[[], Distro],
+    create_profile: Callable[[str], Profile],
+):
+    """
+    Test to verify that the settings are layered on top of the passed metadata without being copied into it and that
+    the settings snapshot is reused until a setting changes.
+    """
+    # Arrange
+    test_distro = create_distro()
+    test_profile = create_profile(test_distro.uid)
+    test_gen = tftpgen.TFTPGen(cobbler_api)
+    metadata: Dict[str, Union[str, Dict[str, str]]] = {"test_key": "test_value"}
+
+    # Act
+    result = test_gen.write_pxe_file(
+        None, None, test_profile, test_distro, enums.Archs.X86_64, metadata=metadata
+    )
+    snapshot = cobbler_api.settings().snapshot()
+    test_gen.write_pxe_file(None, None, test_profile, test_distro, enums.Archs.X86_64)
+
+    # Assert
+    assert test_profile.name in result
+    assert "server" not in metadata
+    assert cobbler_api.settings().snapshot() is snapshot
+
+
 @pytest.mark.skip("Test broken atm.")
 def test_build_kernel(mocker: "MockerFixture", cobbler_api: CobblerAPI):
     """
@@ -819,3 +919,101 @@ def test_write_bootcfg_file(
     # Assert
     assert result == expected_result
     assert pathlib.Path("/srv/tftpboot/esxi/example.txt").is_file()
+
+
+@pytest.fixture(name="setup_test_generate_tftp_file")
+def fixture_setup_test_generate_tftp_file(
+    cobbler_api: CobblerAPI,
+    create_distro: Callable[[], Distro],
+    create_profile: Callable[[str], Profile],
+    create_system: Any,
+) -> Tuple[System, pathlib.Path, tftpgen.TFTPGen]:
+    """
+    Setup fixture for the tests of "generate_tftp_file". The returned path is the GRUB config file of the system.
+    """
+    test_distro = create_distro()
+    test_profile = create_profile(test_distro.uid)
+    test_system: System = create_system(profile_uid=test_profile.uid)
+    test_interface = test_system.interfaces["default"]
+    test_interface.mac_address = "aa:bb:cc:dd:ee:ff"
+    cobbler_api.add_network_interface(test_interface)
+    grub_name = test_system.get_config_filename(
+        interface="default", loader=enums.BootLoader.GRUB
+    )
+    assert grub_name is not None
+    test_gen = tftpgen.TFTPGen(cobbler_api)
+    return test_system, pathlib.Path("/grub/system", grub_name), test_gen
+
+
+def test_generate_tftp_file_cached(
+    mocker: "MockerFixture",
+    setup_test_generate_tftp_file: Tuple[System, pathlib.Path, tftpgen.TFTPGen],
+):
+    """
+    Test that asserts that a generated config file is only rendered once and later chunks are served from the cache.
+    """
+    # Arrange
+    _, test_path, test_gen = setup_test_generate_tftp_file
+    spy_generate_system_file = mocker.spy(test_gen, "generate_system_file")
+
+    # Act
+    first_chunk, length = test_gen.generate_tftp_file(test_path, 0, 16)
+    second_chunk, second_length = test_gen.generate_tftp_file(test_path, 16, 16)
+
+    # Assert
+    assert spy_generate_system_file.call_count == 1
+    assert length == second_length
+    assert len(first_chunk) == 16
+    assert (
+        first_chunk + second_chunk == test_gen.generate_tftp_file(test_path, 0, 32)[0]
+    )
+
+
+def test_generate_tftp_file_invalidation(
+    mocker: "MockerFixture",
+    cobbler_api: CobblerAPI,
+    setup_test_generate_tftp_file: Tuple[System, pathlib.Path, tftpgen.TFTPGen],
+):
+    """
+    Test that asserts that a cached config file is regenerated after the system was modified or the menu was rebuilt.
+    """
+    # Arrange
+    test_system, test_path, test_gen = setup_test_generate_tftp_file
+    test_gen.generate_tftp_file(test_path, 0, 512)
+    spy_generate_system_file = mocker.spy(test_gen, "generate_system_file")
+
+    # Act
+    test_system.mtime = test_system.mtime + 1.0
+    test_gen.generate_tftp_file(test_path, 0, 512)
+    test_gen.generate_tftp_file(test_path, 0, 512)
+    test_gen.make_pxe_menu()
+    test_gen.generate_tftp_file(test_path, 0, 512)
+    cobbler_api.add_system(test_system)
+    test_gen.generate_tftp_file(test_path, 0, 512)
+
+    # Assert
+    assert spy_generate_system_file.call_count == 3
+
+
+def test_generate_tftp_file_reverse_index(
+    mocker: "MockerFixture",
+    create_system: Any,
+    setup_test_generate_tftp_file: Tuple[System, pathlib.Path, tftpgen.TFTPGen],
+):
+    """
+    Test that asserts that only the system that owns a config file is asked to generate it.
+    """
+    # Arrange
+    test_system, test_path, test_gen = setup_test_generate_tftp_file
+    for i in range(5):
+        create_system(profile_uid=test_system.profile, name=f"test_other_system_{i}")
+    spy_generate_system_file = mocker.spy(test_gen, "generate_system_file")
+
+    # Act
+    test_gen.generate_tftp_file(test_path, 0, 512)
+
+    # Assert
+    assert spy_generate_system_file.call_count == 1
+    assert spy_generate_system_file.call_args[0][0] == test_system
+    with pytest.raises(FileNotFoundError):
+        test_gen.generate_tftp_file(pathlib.Path("/grub/system/missing"), 0, 512)
@@ -0,0 +1,73 @@
+"""
+Tests that validate the functionality of the module that is responsible for expiring the in-memory caches of the
+XML-RPC API.
+"""
+
+from typing import Dict
+
+from cobbler.utils.expiry import ExpiryQueue
+
+
+def test_expire():
+    """
+    Test to verify that only entries past their deadline are removed and refreshed entries are kept.
+    """
+    # Arrange
+    entries: Dict[str, float] = {"old": 0.0, "refreshed": 0.0, "new": 50.0}
+    expiry_queue = ExpiryQueue(entries, lambda entry: entry, lambda: 100.0)
+    for key in entries:
+        expiry_queue.push(key)
+    entries["refreshed"] = 90.0
+
+    # Act
+    result_early = expiry_queue.expire(99.0)
+    result = expiry_queue.expire(101.0)
+    result_late = expiry_queue.expire(191.0)
+
+    # Assert
+    assert result_early == []
+    assert result == ["old"]
+    assert sorted(result_late) == ["new", "refreshed"]
+    assert entries == {}
+
+
+def test_expire_removed_entry():
+    """
+    Test to verify that entries which were removed from the dict by other code are skipped.
+    """
+    # Arrange
+    entries: Dict[str, float] = {"removed": 0.0}
+    expiry_queue = ExpiryQueue(entries, lambda entry: entry, lambda: 100.0)
+    expiry_queue.push("removed")
+    del entries["removed"]
+
+    # Act
+    result = expiry_queue.expire(101.0)
+
+    # Assert
+    assert result == []
+
+
+def test_expire_changed_timeout():
+    """
+    Test to verify that a lowered timeout applies to existing entries right away and a raised one keeps them longer.
+    """
+    # Arrange
+    entries: Dict[str, float] = {"first": 0.0, "second": 10.0}
+    timeout = {"value": 100.0}
+    expiry_queue = ExpiryQueue(entries, lambda entry: entry, lambda: timeout["value"])
+    for key in entries:
+        expiry_queue.push(key)
+
+    # Act
+    timeout["value"] = 5.0
+    result_lowered = expiry_queue.expire(6.0)
+    timeout["value"] = 50.0
+    result_raised = expiry_queue.expire(16.0)
+    result_late = expiry_queue.expire(61.0)
+
+    # Assert
+    assert result_lowered == ["first"]
+    assert result_raised == []
+    assert result_late == ["second"]
+    assert entries == {}
@@ -71,6 +71,84 @@ def test_hashfile():
     assert expected_hash == result
 
 
+def test_hash_index(tmp_path: Path):
+    """
+    Test to verify that the hash index only reads files it doesn't know in their current state.
+    """
+    # Arrange
+    test_file = tmp_path / "vmlinuz"
+    test_file.write_bytes(b"kernel")
+    expected_hash = filesystem_helpers.sha1_file(test_file)
+    db_path = str(tmp_path / "index" / "link_cache.db")
+    hash_index = filesystem_helpers.HashIndex(db_path)
+
+    # Act
+    first_hash = hash_index.hash_file(str(test_file))
+    second_hash = hash_index.hash_file(str(test_file))
+    test_file.write_bytes(b"another kernel")
+    third_hash = hash_index.hash_file(str(test_file))
+    hash_index.close()
+    reopened_index = filesystem_helpers.HashIndex(db_path)
+    fourth_hash = reopened_index.hash_file(str(test_file))
+    missing_hash = reopened_index.hash_file(str(tmp_path / "missing"))
+    reopened_index.close()
+
+    # Assert
+    assert first_hash == second_hash == expected_hash
+    assert hash_index.hits == 1
+    assert hash_index.misses == 2
+    assert third_hash == fourth_hash != first_hash
+    assert reopened_index.hits == 1
+    assert reopened_index.misses == 0
+    assert missing_hash is None
+
+
+def test_hash_index_hash_files(tmp_path: Path):
+    """
+    Test to verify that the hash index hashes many files in parallel and commits them in batches.
+    """
+    # Arrange
+    test_files = []
+    for index in range(8):
+        test_file = tmp_path / f"initrd{index}"
+        test_file.write_bytes(b"initrd" * index)
+        test_files.append(str(test_file))
+    hash_index = filesystem_helpers.HashIndex(str(tmp_path / "link_cache.db"))
+
+    # Act
+    with hash_index.batch() as statistics:
+        result = hash_index.hash_files(test_files + test_files, workers=4)
+        hash_index.hash_files(test_files[:2])
+
+    # Assert
+    assert result == {
+        test_file: filesystem_helpers.sha1_file(test_file) for test_file in test_files
+    }
+    assert statistics == {"hits": 2, "misses": 8}
+    hash_index.close()
+
+
+def test_hash_index_after_fork(mocker: "MockerFixture", tmp_path: Path):
+    """
+    Test to verify that a forked child doesn't reuse the hash index of its parent.
+    """
+    # Arrange
+    mocker.patch.object(
+        filesystem_helpers, "HASH_INDEX_PATH", str(tmp_path / "link_cache.db")
+    )
+    parent_index = filesystem_helpers.get_hash_index()
+
+    # Act
+    pid = os.fork()
+    if pid == 0:
+        os._exit(0 if filesystem_helpers.get_hash_index() is not parent_index else 1)
+    _, status = os.waitpid(pid, 0)
+
+    # Assert
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert filesystem_helpers.get_hash_index() is parent_index
+
+
 @pytest.mark.skip("This calls a lot of os-specific stuff. Let's fix this test later.")
 def test_cachefile():
     """
@@ -121,6 +199,68 @@ def test_copyfile():
     assert False
 
 
+def test_write_file(tmp_path: Path):
+    """
+    Test to verify that write_file only rewrites files with a different content and reports them to the recorder.
+    """
+    # Arrange
+    tfile = tmp_path / "testfile"
+    tfile.write_text("old", encoding="UTF-8")
+
+    # Act
+    with filesystem_helpers.record_generated_files() as paths:
+        result_changed = filesystem_helpers.write_file(str(tfile), "new")
+        stat_changed = tfile.stat()
+        result_unchanged = filesystem_helpers.write_file(str(tfile), "new")
+
+    # Assert
+    assert result_changed
+    assert not result_unchanged
+    assert tfile.read_text(encoding="UTF-8") == "new"
+    assert tfile.stat().st_mtime_ns == stat_changed.st_mtime_ns
+    assert paths == {str(tfile)}
+
+
+def test_write_file_keeps_mode_and_symlink(tmp_path: Path):
+    """
+    Test to verify that write_file keeps the mode of the file and replaces the target of a symlink.
+    """
+    # Arrange
+    tfile = tmp_path / "testfile"
+    tfile.write_text("old", encoding="UTF-8")
+    tfile.chmod(0o640)
+    tlink = tmp_path / "testlink"
+    tlink.symlink_to(tfile)
+
+    # Act
+    result = filesystem_helpers.write_file(str(tlink), "new")
+
+    # Assert
+    assert result
+    assert tlink.is_symlink()
+    assert tfile.read_text(encoding="UTF-8") == "new"
+    assert tfile.stat().st_mode & 0o777 == 0o640
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["testfile", "testlink"]
+
+
+def test_write_file_error(mocker: "MockerFixture", tmp_path: Path):
+    """
+    Test to verify that write_file removes its temporary file if the file can't be replaced.
+    """
+    # Arrange
+    tfile = tmp_path / "testfile"
+    tfile.write_text("old", encoding="UTF-8")
+    mocker.patch("os.replace", side_effect=OSError("replace failed"))
+
+    # Act
+    with pytest.raises(OSError):
+        filesystem_helpers.write_file(str(tfile), "new")
+
+    # Assert
+    assert tfile.read_text(encoding="UTF-8") == "old"
+    assert [path.name for path in tmp_path.iterdir()] == ["testfile"]
+
+
 @pytest.mark.skip("This calls a lot of os-specific stuff. Let's fix this test later.")
 def test_copyremotefile():
     """
@@ -0,0 +1,234 @@
+"""
+Tests that validate the functionality of the module that is responsible for running the background tasks.
+"""
+
+import logging
+import os
+import pathlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List
+
+import pytest
+from pytest_mock import MockerFixture
+
+from cobbler import enums
+from cobbler.api import CobblerAPI
+from cobbler.utils.event import CobblerEvent
+from cobbler.utils.thread import (
+    CobblerThread,
+    TaskExecutor,
+    fork_locks_held,
+    helper_thread_prefix,
+    register_fork_locks,
+)
+
+
+@pytest.fixture(name="create_task")
+def fixture_create_task(
+    mocker: MockerFixture, cobbler_api: CobblerAPI
+) -> Callable[[str, threading.Event, List[str]], CobblerThread]:
+    """
+    Returns a function that creates a task which records its start and then blocks until the given event is set.
+    """
+    remote = mocker.MagicMock()
+    remote.events = {}
+
+    def _create_task(
+        task_name: str, release: threading.Event, started: List[str]
+    ) -> CobblerThread:
+        event = CobblerEvent(name=task_name)
+        remote.events[event.event_id] = event
+
+        def runner(_: CobblerThread):
+            started.append(task_name)
+            release.wait(10)
+
+        return CobblerThread(event.event_id, remote, {}, task_name, cobbler_api, runner)
+
+    return _create_task
+
+
+def test_task_executor_limits(
+    cobbler_api: CobblerAPI,
+    create_task: Callable[[str, threading.Event, List[str]], CobblerThread],
+):
+    """
+    Test to verify that the limit of a task name keeps a task queued until it is cancelled while other tasks run.
+    """
+    # Arrange
+    cobbler_api.settings().background_tasks = {
+        "max_running": 2,
+        "limits": {"reposync": 1},
+    }
+    release = threading.Event()
+    started: List[str] = []
+    executor = TaskExecutor(cobbler_api)
+    first_reposync = create_task("reposync", release, started)
+    second_reposync = create_task("reposync", release, started)
+    sync = create_task("sync", release, started)
+
+    # Act
+    for task in (first_reposync, second_reposync, sync):
+        executor.submit(task)
+    status = executor.status()
+    result_cancel = executor.cancel(second_reposync.event_id)
+    result_cancel_running = executor.cancel(sync.event_id)
+    release.set()
+    first_reposync.join()
+    sync.join()
+
+    # Assert
+    assert status == {"tasks_queued": 1, "tasks_running": 2}
+    assert result_cancel
+    assert not result_cancel_running
+    assert second_reposync.remote.events[second_reposync.event_id].state == (
+        enums.EventStatus.CANCELLED
+    )
+    assert sync.remote.events[sync.event_id].state == enums.EventStatus.COMPLETE
+    assert sorted(started) == ["reposync", "sync"]
+    assert executor.status() == {"tasks_queued": 0, "tasks_running": 0}
+
+
+def test_task_executor_priorities(
+    cobbler_api: CobblerAPI,
+    create_task: Callable[[str, threading.Event, List[str]], CobblerThread],
+):
+    """
+    Test to verify that queued sync tasks are started before queued long running tasks.
+    """
+    # Arrange
+    cobbler_api.settings().background_tasks = {"max_running": 1, "limits": {}}
+    release_first = threading.Event()
+    release = threading.Event()
+    release.set()
+    started: List[str] = []
+    executor = TaskExecutor(cobbler_api)
+    first = create_task("hardlink", release_first, started)
+    reposync = create_task("reposync", release, started)
+    sync = create_task("sync", release, started)
+    executor.submit(first)
+    executor.submit(reposync)
+    executor.submit(sync)
+    queued_state = reposync.remote.events[reposync.event_id].state
+
+    # Act
+    release_first.set()
+    first.join()
+    sync.join(10)
+    reposync.join(10)
+
+    # Assert
+    assert queued_state == enums.EventStatus.QUEUED
+    assert started == ["hardlink", "sync", "reposync"]
+
+
+def test_task_executor_unwritable_task_log(
+    mocker: MockerFixture,
+    cobbler_api: CobblerAPI,
+    create_task: Callable[[str, threading.Event, List[str]], CobblerThread],
+):
+    """
+    Test to verify that a task whose log can't be opened fails and frees its slot for the queued tasks.
+    """
+    # Arrange
+    cobbler_api.settings().background_tasks = {"max_running": 1, "limits": {}}
+    release = threading.Event()
+    release.set()
+    started: List[str] = []
+    executor = TaskExecutor(cobbler_api)
+    broken = create_task("hardlink", release, started)
+    sync = create_task("sync", release, started)
+    original_file_handler = logging.FileHandler
+    opened: List[str] = []
+
+    def file_handler(filename: str, *args: Any, **kwargs: Any):
+        opened.append(filename)
+        if len(opened) == 1:
+            raise PermissionError("read-only")
+        return original_file_handler(filename, *args, **kwargs)
+
+    mocker.patch("logging.FileHandler", side_effect=file_handler)
+
+    # Act
+    executor.submit(broken)
+    broken.join(10)
+    executor.submit(sync)
+    sync.join(10)
+
+    # Assert
+    assert broken.remote.events[broken.event_id].state == enums.EventStatus.FAILED
+    assert started == ["sync"]
+    assert executor.status() == {"tasks_queued": 0, "tasks_running": 0}
+
+
+def test_task_log_helper_threads(
+    tmp_path: pathlib.Path,
+    mocker: MockerFixture,
+    cobbler_api: CobblerAPI,
+):
+    """
+    Test to verify that the records of helper threads named after the task end up in the task log.
+    """
+    # Arrange
+    remote = mocker.MagicMock()
+    remote.events = {}
+    event = CobblerEvent(name="sync")
+    remote.events[event.event_id] = event
+    log_file = tmp_path / "task.log"
+    original_file_handler = logging.FileHandler
+    mocker.patch(
+        "logging.FileHandler",
+        side_effect=lambda *args, **kwargs: original_file_handler(  # type: ignore
+            str(log_file), encoding="utf-8"
+        ),
+    )
+
+    def runner(_: CobblerThread):
+        with ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=helper_thread_prefix("helper")
+        ) as executor:
+            executor.submit(logging.getLogger().info, "record of helper").result()
+        other = threading.Thread(
+            target=logging.getLogger().info, args=("record of other",)
+        )
+        other.start()
+        other.join()
+
+    task = CobblerThread(event.event_id, remote, {}, "sync", cobbler_api, runner)
+
+    # Act
+    task.start()
+    task.join(10)
+
+    # Assert
+    content = log_file.read_text(encoding="utf-8")
+    assert "record of helper" in content
+    assert "record of other" not in content
+
+
+def test_fork_locks_held():
+    """
+    Test that the registered locks are taken from other threads before forking and are free in the child.
+    """
+    # Arrange
+    owner = logging.Filter()
+    lock = threading.Lock()
+    register_fork_locks(owner, lock)
+    lock.acquire()
+    releaser = threading.Timer(0.1, lock.release)
+    releaser.start()
+
+    # Act
+    with fork_locks_held():
+        held_while_forking = lock.locked()
+        pid = os.fork()
+        if pid == 0:
+            os._exit(1 if lock.locked() else 0)
+    _, status = os.waitpid(pid, 0)
+    releaser.join()
+
+    # Assert
+    assert held_while_forking
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert not lock.locked()
@@ -254,7 +254,7 @@ def test_blender(cobbler_api):  # type: ignore
     result = utils.blender(cobbler_api, False, root_item)  # type: ignore
 
     # Assert
-    assert len(result) == 171
+    assert len(result) == 176
     # Must be present because the settings have it
     assert "server" in result
     # Must be present because it is a field of distro
@@ -291,6 +291,68 @@ def test_blender_inherit(
     assert result.get("kernel_options") == {"test": "bar"}
 
 
+def test_blend_cache(
+    cobbler_api: CobblerAPI,
+    create_distro: Callable[[], Distro],
+    create_profile: Any,
+    create_system: Any,
+):
+    """
+    Test to verify that blending inside a blend cache reuses the consolidated parents and gives the same results.
+    """
+    # Arrange
+    test_distro = create_distro()
+    test_profile: Profile = create_profile(test_distro.uid)
+    test_system1: System = create_system(
+        profile_uid=test_profile.uid, name="test_system1"
+    )
+    test_system2: System = create_system(
+        profile_uid=test_profile.uid, name="test_system2"
+    )
+    expected_result1 = utils.blender(cobbler_api, False, test_system1)
+    expected_result2 = utils.blender(cobbler_api, False, test_system2)
+
+    # Act
+    with utils.blend_cache() as statistics:
+        result1 = utils.blender(cobbler_api, False, test_system1)
+        result2 = utils.blender(cobbler_api, False, test_system2)
+        result1_again = utils.blender(cobbler_api, False, test_system1)
+
+    # Assert
+    assert result1 == expected_result1
+    assert result2 == expected_result2
+    assert result1_again == expected_result1
+    assert statistics["blends"] == 3
+    # settings, distro and profile for the second system and all four nodes for the third blend
+    assert statistics["cached_nodes"] == 7
+    assert statistics["time"] > 0
+
+
+def test_blend_cache_invalidation(
+    cobbler_api: CobblerAPI,
+    create_distro: Callable[[], Distro],
+    create_profile: Any,
+):
+    """
+    Test to verify that a cached node is not reused after the node or one of its parents was modified.
+    """
+    # Arrange
+    test_distro = create_distro()
+    test_profile: Profile = create_profile(test_distro.uid)
+
+    # Act
+    with utils.blend_cache() as statistics:
+        utils.blender(cobbler_api, False, test_profile)
+        test_distro.arch = enums.Archs.PPC64LE
+        test_distro.mtime = test_distro.mtime + 1.0
+        result = utils.blender(cobbler_api, False, test_profile)
+
+    # Assert
+    # Only the settings are reused
+    assert statistics["cached_nodes"] == 1
+    assert result["arch"] == enums.Archs.PPC64LE.value
+
+
 @pytest.mark.parametrize(
     "testinput,expected_result,expected_exception",
     [
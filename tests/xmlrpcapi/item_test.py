@@ -4,6 +4,7 @@ generic items.
 """
 
 import pytest
+from pytest_mock import MockerFixture
 
 from cobbler.remote import CobblerXMLRPCInterface
 
@@ -30,6 +31,52 @@ def test_get_item_resolved(
     assert fk_kernel in distro.get("kernel")  # type: ignore
 
 
+@pytest.mark.usefixtures("create_testdistro", "create_testmenu", "create_testprofile")
+@pytest.mark.parametrize("with_sync", [True, False])
+def test_save_items_partial_failure(
+    remote: CobblerXMLRPCInterface,
+    token: str,
+    mocker: MockerFixture,
+    with_sync: bool,
+):
+    """
+    Test: save multiple systems with the bulk methods while the second system can't be persisted.
+    """
+    # Arrange
+    profile_uid = remote.get_profile_handle("testprofile0")
+    new_results = remote.new_items(
+        "system",
+        [
+            {"name": "testbulk0", "profile": profile_uid},
+            {"name": "testbulk1", "profile": profile_uid},
+        ],
+        token,
+    )
+    object_ids = [result["object_id"] for result in new_results]
+    collection = remote.api.systems()
+    original_add = collection.add
+
+    def failing_add(ref, *args, **kwargs):  # type: ignore
+        if ref.name == "testbulk1":  # type: ignore
+            raise OSError("disk full")
+        return original_add(ref, *args, **kwargs)  # type: ignore
+
+    mocker.patch.object(collection, "add", side_effect=failing_add)
+    spy = mocker.spy(remote.api.tftpgen, "make_pxe_menu")
+
+    # Act
+    save_results = remote.save_items(
+        "system", object_ids, True, with_sync, "new", token
+    )
+
+    # Assert
+    assert [result["success"] for result in save_results] == [True, False]
+    assert save_results[1]["error"] == "disk full"
+    assert list(remote.unsaved_items) == [object_ids[1]]
+    assert spy.call_count == (1 if with_sync else 0)
+    assert remote.get_item_handle("system", "testbulk0") == object_ids[0]
+
+
 def test_remove_item(remote: CobblerXMLRPCInterface, token: str):
     """
     Test: remove item object (in this case menu).
@@ -55,3 +102,55 @@ def test_create_unsaved_item(remote: CobblerXMLRPCInterface, token: str):
     remote.modify_menu(test_menu, ["name"], "testmenu0", token)
     remote.modify_menu(test_menu, ["display_name"], "testmenu", token)
     assert test_menu in remote.unsaved_items
+
+
+@pytest.mark.usefixtures("create_testdistro", "create_testmenu", "create_testprofile")
+def test_bulk_items(remote: CobblerXMLRPCInterface, token: str, mocker: MockerFixture):
+    """
+    Test: create, modify, save and remove multiple systems with the bulk methods.
+    """
+    # Arrange
+    profile_uid = remote.get_profile_handle("testprofile0")
+    spy = mocker.spy(remote.api.tftpgen, "make_pxe_menu")
+
+    # Act
+    new_results = remote.new_items(
+        "system",
+        [
+            {"name": "testbulk0", "profile": profile_uid},
+            {"name": "testbulk1", "profile": profile_uid},
+            {"name": "testbulk2", "profile": "fake_profile"},
+        ],
+        token,
+    )
+    object_ids = [result["object_id"] for result in new_results[:2]]
+    modify_results = remote.modify_items(
+        "system",
+        [[object_ids[0], "comment", "bulk"], [object_ids[1], ["comment"], "bulk"]],
+        token,
+    )
+    save_results = remote.save_items(
+        "system", object_ids + ["fake_id"], True, True, "new", token
+    )
+
+    # Assert
+    assert [result["success"] for result in new_results] == [True, True, False]
+    assert new_results[2]["error"] != ""
+    assert all(result["success"] for result in modify_results)
+    assert [result["success"] for result in save_results] == [True, True, False]
+    assert len(remote.unsaved_items) == 0
+    assert spy.call_count == 1
+    assert remote.get_system("testbulk0").get("comment") == "bulk"  # type: ignore
+    assert remote.get_system("testbulk1").get("comment") == "bulk"  # type: ignore
+
+    # Act
+    remove_results = remote.remove_items(
+        "system", ["testbulk0", "testbulk1", "fake_system"], token
+    )
+
+    # Assert
+    assert [result["success"] for result in remove_results] == [True, True, False]
+    assert remove_results[0]["object_id"] == object_ids[0]
+    assert spy.call_count == 2
+    assert remote.get_item_handle("system", "testbulk0") == "~"
+    assert remote.get_item_handle("system", "testbulk1") == "~"
@@ -138,6 +138,84 @@ def test_find_items_paged(
     assert result["pageinfo"]["pages"] == [1, 2]  # type: ignore
 
 
+@pytest.mark.parametrize(
+    "sort_field,page,expected_names",
+    [
+        ("name", 1, ["distro_sorted_a", "distro_sorted_b"]),
+        ("!name", 1, ["distro_sorted_c", "distro_sorted_b"]),
+        ("name", 2, ["distro_sorted_c"]),
+        ("arch", 1, ["distro_sorted_b", "distro_sorted_c"]),
+        ("!os_version", 2, ["distro_sorted_a"]),
+    ],
+)
+def test_find_items_paged_sorted(
+    remote: CobblerXMLRPCInterface,
+    create_distro: Callable[[str, str, str, str, str], str],
+    create_kernel_initrd: Callable[[str, str], str],
+    sort_field: str,
+    page: int,
+    expected_names: List[str],
+):
+    """
+    Test to verify that indexed and not indexed fields page in the same order and that only requested fields are
+    returned.
+    """
+    # Arrange
+    fk_kernel = "vmlinuz1"
+    fk_initrd = "initrd1.img"
+    folder = create_kernel_initrd(fk_kernel, fk_initrd)
+    path_kernel = os.path.join(folder, fk_kernel)
+    path_initrd = os.path.join(folder, fk_initrd)
+    for name, arch in (
+        ("distro_sorted_a", "x86_64"),
+        ("distro_sorted_b", "aarch64"),
+        ("distro_sorted_c", "ppc64le"),
+    ):
+        create_distro(name, arch, "suse", path_kernel, path_initrd)
+
+    # Act
+    result = remote.find_items_paged(
+        "distro",
+        {"name": "distro_sorted_*"},
+        sort_field,
+        page,
+        2,
+        fields=["name", "arch"],
+    )
+
+    # Assert
+    assert [x["name"] for x in result["items"]] == expected_names  # type: ignore
+    assert all(set(x.keys()) == {"name", "arch"} for x in result["items"])  # type: ignore
+    assert result["pageinfo"]["num_items"] == 3  # type: ignore
+
+
+def test_get_items_paged(
+    remote: CobblerXMLRPCInterface,
+    token: str,
+    create_distro: Callable[[str, str, str, str, str], str],
+    create_kernel_initrd: Callable[[str, str], str],
+):
+    """
+    Test to verify that the get_* methods return the requested page and fields only.
+    """
+    # Arrange
+    fk_kernel = "vmlinuz1"
+    fk_initrd = "initrd1.img"
+    folder = create_kernel_initrd(fk_kernel, fk_initrd)
+    path_kernel = os.path.join(folder, fk_kernel)
+    path_initrd = os.path.join(folder, fk_initrd)
+    for name in ("distro_get_items_1", "distro_get_items_2", "distro_get_items_3"):
+        create_distro(name, "x86_64", "suse", path_kernel, path_initrd)
+
+    # Act
+    result_all = remote.get_distros(token)
+    result_page = remote.get_distros(2, 2, token, ["name"])
+
+    # Assert
+    assert len(result_all) == 3
+    assert result_page == [{"name": "distro_get_items_3"}]
+
+
 @pytest.mark.skip(
     "This functionality was implemented very quickly. The test for this needs to be fixed at a "
     "later point!"
@@ -718,3 +796,74 @@ def test_save_distro_with_sync_false_forwarded(
         assert result is True
         _, kwargs = mock_add.call_args
         assert kwargs.get("with_sync") is False
+
+
+def test_get_changes(
+    remote: CobblerXMLRPCInterface,
+    token: str,
+    create_distro: Callable[[str, str, str, str, str], str],
+    create_kernel_initrd: Callable[[str, str], str],
+):
+    """
+    Test to verify that the change feed reports additions and deletions after a given revision.
+    """
+    # Arrange
+    fk_kernel = "vmlinuz1"
+    fk_initrd = "initrd1.img"
+    folder = create_kernel_initrd(fk_kernel, fk_initrd)
+    start = remote.get_changes(0, None, "", False, token)
+    distro_uid = create_distro(
+        "distro_get_changes",
+        "x86_64",
+        "suse",
+        os.path.join(folder, fk_kernel),
+        os.path.join(folder, fk_initrd),
+    )
+    remote.remove_distro("distro_get_changes", token)
+
+    # Act
+    result = remote.get_changes(start["revision"], ["distro"], start["epoch"], True)  # type: ignore
+    result_other_epoch = remote.get_changes(start["revision"], None, "other-epoch")  # type: ignore
+
+    # Assert
+    assert result["complete"] is True  # type: ignore
+    assert [(x["uid"], x["operation"]) for x in result["changes"]] == [  # type: ignore
+        (distro_uid, "add"),
+        (distro_uid, "delete"),
+    ]
+    assert all("item" not in x for x in result["changes"])  # type: ignore
+    assert result_other_epoch["complete"] is False  # type: ignore
+    assert result_other_epoch["changes"] == []  # type: ignore
+
+
+def test_get_item_hashes(
+    remote: CobblerXMLRPCInterface,
+    token: str,
+    create_distro: Callable[[str, str, str, str, str], str],
+    create_kernel_initrd: Callable[[str, str], str],
+):
+    """
+    Test to verify that the item hashes are only transferred if the digest differs and that the differing items can be
+    fetched by their uid.
+    """
+    # Arrange
+    fk_kernel = "vmlinuz1"
+    fk_initrd = "initrd1.img"
+    folder = create_kernel_initrd(fk_kernel, fk_initrd)
+    distro_uid = create_distro(
+        "distro_get_item_hashes",
+        "x86_64",
+        "suse",
+        os.path.join(folder, fk_kernel),
+        os.path.join(folder, fk_initrd),
+    )
+
+    # Act
+    summary = remote.get_item_hashes("distro", "", token)
+    summary_same_digest = remote.get_item_hashes("distro", summary["digest"], token)  # type: ignore
+    items = remote.get_items_by_uid("distro", [distro_uid, "missing"], token)
+
+    # Assert
+    assert list(summary["hashes"].keys()) == [distro_uid]  # type: ignore
+    assert summary_same_digest == {"digest": summary["digest"], "hashes": {}}  # type: ignore
+    assert [x["name"] for x in items] == ["distro_get_item_hashes"]
@@ -5,15 +5,26 @@ non object calls.
 
 import os
 import re
-from typing import Any, Callable, Dict, List, Union
+import time
+import xmlrpc.client
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple, Union
 
 import pytest
 
-from cobbler.remote import CobblerXMLRPCInterface
+from cobbler.remote import (
+    CobblerXMLRPCInterface,
+    KeepAliveRequestHandler,
+    PooledCobblerXMLRPCServer,
+    ProxiedXMLRPCInterface,
+)
+from cobbler.utils import get_shared_secret
 
 from tests.conftest import does_not_raise
 from tests.integration.conftest import WaitTaskEndType
 
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
 TEST_POWER_MANAGEMENT = True
 TEST_SYSTEM = ""
 
@@ -122,6 +133,60 @@ def test_generate_autoinstall(
     assert result != ""
 
 
+def test_generate_file(
+    create_kernel_initrd: Callable[[str, str], str],
+    create_distro: Callable[[str, str, str, str, str], str],
+    create_profile: Callable[[str, str, str], str],
+    create_autoinstall_template: Callable[[str, str], str],
+    remote: CobblerXMLRPCInterface,
+    token: str,
+):
+    """
+    Test: generate autoinstall content with validators and revalidate it
+    """
+    # Arrange
+    template_uid = create_autoinstall_template(
+        "generate-file-tests.sh", "${kernel_options}\n"
+    )
+    remote.modify_template(template_uid, ["tags"], ["kickstart"], token)
+    remote.save_template(template_uid, token=token)
+    fk_kernel = "vmlinuz1"
+    fk_initrd = "initrd1.img"
+    basepath = create_kernel_initrd(fk_kernel, fk_initrd)
+    distro_uid = create_distro(
+        "testdistro_generate_file",
+        "x86_64",
+        "suse",
+        os.path.join(basepath, fk_kernel),
+        os.path.join(basepath, fk_initrd),
+    )
+    profile_uid = create_profile("testprofile_generate_file", distro_uid, "a=1")
+    remote.modify_profile(profile_uid, ["autoinstall"], template_uid, token)
+    remote.save_profile(profile_uid, token=token)
+    arguments = {"obj_identifier": "testprofile_generate_file"}
+
+    # Act
+    first = remote.generate_file("autoinstall", arguments)
+    revalidated = remote.generate_file("autoinstall", arguments, first["etag"])
+    remote.modify_profile(profile_uid, ["kernel_options"], "a=2", token)
+    remote.save_profile(profile_uid, token=token)
+    changed = remote.generate_file("autoinstall", arguments, first["etag"])
+
+    # Assert
+    assert first["etag"] != ""
+    assert first["not_modified"] is False
+    assert "a=1" in first["content"]
+    assert revalidated["not_modified"] is True
+    assert revalidated["content"] == ""
+    assert revalidated["etag"] == first["etag"]
+    assert changed["not_modified"] is False
+    assert changed["etag"] != first["etag"]
+    assert "a=2" in changed["content"]
+    assert (
+        remote.generate_autoinstall("testprofile_generate_file") == changed["content"]
+    )
+
+
 def test_generate_ipxe(remote: CobblerXMLRPCInterface):
     """
     Test: generate iPXE file content
@@ -328,3 +393,99 @@ def test_get_item_resolved_value(
             assert profile_uid == result
         else:
             assert expected_result == result
+
+
+def test_get_xmlrpc_server_status(
+    start_xmlrpc_server: Callable[
+        [int], Tuple[ProxiedXMLRPCInterface, PooledCobblerXMLRPCServer]
+    ],
+):
+    """
+    Test: multiple calls over a single keep-alive connection to the worker pool server and its load metrics
+    """
+    # Arrange
+    xinterface, server = start_xmlrpc_server(2)
+    token = xinterface.proxied.login("", get_shared_secret())  # type: ignore
+    client = xmlrpc.client.ServerProxy(f"http://127.0.0.1:{server.server_address[1]}")
+    multicall = xmlrpc.client.MultiCall(client)
+    multicall.ping()
+    multicall.get_item_names("distro")
+
+    # Act
+    results = list(multicall())
+    status: Dict[str, Any] = client.get_xmlrpc_server_status(token)  # type: ignore
+    client("close")()  # type: ignore
+
+    # Assert
+    assert results == [True, []]
+    assert status["mode"] == "pool"
+    assert status["workers"] == 2
+    assert status["active_workers"] == 1
+    # Both requests were sent over the same connection, which is still open
+    assert status["handled_connections"] == 0
+    assert status["tokens"] == 1
+    assert status["unsaved_items"] == 0
+    assert status["queue_depth"] == 0
+    assert status["queue_size"] == 64
+
+
+def test_xmlrpc_server_idle_connections(
+    start_xmlrpc_server: Callable[
+        ..., Tuple[ProxiedXMLRPCInterface, PooledCobblerXMLRPCServer]
+    ],
+):
+    """
+    Test: idle keep-alive connections don't occupy the workers of the pool server
+    """
+    # Arrange
+    _, server = start_xmlrpc_server(2, keepalive_timeout=5)
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    idle_clients = [xmlrpc.client.ServerProxy(url) for _ in range(2)]
+    for idle_client in idle_clients:
+        idle_client.ping()
+    client = xmlrpc.client.ServerProxy(url)
+
+    # Act
+    start = time.monotonic()
+    result = client.ping()
+    duration = time.monotonic() - start
+    reused_results = [idle_client.ping() for idle_client in idle_clients]
+    status = server.status()
+    for proxy in idle_clients + [client]:
+        proxy("close")()  # type: ignore
+
+    # Assert
+    assert result is True
+    assert reused_results == [True, True]
+    assert duration < 1
+    assert status["max_wait_time"] < 1
+    assert status["idle_connections"] <= 3
+    assert status["handled_connections"] == 0
+
+
+def test_xmlrpc_server_idle_timeout(
+    mocker: "MockerFixture",
+    start_xmlrpc_server: Callable[
+        ..., Tuple[ProxiedXMLRPCInterface, PooledCobblerXMLRPCServer]
+    ],
+):
+    """
+    Test: the pool server closes keep-alive connections which stay idle for the keep-alive timeout without an error
+    """
+    # Arrange
+    spy_log_error = mocker.spy(KeepAliveRequestHandler, "log_error")
+    _, server = start_xmlrpc_server(1, keepalive_timeout=0.2)
+    client = xmlrpc.client.ServerProxy(f"http://127.0.0.1:{server.server_address[1]}")
+    client.ping()
+
+    # Act
+    time.sleep(0.6)
+    status = server.status()
+    result = client.ping()
+    client("close")()  # type: ignore
+
+    # Assert
+    assert status["idle_connections"] == 0
+    assert status["handled_connections"] == 1
+    assert result is True
+    spy_log_error.assert_not_called()